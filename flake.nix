@@ -29,13 +29,13 @@
             playwright
             weasyprint
             pypdf
-            beautifulsoup4
-            lxml
+            selectolax
             structlog
             orjson
             python-slugify
             httpx
             cryptography
+            uvloop
           ];
 
           python = pkgs.python3.withPackages pythonDeps;
@@ -225,8 +225,7 @@
             playwright
             weasyprint
             pypdf
-            beautifulsoup4
-            lxml
+            selectolax
             structlog
             orjson
             python-slugify
@@ -237,6 +236,7 @@
             pytest-cov
             pytest-asyncio
             pytest-playwright
+            pytest-xdist
             hatchling
           ]);
 
@@ -4,7 +4,10 @@ import os
 import re
 from pathlib import Path
 
-# Global singleton instance
+from flask import Flask, current_app, has_app_context
+
+# Fallback config for code running without any app (scripts, CLI helpers);
+# apps keep their own Config in app.extensions and never replace this
 _config_instance: "Config | None" = None
 
 
@@ -28,6 +31,19 @@ class Config:
         json_logging_env = os.environ.get("TWITTER_ARTICLENATOR_JSON_LOGGING", "true")
         self._json_logging = json_logging_env.lower() in ("true", "1", "yes")
 
+        # Debug screenshots of successful Twitter page loads
+        debug_screenshots_env = os.environ.get("TWITTER_ARTICLENATOR_DEBUG_SCREENSHOTS", "false")
+        self._debug_screenshots = debug_screenshots_env.lower() in ("true", "1", "yes")
+
+        # Maximum concurrent fetches per source (tweets share a few browser
+        # contexts; web articles are plain HTTP requests)
+        self._twitter_fetch_concurrency = int(
+            os.environ.get("TWITTER_ARTICLENATOR_TWITTER_FETCH_CONCURRENCY", "4")
+        )
+        self._web_fetch_concurrency = int(
+            os.environ.get("TWITTER_ARTICLENATOR_WEB_FETCH_CONCURRENCY", "32")
+        )
+
         # YouTube downloader settings
         self._youtube_downloader_bin = os.environ.get(
             "TWITTER_ARTICLENATOR_YOUTUBE_DOWNLOADER", "yt-dlp"
@@ -101,6 +117,21 @@ class Config:
         """Whether to use JSON logging format."""
         return self._json_logging
 
+    @property
+    def debug_screenshots(self) -> bool:
+        """Whether to save screenshots of successful Twitter page loads."""
+        return self._debug_screenshots
+
+    @property
+    def twitter_fetch_concurrency(self) -> int:
+        """Maximum tweet fetches running at once."""
+        return self._twitter_fetch_concurrency
+
+    @property
+    def web_fetch_concurrency(self) -> int:
+        """Maximum web article fetches running at once."""
+        return self._web_fetch_concurrency
+
     @property
     def youtube_downloader_bin(self) -> str:
         """Executable used for YouTube downloads."""
@@ -172,12 +203,37 @@ class Config:
         return self._youtube_liked_max_results
 
 
+def init_app(app: Flask) -> Config:
+    """Load configuration for a Flask app from the current environment.
+
+    The config is stored on ``app.extensions["config"]`` so everything running
+    in the app's context sees the settings it was created with. The global
+    fallback used without an app context is left untouched, so configuring
+    a second app never changes what the first one reads.
+
+    Args:
+        app: Flask application to configure.
+
+    Returns:
+        The newly loaded Config instance.
+    """
+    config = Config()
+    app.extensions["config"] = config
+    return config
+
+
 def get_config() -> Config:
-    """Get the global configuration instance.
+    """Get the active configuration instance.
 
     Returns:
-        The singleton Config instance.
+        The current app's Config inside an app context, otherwise the
+        global fallback instance (created on first use).
     """
+    if has_app_context():
+        config = current_app.extensions.get("config")
+        if config is not None:
+            return config
+
     global _config_instance
     if _config_instance is None:
         _config_instance = Config()
@@ -30,6 +30,14 @@ MAX_CONTENT_SIZE = 500_000_000  # 500MB
 # Keeps WeasyPrint memory usage bounded (~50-100MB per batch).
 PDF_BATCH_SIZE = 50
 
+# XML namespace-prefixed tags (e.g. <x:xmpmeta>) stripped before rendering
+NAMESPACED_TAG_PATTERN = re.compile(r"</?[a-zA-Z]+:[a-zA-Z]+[^>]*>")
+
+# Patterns used to build filename slugs from titles
+SLUG_WHITESPACE_PATTERN = re.compile(r"\s+")
+SLUG_INVALID_CHARS_PATTERN = re.compile(r"[^a-z0-9\-]")
+SLUG_REPEATED_HYPHENS_PATTERN = re.compile(r"-+")
+
 
 def _browser_url_fetcher(url, timeout=URL_FETCH_TIMEOUT, **kwargs):
     """URL fetcher with browser-like headers to avoid CDN blocks."""
@@ -235,7 +243,7 @@ def _sanitize_html(content: str) -> str:
     that cause cssselect2 AssertionError when it expects Clark notation.
     """
     # Remove namespace-prefixed tags and their content where possible
-    content = re.sub(r"</?[a-zA-Z]+:[a-zA-Z]+[^>]*>", "", content)
+    content = NAMESPACED_TAG_PATTERN.sub("", content)
     return content
 
 
@@ -612,13 +620,13 @@ def _slugify_title(title: str) -> str:
     slug = slug.lower()
 
     # Replace spaces with hyphens
-    slug = re.sub(r"\s+", "-", slug)
+    slug = SLUG_WHITESPACE_PATTERN.sub("-", slug)
 
     # Remove special characters (keep alphanumeric and hyphens)
-    slug = re.sub(r"[^a-z0-9\-]", "", slug)
+    slug = SLUG_INVALID_CHARS_PATTERN.sub("", slug)
 
     # Remove multiple consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = SLUG_REPEATED_HYPHENS_PATTERN.sub("-", slug)
 
     # Strip leading/trailing hyphens
     slug = slug.strip("-")
@@ -11,7 +11,17 @@ import zipfile
 from contextlib import nullcontext
 
 import structlog
-from flask import Blueprint, Response, current_app, jsonify, redirect, request, session, url_for
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    redirect,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
 from ..config import get_config, parse_cookie_input, validate_cookies
 from ..pdf.generator import generate_combined_pdf
 from ..security import is_valid_csrf_request
@@ -282,20 +292,32 @@ def _parse_youtube_download_payload() -> tuple[list[str], str, bool]:
     return [link.strip() for link in links if link and link.strip()], mode, raw_cookies_supplied
 
 
+def _start_app_thread(target, *args, name: str | None = None) -> threading.Thread:
+    """Start a daemon thread that runs ``target`` inside the current app context.
+
+    Background work then reads the serving app's config (output dir, limits)
+    instead of the process-wide fallback.
+    """
+    app = current_app._get_current_object()
+
+    def run() -> None:
+        with app.app_context():
+            target(*args)
+
+    thread = threading.Thread(target=run, daemon=True, name=name)
+    thread.start()
+    return thread
+
+
 def _start_youtube_download_job(*, links: list[str], mode: str) -> YouTubeDownloadJob:
     """Create and start a background YouTube download job."""
     job = YouTubeDownloadJob(links=links, mode=mode)
     with _youtube_download_jobs_lock:
         _youtube_download_jobs[job.job_id] = job
 
-    thread = threading.Thread(
-        target=_run_youtube_download_job,
-        args=(job,),
-        daemon=True,
-        name=f"youtube-download-{job.job_id[:8]}",
+    job.thread = _start_app_thread(
+        _run_youtube_download_job, job, name=f"youtube-download-{job.job_id[:8]}"
     )
-    job.thread = thread
-    thread.start()
     return job
 
 
@@ -507,7 +529,7 @@ def _youtube_download_stream_response(job: YouTubeDownloadJob, *, start_sequence
             )
             return
 
-    response = Response(generate(), mimetype="text/event-stream")
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
     response.headers["X-Accel-Buffering"] = "no"
     response.headers["Connection"] = "keep-alive"
@@ -718,6 +740,11 @@ def convert():
     if not links:
         return jsonify({"error": "No links provided"}), 400
 
+    # Drop repeated URLs (order preserved) so each one is fetched only once
+    original_count = len(links)
+    links = list(dict.fromkeys(links))
+    duplicates_removed = original_count - len(links)
+
     cookies = _get_cookies_from_request()
 
     # Validate URLs and find sources
@@ -752,7 +779,7 @@ def convert():
             400,
         )
 
-    log.info("convert_requested", link_count=len(links))
+    log.info("convert_requested", link_count=len(links), duplicates_removed=duplicates_removed)
 
     # Fetch all articles first
     articles = []
@@ -800,19 +827,20 @@ def convert():
         log.info("combined_pdf_generated", pdf=pdf_path.name, article_count=len(articles))
 
         total_count = len(articles) + len(errors)
-        return jsonify(
-            {
-                "success": True,
-                "filename": pdf_path.name,
-                "articles": results,
-                "errors": errors if errors else None,
-                "summary": {
-                    "total": total_count,
-                    "succeeded": len(articles),
-                    "failed": len(errors),
-                },
-            }
-        )
+        payload = {
+            "success": True,
+            "filename": pdf_path.name,
+            "articles": results,
+            "errors": errors if errors else None,
+            "summary": {
+                "total": total_count,
+                "succeeded": len(articles),
+                "failed": len(errors),
+            },
+        }
+        if duplicates_removed:
+            payload["duplicates_removed"] = duplicates_removed
+        return jsonify(payload)
     except Exception as e:
         log.error("pdf_generation_failed", error=str(e))
         return jsonify({"error": f"PDF generation failed: {str(e)}"}), 500
@@ -901,7 +929,6 @@ def convert_stream():
     """
     import queue as queue_module
     import random
-    import threading
 
     run_async = _get_run_async()
 
@@ -1022,7 +1049,7 @@ def convert_stream():
                             except Exception as exc:
                                 fetch_q.put(("err", exc))
 
-                        threading.Thread(target=_do_fetch, daemon=True).start()
+                        _start_app_thread(_do_fetch)
 
                         # Wait with hard timeout to kill stuck fetches
                         fetch_start = time.time()
@@ -1115,8 +1142,7 @@ def convert_stream():
                     except Exception as exc:
                         pdf_result_queue.put(("error", str(exc)))
 
-                pdf_thread = threading.Thread(target=_generate_pdf, daemon=True)
-                pdf_thread.start()
+                _start_app_thread(_generate_pdf)
 
                 # Send keepalive while waiting for PDF generation.
                 # No timeout — WeasyPrint fetches all remote images sequentially
@@ -1171,7 +1197,7 @@ def convert_stream():
             error_details = [{"url": e["url"], "error": e["error"]} for e in errors]
             yield f"data: {json_module.dumps({'type': 'error', 'error': 'All conversions failed', 'details': error_details})}\n\n"
 
-    response = Response(generate(), mimetype="text/event-stream")
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
     response.headers["X-Accel-Buffering"] = "no"
     response.headers["Connection"] = "keep-alive"
@@ -1189,7 +1215,6 @@ def bookmarks_fetch():
     which can exceed the run_async timeout for large bookmark lists).
     """
     import queue
-    import threading
 
     run_async = _get_run_async()
     cookies = _get_cookies_from_request()
@@ -1241,8 +1266,7 @@ def bookmarks_fetch():
         yield f"data: {json_module.dumps({'type': 'start'})}\n\n"
 
         # Start scraping in a background thread
-        thread = threading.Thread(target=_run_scrape, daemon=True)
-        thread.start()
+        _start_app_thread(_run_scrape)
 
         count = 0
         idle_seconds = 0
@@ -1272,7 +1296,7 @@ def bookmarks_fetch():
                 yield f"data: {json_module.dumps({'type': 'error', 'error': error_msg})}\n\n"
                 break
 
-    return Response(generate(), mimetype="text/event-stream")
+    return Response(stream_with_context(generate()), mimetype="text/event-stream")
 
 
 @api_bp.route("/bookmarks/convert", methods=["POST"])
@@ -1284,7 +1308,6 @@ def bookmarks_convert():
     """
     import queue as queue_module
     import random
-    import threading
 
     run_async = _get_run_async()
 
@@ -1373,7 +1396,7 @@ def bookmarks_convert():
                             except Exception as exc:
                                 fetch_q.put(("err", exc))
 
-                        threading.Thread(target=_do_fetch, daemon=True).start()
+                        _start_app_thread(_do_fetch)
 
                         fetch_start = time.time()
                         while True:
@@ -1455,8 +1478,7 @@ def bookmarks_convert():
                     except Exception as exc:
                         pdf_result_queue.put(("error", str(exc)))
 
-                pdf_thread = threading.Thread(target=_generate_pdf, daemon=True)
-                pdf_thread.start()
+                _start_app_thread(_generate_pdf)
 
                 while True:
                     try:
@@ -1507,7 +1529,7 @@ def bookmarks_convert():
             error_details = [{"url": e["url"], "error": e["error"]} for e in errors]
             yield f"data: {json_module.dumps({'type': 'error', 'error': 'All conversions failed', 'details': error_details})}\n\n"
 
-    response = Response(generate(), mimetype="text/event-stream")
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
     response.headers["X-Accel-Buffering"] = "no"
     response.headers["Connection"] = "keep-alive"
@@ -1659,7 +1681,7 @@ def videos_download():
         }
         yield f"data: {json_module.dumps(final_result)}\n\n"
 
-    response = Response(vid_generate(), mimetype="text/event-stream")
+    response = Response(stream_with_context(vid_generate()), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
     response.headers["X-Accel-Buffering"] = "no"
     response.headers["Connection"] = "keep-alive"
@@ -1987,7 +2009,6 @@ def resume_session(session_id):
     """
     import queue as queue_module
     import random
-    import threading
 
     config = get_config()
     session_dir = config.output_dir / "sessions" / session_id
@@ -2059,7 +2080,7 @@ def resume_session(session_id):
                             except Exception as exc:
                                 fetch_q.put(("err", exc))
 
-                        threading.Thread(target=_do_fetch, daemon=True).start()
+                        _start_app_thread(_do_fetch)
 
                         fetch_start = time.time()
                         while True:
@@ -2127,7 +2148,7 @@ def resume_session(session_id):
                     except Exception as exc:
                         pdf_result_queue.put(("error", str(exc)))
 
-                threading.Thread(target=_generate_pdf, daemon=True).start()
+                _start_app_thread(_generate_pdf)
 
                 while True:
                     try:
@@ -2171,7 +2192,7 @@ def resume_session(session_id):
             error_details = [{"url": e["url"], "error": e["error"]} for e in errors]
             yield f"data: {json_module.dumps({'type': 'error', 'error': 'All conversions failed', 'details': error_details})}\n\n"
 
-    response = Response(generate(), mimetype="text/event-stream")
+    response = Response(stream_with_context(generate()), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
     response.headers["X-Accel-Buffering"] = "no"
     response.headers["Connection"] = "keep-alive"
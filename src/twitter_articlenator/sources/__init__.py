@@ -1,5 +1,8 @@
 """Content sources registry."""
 
+import inspect
+from functools import lru_cache
+
 from .base import Article, ContentSource
 from .twitter_playwright import TwitterPlaywrightSource
 from .web import WebArticleSource
@@ -34,18 +37,18 @@ def get_source_for_url(url: str, **kwargs) -> ContentSource | None:
         ContentSource instance if a handler is found, None otherwise.
     """
     for source_cls in _SOURCES:
-        # Create instance to check if it can handle the URL
-        source = source_cls(
-            **{k: v for k, v in kwargs.items() if k in _get_init_params(source_cls)}
-        )
-        if source.can_handle(url):
-            return source
+        # can_handle is a classmethod, so only the matching source is constructed
+        if source_cls.can_handle(url):
+            init_params = _get_init_params(source_cls)
+            return source_cls(**{k: v for k, v in kwargs.items() if k in init_params})
     return None
 
 
-def _get_init_params(cls: type) -> set[str]:
-    """Get parameter names for a class's __init__ method."""
-    import inspect
+@lru_cache(maxsize=None)
+def _get_init_params(cls: type) -> frozenset[str]:
+    """Get parameter names for a class's __init__ method.
 
+    Cached per class, since signatures don't change at runtime.
+    """
     sig = inspect.signature(cls.__init__)
-    return {p.name for p in sig.parameters.values() if p.name != "self"}
+    return frozenset(p.name for p in sig.parameters.values() if p.name != "self")
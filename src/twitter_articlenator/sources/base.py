@@ -28,9 +28,13 @@ class ContentSource(Protocol):
     The @runtime_checkable decorator allows isinstance() checks.
     """
 
-    def can_handle(self, url: str) -> bool:
+    @classmethod
+    def can_handle(cls, url: str) -> bool:
         """Check if this source can handle the given URL.
 
+        Declared as a classmethod so the registry can classify URLs
+        without constructing a source instance.
+
         Args:
             url: The URL to check.
 
@@ -9,26 +9,47 @@ from __future__ import annotations
 
 import asyncio
 import re
-from collections.abc import Callable
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 
 import structlog
 from playwright.async_api._generated import SetCookieParam
 
-from .browser_pool import get_browser_pool
+from .browser_pool import get_browser_pool, parse_cookie_string
 
 log = structlog.get_logger()
 
-# Delay between scrolls (seconds) — fast enough to paginate 500+ bookmarks
+# Maximum wait after each scroll (seconds) for the next bookmarks page to be
+# intercepted; the loop moves on as soon as one arrives.
 SCROLL_DELAY = 1.5
 
+# Viewport heights to scroll per step. The timeline is virtualized and only
+# requests the next page near the bottom, so bigger steps reach it sooner.
+SCROLL_VIEWPORTS = 3
+
 # Consecutive scrolls with no new bookmarks before stopping.
 # Generous to handle Twitter's lazy-loading gaps.
 MAX_EMPTY_SCROLLS = 15
 
+# Finds and clicks the cookie-consent "Accept all" button in-page, so the
+# check costs one round-trip instead of one per button on the page.
+DISMISS_CONSENT_SCRIPT = """() => {
+    for (const btn of document.querySelectorAll('button')) {
+        const text = btn.textContent || '';
+        if (text.includes('Accept all') || text.includes('Accept All')) {
+            btn.click();
+            return true;
+        }
+    }
+    return false;
+}"""
+
 
-@dataclass
+@dataclass(slots=True)
 class BookmarkEntry:
     """A single bookmarked tweet with extracted metadata."""
 
@@ -67,43 +88,20 @@ class BookmarkScraper:
 
     MAX_PREVIEW_LENGTH = 200
 
-    # Internal Twitter/X URLs to ignore (not external articles)
-    IGNORE_URL_PATTERNS = re.compile(
-        r"https?://(?:www\.)?(?:twitter\.com|x\.com)/",
-    )
-
-    # Pattern matching X Article URLs (native long-form articles on X)
-    X_ARTICLE_URL_PATTERN = re.compile(
-        r"https?://(?:www\.)?(?:twitter\.com|x\.com)/\w+/article/",
+    # Classifies Twitter/X links in one match: the x_article group is set for
+    # native long-form X Articles, any other match is an internal link to
+    # ignore, and no match means an external article URL.
+    LINK_PATTERN = re.compile(
+        r"https?://(?:www\.)?(?:twitter\.com|x\.com)/(?P<x_article>\w+/article/)?",
     )
 
     def __init__(self, cookies: str) -> None:
         self._cookies_str = cookies
 
-    def _parse_cookies(self) -> list[SetCookieParam]:
-        """Parse cookie string into Playwright cookie format."""
-        cookies: list[SetCookieParam] = []
-        for part in self._cookies_str.split(";"):
-            part = part.strip()
-            if "=" in part:
-                name, value = part.split("=", 1)
-                cookies.append(
-                    SetCookieParam(
-                        name=name.strip(),
-                        value=value.strip(),
-                        domain=".x.com",
-                        path="/",
-                    )
-                )
-                cookies.append(
-                    SetCookieParam(
-                        name=name.strip(),
-                        value=value.strip(),
-                        domain=".twitter.com",
-                        path="/",
-                    )
-                )
-        return cookies
+    @cached_property
+    def _cookies(self) -> list[SetCookieParam]:
+        """Cookie string parsed into Playwright cookie format (parsed once)."""
+        return parse_cookie_string(self._cookies_str)
 
     async def scrape(
         self,
@@ -117,45 +115,57 @@ class BookmarkScraper:
         """
         log.info("bookmark_scrape_starting")
 
-        pool = get_browser_pool()
-        cookies = self._parse_cookies()
+        async with self.open() as session:
+            if session.empty:
+                return []
+            bookmarks = await session.collect(on_bookmark)
 
-        async with pool.get_context(cookies=cookies) as context:
-            page = await context.new_page()
+        log.info("bookmark_scrape_complete", total=len(bookmarks))
+        return bookmarks
 
-            # Collect entries intercepted from GraphQL API responses
-            intercepted: list[BookmarkEntry] = []
+    async def stream(self) -> AsyncIterator[BookmarkEntry]:
+        """Yield bookmarks from x.com/i/bookmarks as they are intercepted.
 
-            async def on_response(response):
-                try:
-                    url = response.url
-                    if "/graphql/" not in url or "Bookmark" not in url:
-                        return
-                    if response.status != 200:
-                        return
-                    body = await response.json()
-                    entries = self._parse_graphql_response(body)
-                    if entries:
-                        intercepted.extend(entries)
-                        log.info(
-                            "bookmark_api_intercepted",
-                            count=len(entries),
-                            total=len(intercepted),
-                        )
-                except Exception as e:
-                    log.debug("bookmark_response_handler_error", error=str(e))
+        Unlike scrape(), entries are not buffered, so callers can start
+        processing while the page is still being scrolled.
+
+        Yields:
+            Each BookmarkEntry as soon as its API page arrives.
+        """
+        async with self.open() as session:
+            if session.empty:
+                return
+            async for entry in session.stream():
+                yield entry
+
+    @asynccontextmanager
+    async def open(self) -> AsyncIterator[BookmarkSession]:
+        """Open a logged-in bookmarks page that stays alive across scrapes.
+
+        Pays the home-feed bootstrap and bookmarks navigation once; use
+        BookmarkSession.incremental_scrape to poll for new bookmarks
+        without navigating again.
+
+        Yields:
+            A BookmarkSession on the loaded bookmarks page.
+
+        Raises:
+            ValueError: If authentication fails or the page does not load.
+        """
+        pool = get_browser_pool()
 
-            page.on("response", on_response)
+        # Bookmarks come from intercepted API data, so skip images/media/fonts
+        async with pool.get_context(cookies=self._cookies, block_resources=True) as context:
+            page = await context.new_page()
+            session = BookmarkSession(self, page)
 
             # Establish session by visiting home first
             await page.goto("https://x.com/home", wait_until="domcontentloaded", timeout=60000)
-            await asyncio.sleep(3)
-
-            await self._dismiss_consent_banner(page)
 
-            # Verify authentication — fail fast if cookies are expired
+            # Verify authentication — fail fast if cookies are expired. The
+            # selector wait doubles as the "page has rendered" signal.
             try:
-                await page.wait_for_selector('[data-testid="tweet"]', timeout=15000)
+                await page.wait_for_selector('[data-testid="tweet"]', timeout=18000)
                 log.info("bookmark_scrape_authenticated")
             except Exception:
                 page_url = page.url
@@ -175,102 +185,85 @@ class BookmarkScraper:
                     "Please check your cookies and try again."
                 )
 
+            await self._dismiss_consent_banner(page)
+
             # Navigate to bookmarks (triggers first GraphQL Bookmarks call)
             await page.goto(
                 "https://x.com/i/bookmarks",
                 wait_until="domcontentloaded",
                 timeout=60000,
             )
-            await asyncio.sleep(5)
-
-            await self._dismiss_consent_banner(page)
 
             # Wait for bookmarks page to load
             try:
-                await page.wait_for_selector('[data-testid="tweet"]', timeout=30000)
+                await page.wait_for_selector('[data-testid="tweet"]', timeout=35000)
             except Exception:
-                page_text = await page.inner_text("body")
-                if "haven't added any" in page_text or "Save posts for later" in page_text:
+                if await self._is_empty_bookmarks_page(page):
                     log.info("bookmark_scrape_empty")
-                    return []
+                    session.empty = True
+                else:
+                    try:
+                        await page.screenshot(path="/tmp/bookmark_debug.png")
+                        log.error(
+                            "bookmark_page_load_failed",
+                            page_url=page.url,
+                            page_title=await page.title(),
+                        )
+                    except Exception:
+                        pass
 
-                try:
-                    await page.screenshot(path="/tmp/bookmark_debug.png")
-                    log.error(
-                        "bookmark_page_load_failed",
-                        page_url=page.url,
-                        page_title=await page.title(),
+                    raise ValueError(
+                        f"Bookmarks page failed to load (url={page.url}). "
+                        "Check your cookies or try again."
                     )
-                except Exception:
-                    pass
 
-                raise ValueError(
-                    f"Bookmarks page failed to load (url={page.url}). "
-                    "Check your cookies or try again."
-                )
+            if not session.empty:
+                log.info("bookmark_scrape_page_loaded")
+                await self._dismiss_consent_banner(page)
 
-            log.info("bookmark_scrape_page_loaded")
-
-            # Give time for the initial API response handler to complete
-            await asyncio.sleep(2)
-
-            # Scroll and collect from intercepted API responses
-            bookmarks: list[BookmarkEntry] = []
-            seen_ids: set[str] = set()
-            empty_scroll_count = 0
-            last_intercepted_len = 0
-
-            while empty_scroll_count < MAX_EMPTY_SCROLLS:
-                # Process new entries from API interception
-                current_len = len(intercepted)
-                new_entries = intercepted[last_intercepted_len:current_len]
-                last_intercepted_len = current_len
-
-                new_count = 0
-                for entry in new_entries:
-                    if entry.tweet_id not in seen_ids:
-                        seen_ids.add(entry.tweet_id)
-                        bookmarks.append(entry)
-                        new_count += 1
-                        if on_bookmark:
-                            on_bookmark(entry, len(bookmarks))
-
-                if new_count > 0:
-                    empty_scroll_count = 0
-                    log.info(
-                        "bookmark_scrape_progress",
-                        total=len(bookmarks),
-                        new=new_count,
-                    )
-                else:
-                    empty_scroll_count += 1
-                    log.debug(
-                        "bookmark_scrape_no_new",
-                        empty_scrolls=empty_scroll_count,
-                    )
+                # Give time for the initial API response handler to complete
+                await asyncio.sleep(2)
+
+            yield session
+
+    @classmethod
+    async def scrape_many(cls, cookies_list: list[str]) -> list[list[BookmarkEntry]]:
+        """Scrape bookmarks for several accounts concurrently.
+
+        Runs at most one scrape per pooled browser at a time.
+
+        Args:
+            cookies_list: Cookie strings, one per account.
 
-                # Scroll 2x viewport height for faster pagination
-                await page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-                await asyncio.sleep(SCROLL_DELAY)
+        Returns:
+            Bookmark lists in the same order as cookies_list.
+        """
+        sem = asyncio.Semaphore(get_browser_pool().max_browsers)
+
+        async def scrape_one(cookies: str) -> list[BookmarkEntry]:
+            async with sem:
+                return await cls(cookies).scrape()
+
+        return list(await asyncio.gather(*(scrape_one(c) for c in cookies_list)))
 
-            log.info("bookmark_scrape_complete", total=len(bookmarks))
-            return bookmarks
+    @staticmethod
+    async def _is_empty_bookmarks_page(page) -> bool:
+        """Check whether the bookmarks page is showing its empty state."""
+        # Attribute lookup is cheap; only read the page text if X renders
+        # the empty state without its test id
+        if await page.query_selector('[data-testid="emptyState"]'):
+            return True
+        # textContent needs no layout pass, unlike inner_text
+        page_text = await page.text_content("body") or ""
+        return "haven't added any" in page_text or "Save posts for later" in page_text
 
     @staticmethod
     async def _dismiss_consent_banner(page) -> None:
         """Dismiss the X/Twitter cookie-consent banner if present."""
         try:
-            buttons = await page.query_selector_all("button")
-            for btn in buttons:
-                try:
-                    text = await btn.inner_text()
-                    if "Accept all" in text or "Accept All" in text:
-                        await btn.click()
-                        log.info("bookmark_consent_banner_dismissed")
-                        await asyncio.sleep(1)
-                        return
-                except Exception:
-                    continue
+            if await page.evaluate(DISMISS_CONSENT_SCRIPT):
+                log.info("bookmark_consent_banner_dismissed")
+                await asyncio.sleep(1)
         except Exception as exc:
             log.debug("bookmark_consent_banner_check_failed", error=str(exc))
 
@@ -284,13 +277,13 @@ class BookmarkScraper:
             expanded = url_entity.get("expanded_url", "")
             if not expanded:
                 continue
-            if self.X_ARTICLE_URL_PATTERN.match(expanded):
+            match = self.LINK_PATTERN.match(expanded)
+            if match:
+                if not match.group("x_article"):
+                    continue  # Internal Twitter/X link
                 is_article = True
-                if expanded not in article_urls:
-                    article_urls.append(expanded)
-            elif not self.IGNORE_URL_PATTERNS.match(expanded):
-                if expanded not in article_urls:
-                    article_urls.append(expanded)
+            if expanded not in article_urls:
+                article_urls.append(expanded)
         return is_article
 
     def _parse_graphql_response(self, data: dict) -> list[BookmarkEntry]:
@@ -448,3 +441,164 @@ class BookmarkScraper:
         except Exception as e:
             log.warning("bookmark_tweet_parse_failed", error=str(e))
             return None
+
+
+class BookmarkSession:
+    """A loaded bookmarks page whose GraphQL responses are being intercepted.
+
+    Created by BookmarkScraper.open(). Intercepted entries are buffered only
+    until they are handed out, so each stream/collect/incremental_scrape
+    call reports just what it newly found.
+    """
+
+    def __init__(self, scraper: BookmarkScraper, page) -> None:
+        self._scraper = scraper
+        self._page = page
+        # True when the bookmarks page loaded with nothing bookmarked
+        self.empty = False
+
+        # Entries intercepted from GraphQL API responses but not yet handed
+        # out. Pages can overlap, so duplicates are dropped here once.
+        self._pending: deque[BookmarkEntry] = deque()
+        self._seen_ids: set[str] = set()
+        # Entries handed out so far, for 1-based progress indexes
+        self._delivered = 0
+        # Set whenever a response adds entries, so scrolling can wait on
+        # the data instead of a fixed delay
+        self._new_data = asyncio.Event()
+        # IDs known before the current incremental scrape, and whether a
+        # response has reached them (bookmarks are newest-first)
+        self._known_ids: frozenset[str] = frozenset()
+        self._reached_known = False
+
+        page.on("response", self._on_response)
+
+    async def _on_response(self, response) -> None:
+        """Record bookmark entries from intercepted GraphQL responses."""
+        try:
+            url = response.url
+            if "/graphql/" not in url or "Bookmark" not in url:
+                return
+            if response.status != 200:
+                return
+            body = await response.json()
+            entries = []
+            for entry in self._scraper._parse_graphql_response(body):
+                if entry.tweet_id in self._known_ids:
+                    self._reached_known = True
+                if entry.tweet_id not in self._seen_ids:
+                    self._seen_ids.add(entry.tweet_id)
+                    entries.append(entry)
+            if entries:
+                self._pending.extend(entries)
+                self._new_data.set()
+                log.info(
+                    "bookmark_api_intercepted",
+                    count=len(entries),
+                    total=len(self._seen_ids),
+                )
+        except Exception as e:
+            log.debug("bookmark_response_handler_error", error=str(e))
+
+    async def stream(self, stop_at_known: bool = False) -> AsyncIterator[BookmarkEntry]:
+        """Scroll the page, yielding bookmarks as each scroll loads them.
+
+        Stops once pagination runs dry.
+
+        Args:
+            stop_at_known: Stop as soon as a response reaches bookmarks that
+                were already collected before the current incremental scrape.
+
+        Yields:
+            Each newly intercepted BookmarkEntry.
+        """
+        page = self._page
+        pending = self._pending
+        empty_scroll_count = 0
+
+        while empty_scroll_count < MAX_EMPTY_SCROLLS:
+            # Take only what has arrived so far; responses landing while the
+            # caller consumes this batch are picked up on the next pass
+            batch = [pending.popleft() for _ in range(len(pending))]
+
+            if batch:
+                self._delivered += len(batch)
+                empty_scroll_count = 0
+                log.info(
+                    "bookmark_scrape_progress",
+                    total=self._delivered,
+                    new=len(batch),
+                )
+                for entry in batch:
+                    yield entry
+            else:
+                empty_scroll_count += 1
+                log.debug(
+                    "bookmark_scrape_no_new",
+                    empty_scrolls=empty_scroll_count,
+                )
+
+            if stop_at_known and self._reached_known:
+                break
+
+            # Scroll several viewports for faster pagination, then wait
+            # for the next page of results (or SCROLL_DELAY at most)
+            self._new_data.clear()
+            await page.evaluate("n => window.scrollBy(0, window.innerHeight * n)", SCROLL_VIEWPORTS)
+            try:
+                await asyncio.wait_for(self._new_data.wait(), timeout=SCROLL_DELAY)
+            except TimeoutError:
+                pass
+
+    async def collect(
+        self,
+        on_bookmark: Callable[[BookmarkEntry, int], None] | None = None,
+        stop_at_known: bool = False,
+    ) -> list[BookmarkEntry]:
+        """Scroll the page and collect bookmarks until pagination runs dry.
+
+        Args:
+            on_bookmark: Called with each new entry and its 1-based index.
+            stop_at_known: Stop as soon as a response reaches bookmarks that
+                were already collected before the current incremental scrape.
+
+        Returns:
+            Entries collected during this call.
+        """
+        first = self._delivered
+        entries: list[BookmarkEntry] = []
+        async for entry in self.stream(stop_at_known):
+            entries.append(entry)
+            if on_bookmark:
+                on_bookmark(entry, first + len(entries))
+        return entries
+
+    async def incremental_scrape(
+        self,
+        on_bookmark: Callable[[BookmarkEntry, int], None] | None = None,
+    ) -> list[BookmarkEntry]:
+        """Collect bookmarks added since the previous scrape on this page.
+
+        Reloads the bookmarks page in place (no home-feed bootstrap) and
+        stops once the newest-first feed reaches already-known bookmarks.
+
+        Args:
+            on_bookmark: Called with each new entry and its 1-based index.
+
+        Returns:
+            Newly bookmarked entries.
+        """
+        self._known_ids = frozenset(self._seen_ids)
+        self._reached_known = False
+
+        await self._page.reload(wait_until="domcontentloaded", timeout=60000)
+        await self._scraper._dismiss_consent_banner(self._page)
+        try:
+            await self._page.wait_for_selector('[data-testid="tweet"]', timeout=30000)
+        except Exception:
+            log.info("bookmark_incremental_no_tweets")
+            return []
+
+        new_entries = await self.collect(on_bookmark, stop_at_known=True)
+        log.info("bookmark_incremental_complete", new=len(new_entries))
+        return new_entries
@@ -1,12 +1,15 @@
 """Browser pool for efficient Playwright browser management."""
 
 import asyncio
+import hashlib
 import random
+import weakref
+from collections.abc import Collection
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 import structlog
-from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
 from playwright.async_api._generated import SetCookieParam
 
 log = structlog.get_logger()
@@ -95,6 +98,149 @@ Object.defineProperty(screen, 'availWidth', { get: () => window.innerWidth });
 Object.defineProperty(screen, 'availHeight', { get: () => window.innerHeight });
 """
 
+# Chromium flags: stealth and container basics, plus no GPU process, no
+# throttling of background pages (we scroll pages nobody is looking at) and a
+# single renderer per site rather than per cross-origin frame. --single-process
+# and --no-zygote are left out as they make crashes take the whole browser down.
+CHROMIUM_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI,IsolateOrigins,site-per-process",
+]
+
+# Resource types aborted for contexts that never look at rendered media
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Third-party telemetry hosts aborted whatever the resource type
+BLOCKED_URL_PARTS = ("googletagmanager", "google-analytics", "doubleclick")
+
+
+# Pages allowed open at once in one shared, cookie-keyed context
+SHARED_CONTEXT_PAGES = 4
+
+# Domain cookies are set on; every request goes to x.com, so a twitter.com
+# copy of each cookie would only double the jar Playwright serializes
+COOKIE_DOMAIN = ".x.com"
+
+
+def parse_cookie_string(cookies: str | None) -> list[SetCookieParam]:
+    """Parse a "name=value; name=value" cookie string into Playwright cookies.
+
+    Args:
+        cookies: Cookie header string, or None.
+
+    Returns:
+        List of cookie dicts set on COOKIE_DOMAIN.
+    """
+    parsed: list[SetCookieParam] = []
+    for part in (cookies or "").split(";"):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        value = value.strip()
+        # Skip fragments like a trailing ";" that Playwright would reject
+        if name and value:
+            parsed.append(SetCookieParam(name=name, value=value, domain=COOKIE_DOMAIN, path="/"))
+    return parsed
+
+
+async def _abort_blocked_resources(route) -> None:
+    """Abort blocked resource types and telemetry, letting everything else through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _SharedContext:
+    """A context shared by concurrent callers, with its browser and page slots."""
+
+    __slots__ = ("browser", "context", "pages", "users")
+
+    def __init__(self, browser: Browser, context: BrowserContext) -> None:
+        self.browser = browser
+        self.context = context
+        self.pages = asyncio.Semaphore(SHARED_CONTEXT_PAGES)
+        self.users = 0
+
+
+class PagePool:
+    """Pages kept open in one context for reuse by later callers.
+
+    A page released cleanly is navigated to about:blank and kept, up to
+    size, instead of being closed; the next acquire reuses it rather than
+    paying for context.new_page().
+    """
+
+    def __init__(self, context: BrowserContext, size: int = SHARED_CONTEXT_PAGES) -> None:
+        """Initialize the page pool.
+
+        Args:
+            context: The context pages are opened in.
+            size: Maximum number of idle pages to keep.
+        """
+        self._context = context
+        self._size = size
+        self._free: list[Page] = []
+
+    @property
+    def free_pages(self) -> tuple[Page, ...]:
+        """Idle pages currently held for reuse."""
+        return tuple(self._free)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """Get an idle page from the pool, or open a new one.
+
+        Callers must remove any listeners they add before leaving the block.
+
+        Yields:
+            A Page in the pool's context.
+        """
+        page = None
+        while self._free and page is None:
+            candidate = self._free.pop()
+            if not candidate.is_closed():
+                page = candidate
+        if page is None:
+            page = await self._context.new_page()
+        else:
+            log.debug("browser_page_reused")
+
+        reusable = False
+        try:
+            yield page
+            reusable = True
+        finally:
+            if reusable and len(self._free) < self._size and await self._reset_page(page):
+                self._free.append(page)
+            else:
+                await page.close()
+
+    @staticmethod
+    async def _reset_page(page: Page) -> bool:
+        """Navigate a page to about:blank so it holds no state from its last use.
+
+        Args:
+            page: The page to reset.
+
+        Returns:
+            True if the page is blank and safe to reuse.
+        """
+        try:
+            await page.goto("about:blank")
+        except Exception as e:
+            log.debug("browser_page_reset_failed", error=str(e))
+            return False
+        return True
+
 
 class BrowserPool:
     """Manages a pool of reusable browser instances.
@@ -115,6 +261,26 @@ class BrowserPool:
         self._browser_count = 0
         self._lock = asyncio.Lock()
         self._initialized = False
+        # One warm context per idle browser with the cookie digest it was used
+        # with; only a caller with the same cookie set reuses it
+        self._idle_contexts: dict[Browser, tuple[bytes, BrowserContext]] = {}
+        # Contexts in use by concurrent callers with the same cookies, keyed
+        # by cookie digest
+        self._shared_contexts: dict[bytes, _SharedContext] = {}
+        # Serializes opening a shared context per key, so a caller waiting on
+        # a browser for one cookie set never blocks callers of another
+        self._shared_locks: weakref.WeakValueDictionary[bytes, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        # Reusable pages for each live context
+        self._page_pools: weakref.WeakKeyDictionary[BrowserContext, PagePool] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def max_browsers(self) -> int:
+        """Maximum number of browsers the pool will run at once."""
+        return self._max_browsers
 
     async def _ensure_initialized(self) -> None:
         """Ensure Playwright is started."""
@@ -130,22 +296,37 @@ class BrowserPool:
             log.info("browser_pool_initialized", max_browsers=self._max_browsers)
 
     async def _create_browser(self) -> Browser:
-        """Create a new browser instance with stealth settings."""
+        """Create a new browser instance with stealth settings.
+
+        The caller must already have reserved a slot in _browser_count; the
+        reservation is returned if the launch fails.
+        """
         await self._ensure_initialized()
         assert self._playwright is not None
 
-        browser = await self._playwright.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-                "--no-sandbox",
-            ],
-        )
-        self._browser_count += 1
+        try:
+            browser = await self._playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        except Exception:
+            self._browser_count -= 1
+            raise
         log.info("browser_created", total_browsers=self._browser_count)
         return browser
 
+    async def _reserve_slot(self) -> bool:
+        """Claim a browser slot if the pool is under its limit.
+
+        The check and the increment happen in one critical section, so
+        concurrent acquires can never launch more than max_browsers.
+
+        Returns:
+            True if a slot was reserved and the caller should launch a browser.
+        """
+        async with self._lock:
+            if self._browser_count < self._max_browsers:
+                self._browser_count += 1
+                return True
+            return False
+
     async def acquire(self) -> Browser:
         """Acquire a browser from the pool.
 
@@ -163,26 +344,26 @@ class BrowserPool:
             if browser.is_connected():
                 log.debug("browser_acquired_from_pool")
                 return browser
-            else:
-                log.warning("browser_disconnected_creating_new")
-                self._browser_count -= 1
+            log.warning("browser_disconnected_creating_new")
+            self._idle_contexts.pop(browser, None)
+            self._browser_count -= 1
         except asyncio.QueueEmpty:
             pass
 
-        # Create new browser if pool is empty and under limit
-        async with self._lock:
-            if self._browser_count < self._max_browsers:
+        while True:
+            # Create new browser if pool is empty and under limit
+            if await self._reserve_slot():
                 return await self._create_browser()
 
-        # Pool is at capacity, wait for one to be released
-        log.debug("waiting_for_browser")
-        browser = await self._browsers.get()
-        if browser.is_connected():
-            return browser
+            # Pool is at capacity, wait for one to be released
+            log.debug("waiting_for_browser")
+            browser = await self._browsers.get()
+            if browser.is_connected():
+                return browser
 
-        # Browser disconnected, create new one
-        self._browser_count -= 1
-        return await self._create_browser()
+            # Browser disconnected; free its slot and compete for it again
+            self._idle_contexts.pop(browser, None)
+            self._browser_count -= 1
 
     async def release(self, browser: Browser) -> None:
         """Release a browser back to the pool.
@@ -192,6 +373,7 @@ class BrowserPool:
         """
         if not browser.is_connected():
             log.warning("releasing_disconnected_browser")
+            self._idle_contexts.pop(browser, None)
             self._browser_count -= 1
             return
 
@@ -200,29 +382,164 @@ class BrowserPool:
             log.debug("browser_released_to_pool")
         except asyncio.QueueFull:
             # Pool is full, close this browser
+            self._idle_contexts.pop(browser, None)
             await browser.close()
             self._browser_count -= 1
             log.debug("browser_closed_pool_full")
 
     @asynccontextmanager
     async def get_context(
-        self, cookies: list[SetCookieParam] | None = None
+        self,
+        cookies: list[SetCookieParam] | None = None,
+        block_resources: bool = False,
     ) -> AsyncIterator[BrowserContext]:
         """Get a browser context from the pool.
 
-        This is a context manager that acquires a browser, creates a context,
-        and properly releases the browser when done.
+        This is a context manager that acquires a browser, reuses its warm
+        context (or creates one), and properly releases the browser when done.
+        A context that exits cleanly is reset and kept for the next caller.
 
         Args:
             cookies: Optional list of cookies to add to the context.
+            block_resources: Abort image, media, font and telemetry requests. Only for
+                callers that read data rather than rendered content.
 
         Yields:
             A BrowserContext with stealth settings applied.
         """
         browser = await self.acquire()
         context = None
+        reusable = False
 
         try:
+            context = await self._open_context(browser, cookies, block_resources)
+            yield context
+            reusable = True
+
+        finally:
+            await self._retire_context(browser, context, cookies, reusable)
+
+    @asynccontextmanager
+    async def get_shared_context(
+        self,
+        cookies: list[SetCookieParam] | None = None,
+        block_resources: bool = False,
+    ) -> AsyncIterator[BrowserContext]:
+        """Get a context shared by concurrent callers with the same cookies.
+
+        The first caller for a cookie set opens the context; later callers
+        reuse it and only pay for their own page. Each caller holds one of
+        SHARED_CONTEXT_PAGES page slots while inside the block and must close
+        the pages it opens. When the last caller leaves, the context is
+        handed back to the pool like one from get_context.
+
+        Args:
+            cookies: Optional list of cookies to add to the context.
+            block_resources: Abort image, media, font and telemetry requests.
+                Contexts with and without blocking are never shared.
+
+        Yields:
+            A BrowserContext with stealth settings applied.
+        """
+        key = self._cookie_key(cookies) + (b"\x01" if block_resources else b"\x00")
+
+        opening = self._shared_locks.get(key)
+        if opening is None:
+            opening = self._shared_locks[key] = asyncio.Lock()
+
+        async with opening:
+            shared = self._shared_contexts.get(key)
+            if shared is None or not shared.browser.is_connected():
+                browser = await self.acquire()
+                try:
+                    context = await self._open_context(browser, cookies, block_resources)
+                except Exception:
+                    await self._retire_context(browser, None, cookies, False)
+                    raise
+                shared = _SharedContext(browser, context)
+                self._shared_contexts[key] = shared
+            else:
+                log.debug("browser_context_shared")
+            shared.users += 1
+
+        reusable = False
+        try:
+            async with shared.pages:
+                yield shared.context
+            reusable = True
+        finally:
+            shared.users -= 1
+            if shared.users == 0:
+                if self._shared_contexts.get(key) is shared:
+                    del self._shared_contexts[key]
+                await self._retire_context(shared.browser, shared.context, cookies, reusable)
+
+    @asynccontextmanager
+    async def get_shared_page(
+        self,
+        cookies: list[SetCookieParam] | None = None,
+        block_resources: bool = False,
+    ) -> AsyncIterator[Page]:
+        """Get a page in the shared context for a cookie set.
+
+        Like get_shared_context, but the page comes from the context's
+        PagePool and is returned to it afterwards, so sequential and
+        concurrent callers skip context.new_page() when a page is idle.
+
+        Args:
+            cookies: Optional list of cookies to add to the context.
+            block_resources: Abort image, media, font and telemetry requests.
+
+        Yields:
+            A Page whose context is shared by callers with the same cookies.
+        """
+        async with self.get_shared_context(
+            cookies=cookies, block_resources=block_resources
+        ) as context:
+            pages = self._page_pools.get(context)
+            if pages is None:
+                pages = self._page_pools[context] = PagePool(context)
+            async with pages.acquire() as page:
+                yield page
+
+    @staticmethod
+    def _cookie_key(cookies: list[SetCookieParam] | None) -> bytes:
+        """Digest a cookie list so identical cookie sets share a context."""
+        parts = sorted(f"{c.get('domain', '')}\0{c['name']}\0{c['value']}" for c in cookies or [])
+        return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).digest()
+
+    async def _open_context(
+        self,
+        browser: Browser,
+        cookies: list[SetCookieParam] | None = None,
+        block_resources: bool = False,
+    ) -> BrowserContext:
+        """Reuse the browser's warm context (or create one) and set it up.
+
+        The warm context is only reused for the cookie set it was last used
+        with. Resetting clears cookies, but localStorage, IndexedDB and service
+        workers from another account's session would survive, so a different
+        cookie set gets a fresh context.
+
+        Args:
+            browser: The acquired browser to open the context in.
+            cookies: Optional list of cookies to add to the context.
+            block_resources: Abort image, media, font and telemetry requests.
+
+        Returns:
+            A BrowserContext with stealth settings applied.
+        """
+        key = self._cookie_key(cookies)
+        context = None
+        idle = self._idle_contexts.pop(browser, None)
+        if idle is not None:
+            idle_key, idle_context = idle
+            if idle_key == key:
+                context = idle_context
+            else:
+                await self._discard_context(idle_context)
+        setup = []
+        if context is None:
             # Randomize viewport slightly to avoid fingerprinting
             viewport_width = 1920 + random.randint(-100, 100)
             viewport_height = 1080 + random.randint(-50, 50)
@@ -238,20 +555,81 @@ class BrowserPool:
                 is_mobile=False,
                 device_scale_factor=1,
             )
+            # Add comprehensive stealth script (stays installed on reuse)
+            setup.append(context.add_init_script(STEALTH_SCRIPT))
+        else:
+            log.debug("browser_context_reused")
+
+        # Setup calls are independent, so send them together rather than
+        # paying one round-trip each
+        if cookies:
+            setup.append(context.add_cookies(cookies))
+        if block_resources:
+            setup.append(context.route("**/*", _abort_blocked_resources))
+        try:
+            await asyncio.gather(*setup)
+        except Exception:
+            await context.close()
+            raise
+        return context
+
+    async def _retire_context(
+        self,
+        browser: Browser,
+        context: BrowserContext | None,
+        cookies: list[SetCookieParam] | None,
+        reusable: bool,
+    ) -> None:
+        """Keep a cleanly used context warm for the browser, then release it.
+
+        Args:
+            browser: The browser the context belongs to.
+            context: The context to keep or close, if one was opened.
+            cookies: The cookie set the context was used with.
+            reusable: Whether the caller finished without error.
+        """
+        if context:
+            pages = self._page_pools.get(context)
+            keep = pages.free_pages if pages else ()
+            if reusable and await self._reset_context(context, keep):
+                self._idle_contexts[browser] = (self._cookie_key(cookies), context)
+            else:
+                await self._discard_context(context)
+        await self.release(browser)
 
-            # Add comprehensive stealth script
-            await context.add_init_script(STEALTH_SCRIPT)
+    async def _discard_context(self, context: BrowserContext) -> None:
+        """Close a context along with the pages pooled in it.
 
-            # Add cookies if provided
-            if cookies:
-                await context.add_cookies(cookies)
+        Pooled pages are only blanked between uses, so their sessionStorage
+        would leak into another cookie set; they are never kept past their
+        context.
 
-            yield context
+        Args:
+            context: The context to close.
+        """
+        self._page_pools.pop(context, None)
+        await context.close()
 
-        finally:
-            if context:
-                await context.close()
-            await self.release(browser)
+    @staticmethod
+    async def _reset_context(context: BrowserContext, keep: Collection[Page] = ()) -> bool:
+        """Strip per-use state from a context so it can be reused.
+
+        Args:
+            context: The context to reset.
+            keep: Blank pages to leave open for reuse.
+
+        Returns:
+            True if the context is clean and safe to reuse.
+        """
+        try:
+            for page in context.pages:
+                if page not in keep:
+                    await page.close()
+            await asyncio.gather(context.clear_cookies(), context.unroute_all())
+        except Exception as e:
+            log.debug("browser_context_reset_failed", error=str(e))
+            return False
+        return True
 
     async def close(self) -> None:
         """Close all browsers and shutdown Playwright."""
@@ -271,6 +649,9 @@ class BrowserPool:
 
         self._initialized = False
         self._browser_count = 0
+        self._idle_contexts.clear()
+        self._shared_contexts.clear()
+        self._page_pools.clear()
         log.info("browser_pool_closed")
 
 
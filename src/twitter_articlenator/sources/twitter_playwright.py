@@ -1,18 +1,162 @@
 """Twitter/X content source using Playwright browser automation."""
 
 import asyncio
+import hashlib
 import html
+import json
 import re
+import time
+import weakref
 from datetime import datetime
+from functools import cached_property
+from pathlib import Path
 
 import structlog
 from playwright.async_api._generated import SetCookieParam
 
+from ..config import get_config
 from .base import Article, ContentSource
-from .browser_pool import get_browser_pool
+from .browser_pool import get_browser_pool, parse_cookie_string
 
 log = structlog.get_logger()
 
+# Bounds tweet fetches hitting x.com at once, shared by all source instances.
+# Created on first use so it is sized from the loaded config.
+_fetch_semaphore: asyncio.Semaphore | None = None
+
+# Pooled contexts that have already loaded an authenticated home feed, mapped
+# to the session key (cookie digest) they loaded it with. The pool reuses a
+# context for other cookie sets, so a context is only warm for its own session.
+_warm_contexts: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# How long a session whose home feed loaded stays trusted to open tweets
+# directly, even in a fresh browser context (seconds)
+VERIFIED_SESSION_TTL = 6 * 60 * 60
+
+# File in the config dir recording when each session (by cookie digest) last
+# loaded the home feed. Only digests are stored, never the cookies.
+VERIFIED_SESSIONS_FILE = "twitter-sessions.json"
+
+# Maximum wait for a scroll to render more replies (milliseconds)
+REPLY_SCROLL_TIMEOUT = 1000
+
+# Upper bound on reply scrolls, and consecutive scrolls that render nothing new
+# before the thread is treated as fully loaded
+MAX_REPLY_SCROLLS = 10
+MAX_STALLED_REPLY_SCROLLS = 2
+
+# HTTP statuses X uses to signal rate limiting (420 is the legacy "Enhance Your Calm")
+RATE_LIMIT_STATUSES = frozenset({420, 429})
+
+# Backoff applied before retrying a rate-limited load (seconds, doubled per hit)
+RATE_LIMIT_BASE_DELAY = 5.0
+RATE_LIMIT_MAX_DELAY = 60.0
+
+# Reads everything _extract_tweet_data needs from a loaded tweet page in a
+# single round-trip: long-form check, author name, timestamp, article title,
+# and the focal tweet's text and photo srcs
+EXTRACT_TWEET_SCRIPT = """() => {
+    const text = (sel, root = document) => root.querySelector(sel)?.innerText ?? null;
+    const isArticle = !!document.querySelector('[data-testid="longformRichTextComponent"]');
+    // The main/focal tweet has a larger format; fall back to the first tweet
+    const main = isArticle ? null :
+        document.querySelector('article[data-testid="tweet"][tabindex="-1"]') ||
+        document.querySelector('[data-testid="tweet"]');
+    return {
+        isArticle,
+        displayName: text('[data-testid="User-Name"] span'),
+        datetime: document.querySelector('time')?.getAttribute('datetime') ?? null,
+        title: isArticle
+            ? text('article h1, [data-testid="article-cover-image"] + div h1')
+            : null,
+        pageTitle: document.title,
+        content: main ? text('[data-testid="tweetText"]', main) ?? '' : '',
+        images: main ? Array.from(
+            main.querySelectorAll('[data-testid="tweetPhoto"] img'),
+            img => img.getAttribute('src') || ''
+        ) : [],
+    };
+}"""
+
+# Collects author link, display name, text and photo srcs for every reply
+# (every tweet article after the focal one) in a single page round-trip
+EXTRACT_REPLIES_SCRIPT = """() => {
+    let tweets = document.querySelectorAll('article[data-testid="tweet"]');
+    if (tweets.length <= 1) {
+        // Twitter wraps conversation in cellInnerDiv elements
+        const cells = document.querySelectorAll('[data-testid="cellInnerDiv"] article');
+        if (cells.length > tweets.length) tweets = cells;
+    }
+    return Array.from(tweets).slice(1).map(t => ({
+        href: t.querySelector('[data-testid="User-Name"] a')?.getAttribute('href') || '',
+        displayName: t.querySelector('[data-testid="User-Name"] span')?.innerText || '',
+        content: t.querySelector('[data-testid="tweetText"]')?.innerText || '',
+        images: Array.from(
+            t.querySelectorAll('[data-testid="tweetPhoto"] img'),
+            img => img.getAttribute('src') || ''
+        ),
+    }));
+}"""
+
+# Markup for one reply in the replies section; fields are escaped by the caller
+REPLY_HTML_TEMPLATE = """    <div class="tweet reply{op_class}">
+        <div class="tweet-header">
+            <span class="displayname">{display_name}</span>{op_badge}
+            <span class="username">@{author}</span>
+        </div>
+        <div class="tweet-content">
+            <p>{content}</p>
+        </div>
+        {images_html}
+    </div>
+"""
+
+# Class suffix and badge marking replies written by the tweet's author
+OP_REPLY_CLASS = " op-reply"
+OP_BADGE_HTML = ' <span class="op-badge">OP</span>'
+
+
+def _get_fetch_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent tweet fetches."""
+    global _fetch_semaphore
+    if _fetch_semaphore is None:
+        _fetch_semaphore = asyncio.Semaphore(get_config().twitter_fetch_concurrency)
+    return _fetch_semaphore
+
+
+def _load_verified_sessions() -> dict[str, float]:
+    """Read the verified-session timestamps, treating a missing or bad file as empty."""
+    path = get_config().config_dir / VERIFIED_SESSIONS_FILE
+    try:
+        sessions = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return sessions if isinstance(sessions, dict) else {}
+
+
+def _is_session_verified(session_key: str) -> bool:
+    """Check whether a session loaded the home feed within VERIFIED_SESSION_TTL."""
+    verified_at = _load_verified_sessions().get(session_key)
+    return verified_at is not None and time.time() - verified_at < VERIFIED_SESSION_TTL
+
+
+def _record_session(session_key: str, verified: bool) -> None:
+    """Mark a session as verified now, or forget it, dropping expired entries."""
+    now = time.time()
+    sessions = {
+        key: verified_at
+        for key, verified_at in _load_verified_sessions().items()
+        if now - verified_at < VERIFIED_SESSION_TTL and key != session_key
+    }
+    if verified:
+        sessions[session_key] = now
+    path = get_config().config_dir / VERIFIED_SESSIONS_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(sessions))
+    except OSError as e:
+        log.warning("verified_session_save_failed", error=str(e))
+
 
 def _escape_html(text: str) -> str:
     """Escape HTML special characters in text content."""
@@ -31,6 +175,9 @@ class TwitterPlaywrightSource(ContentSource):
         r"https?://(?:www\.)?(?:twitter\.com|x\.com)/(\w+)/(?:status|article)/(\d+)"
     )
 
+    # Size parameter on twimg.com image URLs (e.g. name=small)
+    IMAGE_SIZE_PATTERN = re.compile(r"name=\w+")
+
     # Maximum title length
     MAX_TITLE_LENGTH = 100
 
@@ -45,44 +192,56 @@ class TwitterPlaywrightSource(ContentSource):
         """
         self._cookies_str = cookies
 
-    def can_handle(self, url: str) -> bool:
+    @classmethod
+    def can_handle(cls, url: str) -> bool:
         """Check if URL is a Twitter/X status URL."""
         if not url:
             return False
-        return bool(self.TWITTER_URL_PATTERN.match(url))
+        return bool(cls.TWITTER_URL_PATTERN.match(url))
 
-    def _parse_cookies(self) -> list[SetCookieParam]:
-        """Parse cookie string into Playwright cookie format.
+    @cached_property
+    def _cookies(self) -> list[SetCookieParam]:
+        """Cookie string parsed into Playwright cookie format, once per instance.
 
         Returns:
             List of cookie dicts for Playwright.
         """
-        if not self._cookies_str:
-            return []
-
-        cookies: list[SetCookieParam] = []
-        for part in self._cookies_str.split(";"):
-            part = part.strip()
-            if "=" in part:
-                name, value = part.split("=", 1)
-                cookies.append(
-                    SetCookieParam(
-                        name=name.strip(),
-                        value=value.strip(),
-                        domain=".x.com",
-                        path="/",
-                    )
-                )
-                # Also add for twitter.com domain
-                cookies.append(
-                    SetCookieParam(
-                        name=name.strip(),
-                        value=value.strip(),
-                        domain=".twitter.com",
-                        path="/",
-                    )
-                )
-        return cookies
+        return parse_cookie_string(self._cookies_str)
+
+    @cached_property
+    def _session_key(self) -> str:
+        """Digest identifying this cookie set in the verified-session file."""
+        return hashlib.blake2b(self._cookies_str.encode(), digest_size=16).hexdigest()
+
+    async def _load_home_feed(self, page, context) -> bool:
+        """Load the home feed to establish the session.
+
+        Args:
+            page: Playwright page object.
+            context: The page's browser context.
+
+        Returns:
+            True if the feed loaded, proving the session is logged in.
+        """
+        # Go to home to establish session and let React app initialize. Only
+        # the response is awaited; the feed selector below is what signals
+        # the page is ready.
+        await page.goto("https://x.com/home", wait_until="commit", timeout=30000)
+
+        # Wait for home feed to load (proves we're logged in)
+        try:
+            await page.wait_for_selector('[data-testid="tweet"]', timeout=13000)
+        except Exception:
+            log.warning(
+                "home_feed_not_loaded",
+                hint="Session not ready - may be rate limited or slow to load",
+            )
+            return False
+
+        log.info("home_feed_loaded")
+        _warm_contexts[context] = self._session_key
+        await asyncio.to_thread(_record_session, self._session_key, True)
+        return True
 
     async def fetch(self, url: str) -> Article:
         """Fetch a tweet using Playwright and convert to Article.
@@ -101,7 +260,7 @@ class TwitterPlaywrightSource(ContentSource):
         if not self._cookies_str:
             raise ValueError("Cookies are required to fetch tweets")
 
-        # Normalize to https (pushState fails with http on https origin)
+        # Normalize to https so the loaded URL matches the canonical one
         if url.startswith("http://"):
             url = "https://" + url[7:]
 
@@ -112,113 +271,149 @@ class TwitterPlaywrightSource(ContentSource):
         username = match.group(1)
         tweet_id = match.group(2)
 
-        log.info("fetching_tweet_playwright", tweet_id=tweet_id, url=url)
+        # Load twitter.com links from x.com directly: cookies are only set
+        # there, and it skips the redirect
+        _, _, host, path = url.split("/", 3)
+        load_url = url if host == "x.com" else f"https://x.com/{path}"
+
+        log.info("fetching_tweet_playwright", tweet_id=tweet_id, url=load_url)
 
         # Use browser pool for efficient browser reuse
         pool = get_browser_pool()
-        cookies = self._parse_cookies()
-
-        async with pool.get_context(cookies=cookies) as context:
-            page = await context.new_page()
-
-            # First go to home to establish session and let React app initialize
-            await page.goto("https://x.com/home", wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(3)
-
-            # Wait for home feed to load (proves we're logged in)
-            is_authenticated = False
+        cookies = self._cookies
+
+        # Image URLs are read from the DOM, so media bytes are never needed
+        async with (
+            _get_fetch_semaphore(),
+            pool.get_shared_page(cookies=cookies, block_resources=True) as page,
+        ):
+            # The page is pooled and its context shared with concurrent
+            # fetches using the same cookies
+            context = page.context
+
+            # Track rate-limit responses (page or API) so retries back off
+            rate_limited = False
+            backoff = RATE_LIMIT_BASE_DELAY
+
+            def on_response(response):
+                nonlocal rate_limited
+                if response.status in RATE_LIMIT_STATUSES:
+                    rate_limited = True
+
+            page.on("response", on_response)
             try:
-                await page.wait_for_selector('[data-testid="tweet"]', timeout=10000)
-                log.info("home_feed_loaded")
-                is_authenticated = True
-            except Exception:
-                log.warning(
-                    "home_feed_not_loaded",
-                    hint="Session not ready - may be rate limited or slow to load",
-                )
-
-            # Retry loop for navigation and content loading
-            last_error = None
-            for attempt in range(1, self.MAX_LOAD_RETRIES + 1):
-                try:
-                    # Now use React Router navigation by manipulating history
-                    # This simulates clicking a link rather than direct navigation
-                    await page.evaluate(f"""
-                        window.history.pushState({{}}, '', '{url}');
-                        window.dispatchEvent(new PopStateEvent('popstate'));
-                    """)
-                    await asyncio.sleep(3)
-
-                    # If that didn't work, try clicking the URL in address bar style
-                    # by using goto but with a referrer
-                    if page.url != url:
+                # Pooled contexts that already loaded the home feed with these
+                # cookies are known to be logged in, so they go straight to
+                # the tweet. So do fresh contexts for a session that loaded the
+                # feed recently; if the tweet then fails to load, the feed is
+                # loaded before retrying.
+                is_authenticated = _warm_contexts.get(context) == self._session_key
+                skipped_home_cold = False
+                if is_authenticated:
+                    log.info("home_feed_skipped", reason="warm_context")
+                elif await asyncio.to_thread(_is_session_verified, self._session_key):
+                    log.info("home_feed_skipped", reason="verified_session")
+                    is_authenticated = True
+                    skipped_home_cold = True
+                else:
+                    is_authenticated = await self._load_home_feed(page, context)
+
+                # Retry loop for navigation and content loading
+                last_error = None
+                for attempt in range(1, self.MAX_LOAD_RETRIES + 1):
+                    try:
+                        # Navigate straight to the tweet, returning as soon as the
+                        # response commits; the selector wait below is the real
+                        # readiness check
                         await page.goto(
-                            url,
-                            wait_until="domcontentloaded",
-                            timeout=60000,
+                            load_url,
+                            wait_until="commit",
+                            timeout=30000,
                             referer="https://x.com/home",
                         )
-                        await asyncio.sleep(3)
-
-                    # Take screenshot for debugging
-                    await page.screenshot(path="/tmp/twitter_nav_test.png")
-                    log.info(
-                        "navigation_complete",
-                        url=page.url,
-                        title=await page.title(),
-                        attempt=attempt,
-                    )
 
-                    # Wait for tweet content to load (regular tweet OR article)
-                    await page.wait_for_selector(
-                        '[data-testid="tweetText"], [data-testid="longformRichTextComponent"]',
-                        timeout=30000,
-                    )
-                    # Success - break out of retry loop
-                    break
-
-                except Exception as e:
-                    last_error = e
-                    log.warning(
-                        "tweet_load_failed",
-                        attempt=attempt,
-                        max_attempts=self.MAX_LOAD_RETRIES,
-                        error=str(e),
-                        url=url,
-                    )
+                        # No page.title() here: right after commit it is usually
+                        # still empty, and extraction reads document.title anyway
+                        log.info("navigation_complete", url=page.url, attempt=attempt)
 
-                    if attempt < self.MAX_LOAD_RETRIES:
-                        # Reload the page and try again
-                        log.info("retrying_tweet_load", attempt=attempt + 1, url=url)
-                        await page.reload(wait_until="domcontentloaded", timeout=30000)
-                        await asyncio.sleep(3)
-                    else:
-                        # Final attempt failed - save debug info and raise
-                        screenshot_path = "/tmp/twitter_debug.png"
-                        await page.screenshot(path=screenshot_path, full_page=True)
-                        html_path = "/tmp/twitter_debug.html"
-                        with open(html_path, "w") as f:
-                            f.write(await page.content())
-                        log.error(
-                            "tweet_not_found_after_retries",
-                            screenshot=screenshot_path,
-                            html_path=html_path,
-                            page_url=page.url,
-                            page_title=await page.title(),
-                            attempts=self.MAX_LOAD_RETRIES,
+                        # Wait for tweet content to load (regular tweet OR article)
+                        await page.wait_for_selector(
+                            '[data-testid="tweetText"], [data-testid="longformRichTextComponent"]',
+                            timeout=30000,
+                        )
+                        if get_config().debug_screenshots:
+                            await page.screenshot(path="/tmp/twitter_nav_test.png")
+                        # Success - a logged-in session is now known to work
+                        # in this context, so break out of retry loop
+                        if is_authenticated:
+                            _warm_contexts[context] = self._session_key
+                        break
+
+                    except Exception as e:
+                        last_error = e
+                        log.warning(
+                            "tweet_load_failed",
+                            attempt=attempt,
+                            max_attempts=self.MAX_LOAD_RETRIES,
+                            error=str(e),
+                            url=load_url,
                         )
-                        raise last_error
-
-            # Extract tweet data
-            tweet_data = await self._extract_tweet_data(page, username, is_authenticated)
 
-            log.info(
-                "tweet_extracted_playwright",
-                author=tweet_data["author"],
-                has_content=bool(tweet_data["content"]),
-            )
+                        if attempt < self.MAX_LOAD_RETRIES:
+                            if rate_limited:
+                                log.warning("tweet_rate_limited", delay=backoff, url=load_url)
+                                await asyncio.sleep(backoff)
+                                backoff = min(backoff * 2, RATE_LIMIT_MAX_DELAY)
+                                rate_limited = False
+
+                            if skipped_home_cold:
+                                # The recorded session did not open the tweet
+                                # directly; bootstrap it the slow way
+                                skipped_home_cold = False
+                                log.info("verified_session_fallback", url=load_url)
+                                is_authenticated = await self._load_home_feed(page, context)
+
+                            # The next attempt navigates to the tweet again
+                            log.info("retrying_tweet_load", attempt=attempt + 1, url=load_url)
+                        else:
+                            # Final attempt failed - the session may have gone
+                            # stale, so bootstrap it again next time
+                            _warm_contexts.pop(context, None)
+                            await asyncio.to_thread(_record_session, self._session_key, False)
+                            # Save debug info and raise. The page reads are
+                            # independent, so they are issued together, and
+                            # the HTML is written off the event loop.
+                            screenshot_path = "/tmp/twitter_debug.png"
+                            html_path = "/tmp/twitter_debug.html"
+                            _, page_html, page_title = await asyncio.gather(
+                                page.screenshot(path=screenshot_path, full_page=True),
+                                page.content(),
+                                page.title(),
+                            )
+                            await asyncio.to_thread(Path(html_path).write_text, page_html)
+                            log.error(
+                                "tweet_not_found_after_retries",
+                                screenshot=screenshot_path,
+                                html_path=html_path,
+                                page_url=page.url,
+                                page_title=page_title,
+                                attempts=self.MAX_LOAD_RETRIES,
+                            )
+                            raise last_error
+
+                # Extract tweet data
+                tweet_data = await self._extract_tweet_data(page, username, is_authenticated)
+
+                log.info(
+                    "tweet_extracted_playwright",
+                    author=tweet_data["author"],
+                    has_content=bool(tweet_data["content"]),
+                )
 
-            return self._create_article(tweet_data, url)
+                return self._create_article(tweet_data, url)
+            finally:
+                # The page outlives this fetch, so detach its listener
+                page.remove_listener("response", on_response)
 
     async def _extract_tweet_data(
         self, page, expected_username: str, is_authenticated: bool = False
@@ -233,15 +428,15 @@ class TwitterPlaywrightSource(ContentSource):
         Returns:
             Dict with tweet data.
         """
-        # Check if this is an article (long-form content)
-        article_element = await page.query_selector('[data-testid="longformRichTextComponent"]')
-        is_article = article_element is not None
-
-        content = ""
-        title = None
-        images = []
+        # One page script reads every field instead of a query and a read per
+        # element
+        data = await page.evaluate(EXTRACT_TWEET_SCRIPT)
+        is_article = data["isArticle"]
+        title = data["title"]
 
         if is_article:
+            article_element = await page.query_selector('[data-testid="longformRichTextComponent"]')
+
             # Scroll through the article to trigger lazy-loading of images
             log.info("scrolling_article_for_images")
             await self._scroll_article(page, article_element)
@@ -250,55 +445,22 @@ class TwitterPlaywrightSource(ContentSource):
             log.info("extracting_article_content")
             content, images = await self._extract_article_content(article_element, page)
 
-            # Try to get article title from the article header or cover
-            try:
-                title_element = await page.query_selector(
-                    'article h1, [data-testid="article-cover-image"] + div h1'
-                )
-                if title_element:
-                    title = await title_element.inner_text()
-            except Exception:
-                pass
-
-            if not title:
-                page_title = await page.title()
-                if " / X" in page_title:
-                    title = page_title.replace(" / X", "").strip()
+            # Fall back to the page title when the article has no header
+            if not title and " / X" in data["pageTitle"]:
+                title = data["pageTitle"].replace(" / X", "").strip()
         else:
-            # Regular tweet - get the main tweet first
-            # The main/focal tweet has a larger format, find it specifically
-            main_tweet = await page.query_selector('article[data-testid="tweet"][tabindex="-1"]')
-            if not main_tweet:
-                # Fallback to first tweet
-                main_tweet = await page.query_selector('[data-testid="tweet"]')
-
-            if main_tweet:
-                # Extract text from main tweet
-                text_el = await main_tweet.query_selector('[data-testid="tweetText"]')
-                if text_el:
-                    content = await text_el.inner_text()
-
-                # Extract images from main tweet
-                images = await self._extract_images(main_tweet)
+            content = data["content"]
+            images = self._large_image_urls(data["images"])
 
         # Get author display name
-        display_name = expected_username
-        try:
-            name_element = await page.query_selector('[data-testid="User-Name"] span')
-            if name_element:
-                display_name = await name_element.inner_text()
-        except Exception:
-            pass
+        display_name = data["displayName"] if data["displayName"] is not None else expected_username
 
         # Get timestamp
         timestamp = None
         try:
-            time_element = await page.query_selector("time")
-            if time_element:
-                datetime_attr = await time_element.get_attribute("datetime")
-                if datetime_attr:
-                    timestamp = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
-        except Exception:
+            if data["datetime"]:
+                timestamp = datetime.fromisoformat(data["datetime"].replace("Z", "+00:00"))
+        except ValueError:
             pass
 
         # Extract replies/conversation thread (only if authenticated)
@@ -319,30 +481,21 @@ class TwitterPlaywrightSource(ContentSource):
             "is_article": is_article,
         }
 
-    async def _extract_images(self, container) -> list[str]:
-        """Extract image URLs from a tweet container.
+    def _large_image_urls(self, srcs: list[str]) -> list[str]:
+        """Keep tweet photo URLs and request their large size.
 
         Args:
-            container: Playwright element containing the tweet.
+            srcs: Image src attributes read from the page.
 
         Returns:
             List of image URLs.
         """
-        images = []
-        try:
-            # Find all tweet photos
-            photo_elements = await container.query_selector_all('[data-testid="tweetPhoto"] img')
-            for img in photo_elements:
-                src = await img.get_attribute("src")
-                if src and "twimg.com" in src:
-                    # Get higher quality version
-                    # Twitter uses format=jpg&name=small, change to name=large
-                    if "name=" in src:
-                        src = re.sub(r"name=\w+", "name=large", src)
-                    images.append(src)
-        except Exception as e:
-            log.warning("image_extraction_failed", error=str(e))
-        return images
+        # Twitter uses format=jpg&name=small, change to name=large
+        return [
+            self.IMAGE_SIZE_PATTERN.sub("name=large", src)
+            for src in srcs
+            if src and "twimg.com" in src
+        ]
 
     async def _scroll_article(self, page, article_element) -> None:
         """Scroll through article to trigger lazy-loading of images."""
@@ -400,16 +553,45 @@ class TwitterPlaywrightSource(ContentSource):
                 }
             }
 
+            // Everything the checks below look for inside an element, so
+            // each element's subtree is scanned once instead of per check
+            const SCAN_SELECTOR = '[data-testid="markdown-code-block"], pre, code, '
+                + 'h1, h2, h3, h4, h5, h6, img';
+            const HEADING_TAGS = new Set(['H1', 'H2', 'H3', 'H4', 'H5', 'H6']);
+
+            function scan(el) {
+                const found = {codeBlock: null, heading: null, hasImages: false};
+                for (const node of el.querySelectorAll(SCAN_SELECTOR)) {
+                    if (node.tagName === 'IMG') {
+                        if ((node.src || '').startsWith('http')) found.hasImages = true;
+                    } else if (HEADING_TAGS.has(node.tagName)) {
+                        if (!found.heading) found.heading = node;
+                    } else if (!found.codeBlock) {
+                        found.codeBlock = node;
+                    }
+                }
+                return found;
+            }
+
             function processElement(el) {
                 if (!el || !el.tagName) return;
                 const tag = el.tagName.toLowerCase();
 
+                // Direct image
+                if (tag === 'img') {
+                    const src = el.src || '';
+                    if (src && src.startsWith('http')) {
+                        addImage(src);
+                    }
+                    return;
+                }
+
+                const found = scan(el);
+
                 // Code block: <section> with markdown-code-block inside,
                 // or any element containing <pre>/<code> with monospace text
                 if (tag === 'section' || tag === 'div') {
-                    const codeBlock = el.querySelector(
-                        '[data-testid="markdown-code-block"], pre, code'
-                    );
+                    const codeBlock = found.codeBlock;
                     if (codeBlock) {
                         let lang = '';
                         const langSpan = el.querySelector(
@@ -434,17 +616,8 @@ class TwitterPlaywrightSource(ContentSource):
                     }
                 }
 
-                // Direct image
-                if (tag === 'img') {
-                    const src = el.src || '';
-                    if (src && src.startsWith('http')) {
-                        addImage(src);
-                    }
-                    return;
-                }
-
                 // Check for heading inside this element
-                const heading = el.querySelector('h1,h2,h3,h4,h5,h6');
+                const heading = found.heading;
                 if (heading) {
                     const level = parseInt(heading.tagName[1]);
                     const text = heading.innerText.trim();
@@ -488,12 +661,7 @@ class TwitterPlaywrightSource(ContentSource):
                 }
 
                 // Check if this element contains images
-                const imgs = el.querySelectorAll('img');
-                const hasImages = Array.from(imgs).some(
-                    img => (img.src || '').startsWith('http')
-                );
-
-                if (hasImages) {
+                if (found.hasImages) {
                     for (const child of el.children) {
                         processElement(child);
                     }
@@ -556,8 +724,7 @@ class TwitterPlaywrightSource(ContentSource):
                 )
             elif btype == "image":
                 src = block["src"]
-                if "name=" in src:
-                    src = re.sub(r"name=\w+", "name=large", src)
+                src = self.IMAGE_SIZE_PATTERN.sub("name=large", src)
                 images.append(src)
                 html_parts.append(
                     f'        <div class="article-image">'
@@ -588,87 +755,63 @@ class TwitterPlaywrightSource(ContentSource):
         replies = []
 
         try:
-            # Wait for page to stabilize
-            await asyncio.sleep(2)
-
             # Try to click "Show replies" or similar buttons if they exist
             try:
                 show_replies = await page.query_selector('text="Show replies"')
                 if show_replies:
                     await show_replies.click()
-                    await asyncio.sleep(2)
                     log.info("clicked_show_replies")
             except Exception:
                 pass
 
-            # Scroll down to load replies - scroll past the main tweet
-            for i in range(5):
-                await page.evaluate("window.scrollBy(0, 800)")
-                await asyncio.sleep(1)
-
-            # Wait for any lazy-loaded content
-            await asyncio.sleep(2)
-
-            # Save debug screenshot
-            await page.screenshot(path="/tmp/twitter_replies_debug.png", full_page=True)
-
-            # Get all tweet articles - these contain the actual tweet content
-            tweet_elements = await page.query_selector_all('article[data-testid="tweet"]')
-            log.info("found_tweet_elements", count=len(tweet_elements))
-
-            # Also try to find tweets in the conversation section
-            if len(tweet_elements) <= 1:
-                # Twitter wraps conversation in cellInnerDiv elements
-                cell_elements = await page.query_selector_all(
-                    '[data-testid="cellInnerDiv"] article'
+            # Scroll down to load replies - scroll past the main tweet, moving
+            # on as soon as each scroll renders more tweets and stopping once
+            # scrolling stops producing any
+            stalled = 0
+            for _ in range(MAX_REPLY_SCROLLS):
+                prev_count = await page.evaluate(
+                    """() => {
+                        window.scrollBy(0, 800);
+                        return document.querySelectorAll('article[data-testid="tweet"]').length;
+                    }"""
                 )
-                log.info("found_cell_article_elements", count=len(cell_elements))
-                if len(cell_elements) > len(tweet_elements):
-                    tweet_elements = cell_elements
-
-            # Skip the first one (main tweet) and process replies
-            for i, tweet in enumerate(tweet_elements):
-                if i == 0:
-                    continue  # Skip main tweet
-
                 try:
-                    # Get reply author
-                    author = ""
-                    author_el = await tweet.query_selector('[data-testid="User-Name"] a')
-                    if author_el:
-                        href = await author_el.get_attribute("href")
-                        if href:
-                            author = href.strip("/").split("/")[0]
-
-                    # Get reply text
-                    text = ""
-                    text_el = await tweet.query_selector('[data-testid="tweetText"]')
-                    if text_el:
-                        text = await text_el.inner_text()
-
-                    # Get reply images
-                    images = await self._extract_images(tweet)
-
-                    # Get display name
-                    display_name = author
-                    name_span = await tweet.query_selector('[data-testid="User-Name"] span')
-                    if name_span:
-                        display_name = await name_span.inner_text()
-
-                    if text or images:
-                        replies.append(
-                            {
-                                "author": author,
-                                "display_name": display_name,
-                                "content": text,
-                                "images": images,
-                                "is_op": author.lower() == main_author.lower(),
-                            }
-                        )
-
-                except Exception as e:
-                    log.warning("reply_extraction_failed", index=i, error=str(e))
-                    continue
+                    await page.wait_for_function(
+                        "prev => document.querySelectorAll("
+                        "'article[data-testid=\"tweet\"]').length > prev",
+                        arg=prev_count,
+                        timeout=REPLY_SCROLL_TIMEOUT,
+                    )
+                    stalled = 0
+                except Exception:
+                    stalled += 1
+                    if stalled >= MAX_STALLED_REPLY_SCROLLS:
+                        break
+
+            if get_config().debug_screenshots:
+                await page.screenshot(path="/tmp/twitter_replies_debug.png", full_page=True)
+
+            # Read every reply's fields in one round-trip
+            raw_replies = await page.evaluate(EXTRACT_REPLIES_SCRIPT)
+            log.info("found_reply_elements", count=len(raw_replies))
+
+            main_author_lower = main_author.lower()
+
+            for raw in raw_replies:
+                author = raw["href"].strip("/").split("/")[0]
+                text = raw["content"]
+                images = self._large_image_urls(raw["images"])
+
+                if text or images:
+                    replies.append(
+                        {
+                            "author": author,
+                            "display_name": raw["displayName"] or author,
+                            "content": text,
+                            "images": images,
+                            "is_op": author.lower() == main_author_lower,
+                        }
+                    )
 
             log.info("replies_extracted", count=len(replies))
 
@@ -704,18 +847,22 @@ class TwitterPlaywrightSource(ContentSource):
         else:
             title = f"Tweet by @{author}"
 
-        # Build HTML content
+        # Build HTML content. Scraped text is escaped once here; long-form
+        # article content is already HTML built by _extract_article_content.
         date_str = timestamp.strftime("%Y-%m-%d %H:%M") if timestamp else ""
+        safe_title = _escape_html(title)
+        safe_display_name = _escape_html(display_name)
+        safe_author = _escape_html(author)
 
         if is_article:
             # Content already contains structured HTML with images from
             # _extract_article_content, so use it directly.
             html_content = f"""<article class="twitter-article">
     <header class="article-header">
-        <h1>{title}</h1>
+        <h1>{safe_title}</h1>
         <div class="article-meta">
-            <span class="displayname">{display_name}</span>
-            <span class="username">@{author}</span>
+            <span class="displayname">{safe_display_name}</span>
+            <span class="username">@{safe_author}</span>
             <span class="date">{date_str}</span>
         </div>
     </header>
@@ -729,38 +876,38 @@ class TwitterPlaywrightSource(ContentSource):
 
             html_content = f"""<div class="tweet main-tweet">
     <div class="tweet-header">
-        <span class="displayname">{display_name}</span>
-        <span class="username">@{author}</span>
+        <span class="displayname">{safe_display_name}</span>
+        <span class="username">@{safe_author}</span>
         <span class="date">{date_str}</span>
     </div>
     <div class="tweet-content">
-        <p>{content}</p>
+        <p>{_escape_html(content)}</p>
     </div>
     {images_html}
 </div>"""
 
-            # Add replies section if there are any
+            # Add replies section if there are any, built as a list of
+            # fragments so long threads are joined once
             if replies:
-                html_content += '\n<div class="replies-section">\n'
-                html_content += '    <h2 class="replies-header">Replies</h2>\n'
-
-                for reply in replies:
-                    reply_images_html = self._render_images(reply.get("images", []))
-                    op_class = " op-reply" if reply.get("is_op") else ""
-                    op_badge = ' <span class="op-badge">OP</span>' if reply.get("is_op") else ""
-
-                    html_content += f"""    <div class="tweet reply{op_class}">
-        <div class="tweet-header">
-            <span class="displayname">{reply.get("display_name", reply["author"])}</span>{op_badge}
-            <span class="username">@{reply["author"]}</span>
-        </div>
-        <div class="tweet-content">
-            <p>{reply["content"]}</p>
-        </div>
-        {reply_images_html}
-    </div>
-"""
-                html_content += "</div>"
+                parts = [
+                    html_content,
+                    '\n<div class="replies-section">\n',
+                    '    <h2 class="replies-header">Replies</h2>\n',
+                ]
+
+                parts.extend(
+                    REPLY_HTML_TEMPLATE.format(
+                        op_class=OP_REPLY_CLASS if reply.get("is_op") else "",
+                        op_badge=OP_BADGE_HTML if reply.get("is_op") else "",
+                        display_name=_escape_html(reply.get("display_name", reply["author"])),
+                        author=_escape_html(reply["author"]),
+                        content=_escape_html(reply["content"]),
+                        images_html=self._render_images(reply.get("images", [])),
+                    )
+                    for reply in replies
+                )
+                parts.append("</div>")
+                html_content = "".join(parts)
 
         log.info(
             "tweet_converted_to_article",
@@ -792,11 +939,11 @@ class TwitterPlaywrightSource(ContentSource):
         if not images:
             return ""
 
-        images_html = '<div class="tweet-images">\n'
-        for img_url in images:
-            images_html += f'        <img src="{img_url}" alt="Tweet image" loading="lazy">\n'
-        images_html += "    </div>"
-        return images_html
+        img_tags = "".join(
+            f'        <img src="{img_url}" alt="Tweet image" loading="lazy">\n'
+            for img_url in images
+        )
+        return f'<div class="tweet-images">\n{img_tags}    </div>'
 
     def _truncate_title(self, text: str) -> str:
         """Truncate text to max title length.
@@ -807,8 +954,10 @@ class TwitterPlaywrightSource(ContentSource):
         Returns:
             Truncated text with ellipsis if needed.
         """
-        # Remove newlines for title
-        text = text.replace("\n", " ").strip()
+        # Remove newlines for title (single-line text skips the rewrite)
+        if "\n" in text:
+            text = text.replace("\n", " ")
+        text = text.strip()
         if len(text) <= self.MAX_TITLE_LENGTH:
             return text
         return text[: self.MAX_TITLE_LENGTH - 3] + "..."
@@ -1,17 +1,93 @@
 """Generic web article source for blogs and articles."""
 
+import asyncio
 import re
 from datetime import datetime
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse
 
 import httpx
 import structlog
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
+from ..config import get_config
 from .base import Article, ContentSource
 
 log = structlog.get_logger()
 
+# Bounds web article fetches in flight at once, shared by all source
+# instances. Created on first use so it is sized from the loaded config.
+_fetch_semaphore: asyncio.Semaphore | None = None
+
+
+# HTTP client shared by every fetch so connections (and their TLS sessions)
+# to repeated hosts are kept alive between articles
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for web article fetches.
+
+    Returns:
+        The global AsyncClient, created on first use or after it was closed.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            headers={
+                "User-Agent": "Mozilla/5.0 (compatible; ArticleBot/1.0)",
+                "Accept": "text/html,application/xhtml+xml",
+            },
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            # Retry failed connection attempts (not HTTP error responses)
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Twitter/X hosts left to TwitterPlaywrightSource
+TWITTER_DOMAINS = frozenset({"twitter.com", "x.com", "www.twitter.com", "www.x.com"})
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> ParseResult:
+    """Parse a URL, cached since each one is checked and fetched repeatedly."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def _can_handle_url(url: str) -> bool:
+    """Check if URL is a valid HTTP(S) URL that's not Twitter (cached)."""
+    try:
+        parsed = _parse_url(url)
+    except ValueError:
+        return False
+    if parsed.scheme not in ("http", "https"):
+        return False
+
+    # Exclude Twitter URLs (handled by TwitterSource)
+    if parsed.netloc.lower() in TWITTER_DOMAINS:
+        return False
+
+    return bool(parsed.netloc)
+
+
+def _get_fetch_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent web article fetches."""
+    global _fetch_semaphore
+    if _fetch_semaphore is None:
+        _fetch_semaphore = asyncio.Semaphore(get_config().web_fetch_concurrency)
+    return _fetch_semaphore
+
 
 class WebArticleSource(ContentSource):
     """Fetch articles from generic web pages."""
@@ -57,6 +133,43 @@ class WebArticleSource(ContentSource):
         'meta[property="article:published_time"]',
     ]
 
+    # Elements pruned before content extraction: non-content tags, common
+    # ad/sidebar containers, and paragraphs (kept unless empty)
+    PRUNE_SELECTOR = ", ".join(
+        [
+            "script",
+            "style",
+            "nav",
+            "header",
+            "footer",
+            "aside",
+            ".comments",
+            ".sidebar",
+            ".advertisement",
+            ".ad",
+            ".share",
+            "p",
+        ]
+    )
+
+    # Byline prefixes stripped from author text (e.g. "By Jane Doe")
+    AUTHOR_PREFIX_PATTERN = re.compile(r"^(by|author:?)\s*", re.IGNORECASE)
+
+    # Shortest text (and cleaned HTML) accepted from a content selector
+    # before falling back to the next one
+    MIN_CONTENT_LENGTH = 100
+
+    # Runs of whitespace collapsed when cleaning content HTML
+    WHITESPACE_PATTERN = re.compile(r"\s+")
+
+    # Human-readable date formats, tried when a date is not ISO 8601
+    HUMAN_DATE_FORMATS = (
+        "%B %d, %Y",
+        "%b %d, %Y",
+        "%d %B %Y",
+        "%d %b %Y",
+    )
+
     def __init__(self, timeout: float = 30.0) -> None:
         """Initialize web article source.
 
@@ -65,7 +178,8 @@ class WebArticleSource(ContentSource):
         """
         self._timeout = timeout
 
-    def can_handle(self, url: str) -> bool:
+    @classmethod
+    def can_handle(cls, url: str) -> bool:
         """Check if URL is a valid web URL (not Twitter).
 
         Args:
@@ -76,20 +190,7 @@ class WebArticleSource(ContentSource):
         """
         if not url:
             return False
-
-        try:
-            parsed = urlparse(url)
-            if parsed.scheme not in ("http", "https"):
-                return False
-
-            # Exclude Twitter URLs (handled by TwitterSource)
-            twitter_domains = ("twitter.com", "x.com", "www.twitter.com", "www.x.com")
-            if parsed.netloc.lower() in twitter_domains:
-                return False
-
-            return bool(parsed.netloc)
-        except Exception:
-            return False
+        return _can_handle_url(url)
 
     async def fetch(self, url: str) -> Article:
         """Fetch a web article and convert to Article.
@@ -105,28 +206,21 @@ class WebArticleSource(ContentSource):
         """
         log.info("fetching_web_article", url=url)
 
-        async with httpx.AsyncClient(
-            timeout=self._timeout,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "Mozilla/5.0 (compatible; ArticleBot/1.0)",
-                "Accept": "text/html,application/xhtml+xml",
-            },
-        ) as client:
+        async with _get_fetch_semaphore():
             try:
-                response = await client.get(url)
+                response = await get_http_client().get(url, timeout=self._timeout)
                 response.raise_for_status()
             except httpx.HTTPError as e:
                 raise ValueError(f"Failed to fetch URL: {e}") from e
 
         html = response.text
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
         # Extract metadata
-        title = self._extract_title(soup, url)
-        author = self._extract_author(soup, url)
-        published_at = self._extract_date(soup)
-        content = self._extract_content(soup)
+        title = self._extract_title(tree, url)
+        author = self._extract_author(tree, url)
+        published_at = self._extract_date(tree)
+        content = self._extract_content(tree)
 
         if not content:
             raise ValueError(f"Could not extract article content from {url}")
@@ -148,72 +242,77 @@ class WebArticleSource(ContentSource):
             source_type="web",
         )
 
-    def _extract_title(self, soup: BeautifulSoup, url: str) -> str:
+    def _extract_title(self, tree: LexborHTMLParser, url: str) -> str:
         """Extract article title from HTML."""
         # Try meta tags first
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return og_title["content"].strip()
+        og_title = self._meta_content(tree, 'meta[property="og:title"]')
+        if og_title:
+            return og_title
 
         # Try common selectors
         for selector in self.TITLE_SELECTORS:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                return element.get_text(strip=True)
+            element = tree.css_first(selector)
+            if element:
+                text = element.text(strip=True)
+                if text:
+                    return text
 
         # Fallback to <title> tag
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+        title_elem = tree.css_first("title")
+        if title_elem:
+            text = title_elem.text(strip=True)
+            if text:
+                return text
 
         # Last resort: use domain
-        return urlparse(url).netloc
+        return _parse_url(url).netloc
 
-    def _extract_author(self, soup: BeautifulSoup, url: str) -> str:
+    def _extract_author(self, tree: LexborHTMLParser, url: str) -> str:
         """Extract article author from HTML."""
         # Try meta tags
-        meta_author = soup.find("meta", attrs={"name": "author"})
-        if meta_author and meta_author.get("content"):
-            return meta_author["content"].strip()
+        meta_author = self._meta_content(tree, 'meta[name="author"]')
+        if meta_author:
+            return meta_author
 
         # Try common selectors
         for selector in self.AUTHOR_SELECTORS:
-            element = soup.select_one(selector)
+            element = tree.css_first(selector)
             if element:
-                if element.name == "meta":
-                    content = element.get("content", "")
-                    if isinstance(content, str):
+                if element.tag == "meta":
+                    content = element.attributes.get("content")
+                    if content is not None:
                         return content.strip()
                     continue
-                text = element.get_text(strip=True)
+                text = element.text(strip=True)
                 if text:
                     # Clean up common prefixes
-                    text = re.sub(r"^(by|author:?)\s*", "", text, flags=re.IGNORECASE)
+                    text = self.AUTHOR_PREFIX_PATTERN.sub("", text)
                     return text
 
         # Fallback to domain
-        return urlparse(url).netloc
+        return _parse_url(url).netloc
 
-    def _extract_date(self, soup: BeautifulSoup) -> datetime | None:
+    def _extract_date(self, tree: LexborHTMLParser) -> datetime | None:
         """Extract publication date from HTML."""
         # Try meta tags
-        meta_date = soup.find("meta", property="article:published_time")
-        if meta_date and meta_date.get("content"):
-            return self._parse_date(meta_date["content"])
+        meta_date = self._meta_content(tree, 'meta[property="article:published_time"]')
+        if meta_date:
+            return self._parse_date(meta_date)
 
         # Try <time> element
-        time_elem = soup.find("time")
+        time_elem = tree.css_first("time")
         if time_elem:
-            datetime_attr = time_elem.get("datetime")
-            if isinstance(datetime_attr, str):
+            datetime_attr = time_elem.attributes.get("datetime")
+            if datetime_attr is not None:
                 return self._parse_date(datetime_attr)
-            return self._parse_date(time_elem.get_text(strip=True))
+            return self._parse_date(time_elem.text(strip=True))
 
         # Try common selectors
         for selector in self.DATE_SELECTORS:
-            element = soup.select_one(selector)
+            element = tree.css_first(selector)
             if element:
-                content = element.get("content")
-                text = content if isinstance(content, str) else element.get_text(strip=True)
+                content = element.attributes.get("content")
+                text = content if content is not None else element.text(strip=True)
                 if text:
                     parsed = self._parse_date(text)
                     if parsed:
@@ -226,22 +325,18 @@ class WebArticleSource(ContentSource):
         if not date_str:
             return None
 
-        # Common date formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d",
-            "%B %d, %Y",
-            "%b %d, %Y",
-            "%d %B %Y",
-            "%d %b %Y",
-        ]
-
         # Clean the string
         date_str = date_str.strip()
 
-        for fmt in formats:
+        # Meta tags and <time datetime> carry ISO 8601, which fromisoformat
+        # parses directly (including a trailing Z)
+        if date_str[:1].isdigit():
+            try:
+                return datetime.fromisoformat(date_str)
+            except ValueError:
+                pass
+
+        for fmt in self.HUMAN_DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
@@ -249,45 +344,50 @@ class WebArticleSource(ContentSource):
 
         return None
 
-    def _extract_content(self, soup: BeautifulSoup) -> str:
-        """Extract article content as HTML."""
-        # Remove unwanted elements
-        for tag in soup.find_all(["script", "style", "nav", "header", "footer", "aside"]):
-            tag.decompose()
+    @staticmethod
+    def _meta_content(tree: LexborHTMLParser, selector: str) -> str:
+        """Get the stripped content attribute of the first matching meta tag."""
+        meta = tree.css_first(selector)
+        if meta is None:
+            return ""
+        return (meta.attributes.get("content") or "").strip()
 
-        # Remove common non-content elements
-        for selector in [".comments", ".sidebar", ".advertisement", ".ad", ".share"]:
-            for elem in soup.select(selector):
-                elem.decompose()
+    def _extract_content(self, tree: LexborHTMLParser) -> str:
+        """Extract article content as HTML."""
+        # Remove unwanted elements and empty paragraphs in a single tree walk
+        for node in tree.css(self.PRUNE_SELECTOR):
+            if node.tag == "p" and node.text(strip=True):
+                continue
+            node.decompose()
 
         # Try content selectors
         for selector in self.CONTENT_SELECTORS:
-            content = soup.select_one(selector)
-            if content:
-                # Clean up the content
+            content = tree.css_first(selector)
+            # Reading the text is far cheaper than serializing and cleaning
+            # the HTML, so rule out near-empty candidates on text alone
+            if content and len(content.text()) > self.MIN_CONTENT_LENGTH:
                 html = self._clean_content(content)
-                if html and len(html) > 100:  # Minimum content length
+                if len(html) > self.MIN_CONTENT_LENGTH:
                     return html
 
         # Fallback: try to get body content
-        body = soup.find("body")
+        body = tree.body
         if body:
             return self._clean_content(body)
 
         return ""
 
-    def _clean_content(self, element) -> str:
-        """Clean up extracted content HTML."""
-        # Remove empty paragraphs
-        for p in element.find_all("p"):
-            if not p.get_text(strip=True):
-                p.decompose()
+    def _clean_content(self, element: LexborNode) -> str:
+        """Clean up extracted content HTML.
 
+        Empty paragraphs are already pruned by _extract_content.
+        """
         # Get the HTML
-        html = str(element)
+        html = element.html or ""
 
-        # Basic cleanup
-        html = re.sub(r"\s+", " ", html)
-        html = re.sub(r">\s+<", "><", html)
+        # Basic cleanup: once whitespace runs are collapsed to a single space,
+        # whitespace between tags is exactly "> <"
+        html = self.WHITESPACE_PATTERN.sub(" ", html)
+        html = html.replace("> <", "><")
 
         return html.strip()
@@ -5,7 +5,6 @@ Version is read from pyproject.toml (single source of truth).
 
 import os
 import re
-import subprocess
 from functools import lru_cache
 from pathlib import Path
 
@@ -34,6 +33,57 @@ def _get_version() -> str:
 __version__ = _get_version()
 
 
+def _read_git_commit(start: Path) -> str | None:
+    """Resolve HEAD of the git checkout containing start from its files.
+
+    Reads .git/HEAD and follows a symbolic ref to its loose file or to
+    packed-refs, so no git process is spawned. Linked worktrees keep HEAD in
+    their own git dir and branch refs in the main repository's, named by the
+    commondir file.
+
+    Args:
+        start: Path inside the checkout.
+
+    Returns:
+        Full commit hash, or None if start is not in a git checkout.
+    """
+    for parent in start.parents:
+        git_dir = parent / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return None
+
+    # Worktrees and submodules have a .git file pointing at the real git dir
+    if git_dir.is_file():
+        git_dir = parent / git_dir.read_text().removeprefix("gitdir:").strip()
+
+    # Shared refs of a linked worktree live in the main git dir
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.exists():
+        common_dir = git_dir / commondir_file.read_text().strip()
+
+    head = (git_dir / "HEAD").read_text().strip()
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD is already a commit hash
+
+    ref = head[5:]
+    for ref_dir in dict.fromkeys((git_dir, common_dir)):
+        ref_file = ref_dir / ref
+        if ref_file.exists():
+            return ref_file.read_text().strip()
+
+    # Refs git has packed live in packed-refs as "<hash> <ref>" lines
+    packed = common_dir / "packed-refs"
+    if packed.exists():
+        for line in packed.read_text().splitlines():
+            commit, _, name = line.partition(" ")
+            if name == ref:
+                return commit
+    return None
+
+
 @lru_cache(maxsize=1)
 def get_git_commit() -> str:
     """Get the git commit hash.
@@ -46,21 +96,13 @@ def get_git_commit() -> str:
     if commit:
         return commit[:8]
 
-    # Try to get from git (works in development)
+    # Read it from the checkout (works in development)
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-            cwd=os.path.dirname(os.path.abspath(__file__)),
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()[:8]
-    except (subprocess.SubprocessError, FileNotFoundError, OSError):
-        pass
+        commit = _read_git_commit(Path(__file__).resolve())
+    except OSError:
+        commit = None
 
-    return "unknown"
+    return commit[:8] if commit else "unknown"
 
 
 def get_version_string() -> str:
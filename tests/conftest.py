@@ -3,6 +3,21 @@
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def orjson_decoder():
+    """Decode JSON bodies with orjson for the whole test run.
+
+    Response.get_json() and request.get_json() both go through
+    flask.json.loads; orjson is already a dependency (it renders the logs).
+    """
+    import flask.json
+    import orjson
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(flask.json, "loads", orjson.loads)
+        yield
+
+
 @pytest.fixture
 def sample_article():
     """Create a sample Article for testing."""
@@ -21,12 +36,19 @@ def sample_article():
 
 
 @pytest.fixture
-def app():
-    """Create Flask test application."""
+def app(tmp_path, monkeypatch):
+    """Create Flask test application writing to a per-test temp directory.
+
+    tmp_path is unique per test and per xdist worker, so tests that convert
+    or save files can run in parallel (pytest -n auto) without sharing the
+    default output and config directories.
+    """
+    monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
+
     from twitter_articlenator.app import create_app
 
-    app = create_app(test_config={"TESTING": True})
-    yield app
+    return create_app(test_config={"TESTING": True})
 
 
 @pytest.fixture
@@ -1,36 +1,133 @@
 """Playwright fixtures for E2E tests."""
 
+import multiprocessing
 import os
+import shutil
 import socket
 import subprocess
 import sys
+import tempfile
 import time
-from contextlib import closing
+from pathlib import Path
 
 import pytest
 
+# Chromium shared by all xdist workers over CDP, started on the controller
+_shared_chromium = pytest.StashKey[tuple[subprocess.Popen, Path]]()
+
+# Seconds to wait for the shared Chromium to publish its DevTools port
+CHROMIUM_START_TIMEOUT = 15.0
 
-def find_free_port():
-    """Find a free port to run the server on."""
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(("", 0))
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
+# Seconds to wait for the spawned server to import the app and bind
+SERVER_START_TIMEOUT = 30.0
 
 
 def wait_for_server(port: int, timeout: float = 10.0) -> bool:
-    """Wait for server to be ready."""
-    start = time.time()
-    while time.time() - start < timeout:
+    """Wait for server to be ready, polling with exponential backoff."""
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    while time.monotonic() < deadline:
         try:
-            with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-                s.connect(("127.0.0.1", port))
+            with socket.create_connection(("127.0.0.1", port), timeout=0.25):
                 return True
-        except (ConnectionRefusedError, OSError):
-            time.sleep(0.1)
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
     return False
 
 
+def _launch_cdp_chromium(headed: bool) -> tuple[subprocess.Popen, Path, str]:
+    """Launch Playwright's Chromium with remote debugging on a free port.
+
+    Returns:
+        The Chromium process, its profile directory and the CDP endpoint URL.
+    """
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        executable = playwright.chromium.executable_path
+
+    profile_dir = Path(tempfile.mkdtemp(prefix="e2e-chromium-"))
+    args = [
+        executable,
+        "--remote-debugging-port=0",
+        f"--user-data-dir={profile_dir}",
+        "--no-first-run",
+        "--no-default-browser-check",
+    ]
+    if not headed:
+        args.append("--headless=new")
+    proc = subprocess.Popen(
+        [*args, "about:blank"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    # Chromium writes the port it bound to DevToolsActivePort once listening
+    port_file = profile_dir / "DevToolsActivePort"
+    deadline = time.monotonic() + CHROMIUM_START_TIMEOUT
+    while time.monotonic() < deadline and proc.poll() is None:
+        if port_file.exists():
+            port = port_file.read_text().split("\n", 1)[0].strip()
+            if port:
+                return proc, profile_dir, f"http://127.0.0.1:{port}"
+        time.sleep(0.05)
+
+    proc.kill()
+    shutil.rmtree(profile_dir, ignore_errors=True)
+    raise RuntimeError("Shared Chromium did not start")
+
+
+def pytest_configure(config):
+    """Start one Chromium for all xdist workers when running E2E tests in parallel."""
+    is_controller = not hasattr(config, "workerinput")
+    parallel = getattr(config.option, "numprocesses", None)
+    browsers = getattr(config.option, "browser", None) or ["chromium"]
+    if is_controller and parallel and browsers == ["chromium"]:
+        try:
+            proc, profile_dir, endpoint = _launch_cdp_chromium(config.getoption("headed", False))
+        except (OSError, RuntimeError):
+            # Workers fall back to launching their own browsers
+            return
+        config.stash[_shared_chromium] = (proc, profile_dir)
+        config.option.cdp_endpoint = endpoint
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the shared Chromium's CDP endpoint to each xdist worker."""
+    endpoint = getattr(node.config.option, "cdp_endpoint", None)
+    if endpoint:
+        node.workerinput["cdp_endpoint"] = endpoint
+
+
+def pytest_unconfigure(config):
+    """Stop the shared Chromium once every worker has finished."""
+    shared = config.stash.get(_shared_chromium, None)
+    if shared:
+        proc, profile_dir = shared
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def browser(pytestconfig, playwright, launch_browser):
+    """Browser for the session: the shared Chromium under xdist, else a local launch.
+
+    Each test still gets its own context from pytest-playwright, so cookies
+    and localStorage stay isolated either way.
+    """
+    endpoint = getattr(pytestconfig, "workerinput", {}).get("cdp_endpoint")
+    if endpoint:
+        browser = playwright.chromium.connect_over_cdp(endpoint)
+    else:
+        browser = launch_browser()
+    yield browser
+    browser.close()
+
+
 def create_fake_youtube_downloader(path, log_path):
     """Create a deterministic yt-dlp stand-in for YouTube E2E tests."""
     path.write_text(
@@ -157,11 +254,37 @@ if partial_fail:
     path.chmod(0o755)
 
 
+def _run_server(env: dict[str, str], log_path: str, port_conn) -> None:
+    """Run the Flask app in a spawned process with the given environment.
+
+    The server binds port 0 and sends the port it got back through
+    port_conn, so parallel xdist workers never race for the same port.
+    """
+    os.environ.clear()
+    os.environ.update(env)
+
+    # Send the server's output to a file the fixture reports on failure
+    log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(log_fd, sys.stdout.fileno())
+    os.dup2(log_fd, sys.stderr.fileno())
+
+    from werkzeug.serving import make_server
+
+    from twitter_articlenator.app import create_app
+
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True)
+    port_conn.send(server.port)
+    port_conn.close()
+    server.serve_forever()
+
+
 @pytest.fixture(scope="session")
 def flask_server(tmp_path_factory):
-    """Start Flask server for E2E tests."""
-    port = find_free_port()
+    """Start Flask server for E2E tests.
 
+    Session-scoped, so under pytest-xdist each worker runs its own server
+    with its own output and config directories.
+    """
     # Create temp directories for this test session
     tmp_dir = tmp_path_factory.mktemp("e2e")
     output_dir = tmp_dir / "output"
@@ -174,8 +297,6 @@ def flask_server(tmp_path_factory):
     env = os.environ.copy()
     env["TWITTER_ARTICLENATOR_OUTPUT_DIR"] = str(output_dir)
     env["TWITTER_ARTICLENATOR_JSON_LOGGING"] = "false"
-    env["FLASK_APP"] = "twitter_articlenator.app:create_app"
-    env["FLASK_RUN_PORT"] = str(port)
     env["TWITTER_ARTICLENATOR_YOUTUBE_TIMEOUT"] = "30"
     env["TWITTER_ARTICLENATOR_COOKIE_ENCRYPTION_KEY"] = (
         "AAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8="
@@ -193,31 +314,22 @@ def flask_server(tmp_path_factory):
         env["TWITTER_ARTICLENATOR_YOUTUBE_DOWNLOADER"] = str(fake_ytdlp)
         env["TWITTER_ARTICLENATOR_YOUTUBE_FAKE_LOG"] = str(fake_ytdlp_log)
 
-    # Start Flask in a subprocess
-    proc = subprocess.Popen(
-        [
-            sys.executable,
-            "-c",
-            f"""
-import os
-os.environ['TWITTER_ARTICLENATOR_OUTPUT_DIR'] = '{output_dir}'
-os.environ['TWITTER_ARTICLENATOR_JSON_LOGGING'] = 'false'
-
-from twitter_articlenator.app import create_app
-app = create_app()
-app.run(host='127.0.0.1', port={port}, debug=False, use_reloader=False)
-""",
-        ],
-        env=env,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
-
-    # Wait for server to start
-    if not wait_for_server(port):
+    # Start Flask in a fresh interpreter; spawn rather than fork so no
+    # state from the test process (threads, event loops) leaks into it
+    server_log = tmp_dir / "server.log"
+    ctx = multiprocessing.get_context("spawn")
+    port_reader, port_writer = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_run_server, args=(env, str(server_log), port_writer), daemon=True)
+    proc.start()
+    port_writer.close()
+
+    # Wait for the server to report its port and accept connections
+    port = port_reader.recv() if port_reader.poll(SERVER_START_TIMEOUT) else None
+    if port is None or not wait_for_server(port):
         proc.terminate()
-        stdout, stderr = proc.communicate(timeout=5)
-        pytest.fail(f"Server failed to start. stdout: {stdout.decode()}, stderr: {stderr.decode()}")
+        proc.join(5)
+        output = server_log.read_text() if server_log.exists() else ""
+        pytest.fail(f"Server failed to start (exit code {proc.exitcode}). Output: {output}")
 
     yield {
         "port": port,
@@ -228,10 +340,10 @@ app.run(host='127.0.0.1', port={port}, debug=False, use_reloader=False)
 
     # Cleanup
     proc.terminate()
-    try:
-        proc.wait(timeout=5)
-    except subprocess.TimeoutExpired:
+    proc.join(5)
+    if proc.is_alive():
         proc.kill()
+        proc.join()
 
 
 @pytest.fixture(scope="session")
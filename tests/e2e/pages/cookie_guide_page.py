@@ -9,7 +9,7 @@ class CookieGuidePage:
         self.page = page
         self.cookie_input = page.locator("#cookie-input-traditional")
         self.devtools_cookie_input = page.locator("#cookie-input-devtools")
-        self.save_button = page.locator("#cookie-form-traditional .save-btn")
+        self.save_button = page.get_by_test_id("save-traditional")
         self.success_message = page.locator("#save-success")
         self.error_message = page.locator("#save-error")
 
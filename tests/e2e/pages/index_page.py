@@ -10,7 +10,7 @@ class IndexPage:
         self.links_textarea = page.locator("#links-input")
         self.convert_button = page.locator("#convert-btn")
         self.results_section = page.locator("#results")
-        self.setup_link = page.locator("a[href='/setup']").first
+        self.setup_link = page.get_by_test_id("nav-setup-link")
 
     def navigate(self, base_url: str = "http://localhost:5000"):
         """Navigate to the index page."""
@@ -30,12 +30,10 @@ class TestArticleWithImages:
         Uses a real Twitter article URL that contains inline images.
         Verifies the resulting PDF is large enough to contain image data.
         """
-        # Set up cookies in localStorage
-        page.goto(base_url)
-        page.evaluate(f"localStorage.setItem('{COOKIES_KEY}', `{TEST_COOKIES}`)")
-        page.reload()
-
+        # Set up cookies in localStorage before the page's scripts run
+        page.add_init_script(f"localStorage.setItem('{COOKIES_KEY}', `{TEST_COOKIES}`)")
         index = IndexPage(page)
+        index.navigate(base_url)
 
         # Enter the article URL
         index.enter_links([TEST_ARTICLE_URL])
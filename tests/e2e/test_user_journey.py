@@ -1,11 +1,24 @@
 """E2E tests for complete user journeys."""
 
+import pytest
 from playwright.sync_api import Page, expect
 
 from .pages import CookieGuidePage, IndexPage
 
 COOKIES_KEY = "articlenator_cookies"
 
+# Expect timeout (ms) for these tests; their UI updates land within a few
+# hundred ms, so a failing assertion should not sit out the 5s default
+UI_EXPECT_TIMEOUT = 2000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def short_expect_timeout():
+    """Lower the expect() timeout for this module, restoring the default after."""
+    expect.set_options(timeout=UI_EXPECT_TIMEOUT)
+    yield
+    expect.set_options(timeout=None)
+
 
 class TestIndexPage:
     """Tests for the index page."""
@@ -51,8 +64,8 @@ class TestSetupPage:
         page.goto(f"{base_url}/setup")
 
         # Should have DevTools instructions
-        expect(page.locator("text=Developer Tools").first).to_be_visible()
-        expect(page.locator("text=auth_token").first).to_be_visible()
+        expect(page.get_by_test_id("devtools-instruction")).to_be_visible()
+        expect(page.get_by_test_id("auth-token-hint")).to_be_visible()
 
     def test_setup_has_cookie_form(self, page: Page, base_url):
         """Test setup page has cookie input form."""
@@ -98,7 +111,7 @@ class TestCookieSaving:
         guide.click_save()
 
         # Wait for success message
-        expect(guide.success_message).to_be_visible(timeout=5000)
+        expect(guide.success_message).to_be_visible()
 
         # Verify cookies were saved to localStorage
         stored = page.evaluate(f"localStorage.getItem('{COOKIES_KEY}')")
@@ -114,7 +127,7 @@ class TestCookieSaving:
         guide.click_save()
 
         # Should show error
-        expect(guide.error_message).to_be_visible(timeout=5000)
+        expect(guide.error_message).to_be_visible()
 
 
 class TestConversionFlow:
@@ -122,12 +135,9 @@ class TestConversionFlow:
 
     def test_convert_without_cookies_shows_error(self, page: Page, base_url):
         """Test converting without cookies shows setup prompt."""
-        # Ensure no cookies in localStorage
-        page.goto(base_url)
-        page.evaluate(f"localStorage.removeItem('{COOKIES_KEY}')")
-        page.reload()
-
+        # Each test gets a fresh context, so localStorage starts out empty
         index = IndexPage(page)
+        index.navigate(base_url)
 
         # Enter a valid Twitter URL
         index.enter_links(["https://x.com/testuser/status/123456789"])
@@ -135,23 +145,25 @@ class TestConversionFlow:
 
         # Should show error about missing cookies
         error_div = page.locator("#error")
-        expect(error_div).to_be_visible(timeout=5000)
+        expect(error_div).to_be_visible()
         expect(error_div).to_contain_text("cookie")
 
     def test_convert_with_invalid_url_shows_error(self, page: Page, base_url):
         """Test converting invalid URL shows error."""
-        # Set cookies in localStorage
-        page.goto(base_url)
-        page.evaluate(
+        # Seed cookies in localStorage before the page's scripts run, so a
+        # single navigation reaches the logged-in state
+        page.add_init_script(
             f"localStorage.setItem('{COOKIES_KEY}', 'auth_token=test12345678901234567890; ct0=test12345678901234567890')"
         )
-        page.reload()
-
         index = IndexPage(page)
+        index.navigate(base_url)
 
         # Enter an unsupported URL shape
         index.enter_links(["not-a-url"])
-        index.click_convert()
+        # The error depends on the backend, so wait for its reply rather than
+        # polling the DOM from the moment of the click
+        with page.expect_response(lambda r: "/api/convert/stream" in r.url):
+            index.click_convert()
 
         # Should show error about failed conversion
         error_div = page.locator("#error")
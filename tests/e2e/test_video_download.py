@@ -51,11 +51,9 @@ class TestVideosPage:
 
     def test_download_without_cookies_starts_processing(self, page: Page, base_url):
         """Test downloading without cookies still starts processing (yt-dlp handles it)."""
-        page.goto(f"{base_url}/videos")
-        page.evaluate(f"localStorage.removeItem('{COOKIES_KEY}')")
-        page.reload()
-
+        # Each test gets a fresh context, so localStorage starts out empty
         videos = VideosPage(page)
+        videos.navigate(base_url)
         videos.enter_links([TEST_VIDEO_URL])
         videos.click_download()
 
@@ -64,14 +62,13 @@ class TestVideosPage:
 
     def test_download_with_empty_links_shows_error(self, page: Page, base_url):
         """Test downloading with empty links shows error."""
-        page.goto(f"{base_url}/videos")
-        page.evaluate(
+        # Seed cookies before the page's scripts run, so one navigation is enough
+        page.add_init_script(
             f"localStorage.setItem('{COOKIES_KEY}', "
             f"'auth_token=test12345678901234567890; ct0=test12345678901234567890')"
         )
-        page.reload()
-
         videos = VideosPage(page)
+        videos.navigate(base_url)
         videos.click_download()
 
         expect(videos.error_div).to_be_visible(timeout=5000)
@@ -94,12 +91,10 @@ class TestVideoDownloadWorkflow:
 
     def test_download_single_video(self, page: Page, base_url, output_dir):
         """Test downloading a single video from Twitter/X end-to-end."""
-        # Set up cookies
-        page.goto(f"{base_url}/videos")
-        page.evaluate(f"localStorage.setItem('{COOKIES_KEY}', `{TEST_COOKIES}`)")
-        page.reload()
-
+        # Set up cookies before the page's scripts run
+        page.add_init_script(f"localStorage.setItem('{COOKIES_KEY}', `{TEST_COOKIES}`)")
         videos = VideosPage(page)
+        videos.navigate(base_url)
 
         # Enter the video link
         videos.enter_links([TEST_VIDEO_URL])
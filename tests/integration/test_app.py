@@ -1,6 +1,5 @@
 """Integration tests for Flask application."""
 
-import json
 import re
 from urllib.parse import parse_qs, urlparse
 
@@ -11,11 +10,21 @@ SAMPLE_YOUTUBE_COOKIES = (
     ".youtube.com\tTRUE\t/\tTRUE\t0\tSID\tsecret-session-value\n"
 )
 
-
-@pytest.fixture
-def app(tmp_path, monkeypatch):
-    """Create Flask test application with temp directories."""
-    monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "output"))
+# Case-insensitive checks run straight on response bytes (no decode/lower)
+FORM_PATTERN = re.compile(rb"<form", re.IGNORECASE)
+LINKS_PATTERN = re.compile(rb"links|url", re.IGNORECASE)
+TEXT_INPUT_PATTERN = re.compile(rb"<(?:textarea|input)", re.IGNORECASE)
+SUBMIT_PATTERN = re.compile(rb"submit|convert", re.IGNORECASE)
+COOKIE_PATTERN = re.compile(rb"cookie", re.IGNORECASE)
+BROWSER_PATTERN = re.compile(rb"chrome|firefox|safari|browser", re.IGNORECASE)
+FETCH_PATTERN = re.compile(rb"fetch", re.IGNORECASE)
+CONVERT_PATTERN = re.compile(rb"convert", re.IGNORECASE)
+CSRF_TOKEN_PATTERN = re.compile(rb'<meta name="csrf-token" content="([^"]+)">')
+
+
+def _set_app_env(monkeypatch, output_dir) -> None:
+    """Point the app at a temp output dir with test-safe settings."""
+    monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(output_dir))
     monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
     monkeypatch.setenv(
         "TWITTER_ARTICLENATOR_COOKIE_ENCRYPTION_KEY",
@@ -30,15 +39,51 @@ def app(tmp_path, monkeypatch):
     ):
         monkeypatch.delenv(key, raising=False)
 
-    import twitter_articlenator.config as config_module
 
-    config_module._config_instance = None
+@pytest.fixture(scope="module")
+def readonly_app(tmp_path_factory):
+    """Create one Flask app shared by tests that only read pages and headers.
+
+    Module-scoped so its env vars stay in place for every test in this file;
+    function-scoped app fixtures patch over them and restore them afterwards.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _set_app_env(monkeypatch, tmp_path_factory.mktemp("readonly") / "output")
+
+        from twitter_articlenator.app import create_app
+
+        yield create_app(test_config={"TESTING": True})
+
 
-    from twitter_articlenator.app import create_app
+@pytest.fixture
+def readonly_client(readonly_app):
+    """Create a test client for the shared read-only app."""
+    return readonly_app.test_client()
+
+
+@pytest.fixture(scope="module")
+def shared_app(tmp_path_factory):
+    """Create one Flask app reused by tests that write files or change config.
+
+    The app fixture reloads its config for each test, so tests share the app
+    object (routes, templates, hooks) but not output or config directories.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _set_app_env(monkeypatch, tmp_path_factory.mktemp("shared") / "output")
+
+        from twitter_articlenator.app import create_app
 
-    app = create_app(test_config={"TESTING": True})
-    yield app
-    config_module._config_instance = None
+        yield create_app(test_config={"TESTING": True})
+
+
+@pytest.fixture
+def app(shared_app, tmp_path, monkeypatch):
+    """Point the shared app at this test's temp directories."""
+    from twitter_articlenator.config import init_app
+
+    _set_app_env(monkeypatch, tmp_path / "output")
+    init_app(shared_app)
+    return shared_app
 
 
 @pytest.fixture
@@ -50,136 +95,136 @@ def client(app):
 def csrf_headers(client) -> dict[str, str]:
     """Return headers with the current session CSRF token."""
     response = client.get("/youtube")
-    html = response.get_data(as_text=True)
-    token = re.search(r'<meta name="csrf-token" content="([^"]+)">', html).group(1)
+    token = CSRF_TOKEN_PATTERN.search(response.data).group(1).decode()
     return {"X-CSRF-Token": token}
 
 
-def reset_config_singleton() -> None:
-    """Reset the app config singleton after changing env vars."""
-    import twitter_articlenator.config as config_module
+def reload_app_config(client) -> None:
+    """Reload the client's app config after changing env vars mid-test."""
+    from twitter_articlenator.config import init_app
+
+    init_app(client.application)
+
 
-    config_module._config_instance = None
+@pytest.fixture(scope="module")
+def page_responses(readonly_app):
+    """Render each page route once for the page content and header assertions."""
+    client = readonly_app.test_client()
+    return {path: client.get(path) for path in ("/", "/setup", "/bookmarks", "/youtube")}
 
 
 class TestIndexRoute:
     """Tests for GET / route."""
 
-    def test_index_returns_200(self, client):
+    def test_index_returns_200(self, page_responses):
         """Test GET / returns 200."""
-        response = client.get("/")
+        response = page_responses["/"]
         assert response.status_code == 200
 
-    def test_index_contains_form(self, client):
+    def test_index_contains_form(self, page_responses):
         """Test index page contains link input form."""
-        response = client.get("/")
-        html = response.data.decode("utf-8")
+        response = page_responses["/"]
 
-        assert "<form" in html.lower()
-        assert "links" in html.lower() or "url" in html.lower()
+        assert FORM_PATTERN.search(response.data)
+        assert LINKS_PATTERN.search(response.data)
 
-    def test_index_contains_textarea(self, client):
+    def test_index_contains_textarea(self, page_responses):
         """Test index page has textarea for multiple links."""
-        response = client.get("/")
-        html = response.data.decode("utf-8")
+        response = page_responses["/"]
+        assert TEXT_INPUT_PATTERN.search(response.data)
 
-        assert "<textarea" in html.lower() or "<input" in html.lower()
-
-    def test_index_has_submit_button(self, client):
+    def test_index_has_submit_button(self, page_responses):
         """Test index page has submit button."""
-        response = client.get("/")
-        html = response.data.decode("utf-8")
-
-        assert "submit" in html.lower() or "convert" in html.lower()
+        response = page_responses["/"]
+        assert SUBMIT_PATTERN.search(response.data)
 
 
 class TestSetupRoute:
     """Tests for GET /setup route."""
 
-    def test_setup_returns_200(self, client):
+    def test_setup_returns_200(self, page_responses):
         """Test GET /setup returns 200."""
-        response = client.get("/setup")
+        response = page_responses["/setup"]
         assert response.status_code == 200
 
-    def test_setup_contains_instructions(self, client):
+    def test_setup_contains_instructions(self, page_responses):
         """Test setup page contains cookie instructions."""
-        response = client.get("/setup")
-        html = response.data.decode("utf-8")
-
-        assert "cookie" in html.lower()
+        response = page_responses["/setup"]
+        assert COOKIE_PATTERN.search(response.data)
 
-    def test_setup_mentions_browser(self, client):
+    def test_setup_mentions_browser(self, page_responses):
         """Test setup page mentions browser."""
-        response = client.get("/setup")
-        html = response.data.decode("utf-8")
+        response = page_responses["/setup"]
+        assert BROWSER_PATTERN.search(response.data)
 
-        browsers = ["chrome", "firefox", "safari", "browser"]
-        assert any(browser in html.lower() for browser in browsers)
-
-    def test_setup_has_form_for_cookies(self, client):
+    def test_setup_has_form_for_cookies(self, page_responses):
         """Test setup page has form to submit cookies."""
-        response = client.get("/setup")
-        html = response.data.decode("utf-8")
-
-        assert "<form" in html.lower()
+        response = page_responses["/setup"]
+        assert FORM_PATTERN.search(response.data)
 
 
 class TestBookmarksRoute:
     """Tests for GET /bookmarks route."""
 
-    def test_bookmarks_returns_200(self, client):
+    def test_bookmarks_returns_200(self, page_responses):
         """Test GET /bookmarks returns 200."""
-        response = client.get("/bookmarks")
+        response = page_responses["/bookmarks"]
         assert response.status_code == 200
 
-    def test_bookmarks_contains_fetch_button(self, client):
+    def test_bookmarks_contains_fetch_button(self, page_responses):
         """Test bookmarks page has fetch button."""
-        response = client.get("/bookmarks")
-        html = response.data.decode("utf-8")
-        assert "fetch" in html.lower()
+        response = page_responses["/bookmarks"]
+        assert FETCH_PATTERN.search(response.data)
 
-    def test_bookmarks_contains_convert_button(self, client):
+    def test_bookmarks_contains_convert_button(self, page_responses):
         """Test bookmarks page has convert button."""
-        response = client.get("/bookmarks")
-        html = response.data.decode("utf-8")
-        assert "convert" in html.lower()
+        response = page_responses["/bookmarks"]
+        assert CONVERT_PATTERN.search(response.data)
 
 
 class TestYouTubeRoute:
     """Tests for GET /youtube route."""
 
-    def test_youtube_returns_200(self, client):
+    def test_youtube_returns_200(self, page_responses):
         """Test GET /youtube returns 200."""
-        response = client.get("/youtube")
+        response = page_responses["/youtube"]
         assert response.status_code == 200
 
-    def test_youtube_contains_download_form(self, client):
+    def test_youtube_contains_download_form(self, page_responses):
         """Test YouTube page has expected form controls."""
-        response = client.get("/youtube")
-        html = response.data.decode("utf-8")
+        response = page_responses["/youtube"]
+
+        assert b"youtube-download-form" in response.data
+        assert b"youtube-links-input" in response.data
+        assert b"mode-mp3" in response.data
 
-        assert "youtube-download-form" in html
-        assert "youtube-links-input" in html
-        assert "mode-mp3" in html
+
+@pytest.fixture(scope="module")
+def health_response(readonly_app):
+    """Fetch /api/health once for the health and header assertions."""
+    return readonly_app.test_client().get("/api/health")
+
+
+@pytest.fixture(scope="module")
+def index_response(page_responses):
+    """Share the rendered / page with the header assertions on HTML pages."""
+    return page_responses["/"]
 
 
 class TestHealthRoute:
     """Tests for GET /api/health route."""
 
-    def test_health_returns_200(self, client):
+    def test_health_returns_200(self, health_response):
         """Test GET /api/health returns 200."""
-        response = client.get("/api/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
 
-    def test_health_returns_json(self, client):
+    def test_health_returns_json(self, health_response):
         """Test health endpoint returns JSON."""
-        response = client.get("/api/health")
-        assert response.content_type == "application/json"
+        assert health_response.content_type == "application/json"
 
-    def test_health_contains_status(self, client):
+    def test_health_contains_status(self, health_response):
         """Test health response contains status field."""
-        response = client.get("/api/health")
-        data = json.loads(response.data)
+        data = health_response.get_json()
 
         assert "status" in data
         assert data["status"] == "ok"
@@ -188,25 +233,31 @@ class TestHealthRoute:
 class TestConvertRoute:
     """Tests for POST /api/convert route."""
 
-    def test_convert_requires_links(self, client):
-        """Test POST /api/convert requires links parameter."""
-        response = client.post("/api/convert", json={})
-        assert response.status_code == 400
-
-    def test_convert_rejects_empty_links(self, client):
-        """Test /api/convert rejects empty links list."""
-        response = client.post("/api/convert", json={"links": []})
-        assert response.status_code == 400
+    @pytest.mark.parametrize(
+        "request_kwargs",
+        [
+            pytest.param({"json": {}}, id="missing-links"),
+            pytest.param({"json": {"links": []}}, id="empty-links"),
+            pytest.param({"json": {"links": ["ftp://invalid-protocol.com/file"]}}, id="bad-scheme"),
+            pytest.param(
+                {"data": {"links": "\n  \n"}, "content_type": "application/x-www-form-urlencoded"},
+                id="blank-form-links",
+            ),
+        ],
+    )
+    def test_convert_rejects_bad_input(self, readonly_client, request_kwargs):
+        """Test /api/convert rejects missing, empty, or unsupported links.
 
-    def test_convert_validates_urls(self, client):
-        """Test /api/convert validates URLs."""
-        response = client.post("/api/convert", json={"links": ["ftp://invalid-protocol.com/file"]})
+        Bad input is rejected before anything is written, so the shared
+        read-only app is safe to use.
+        """
+        response = readonly_client.post("/api/convert", **request_kwargs)
         assert response.status_code == 400
 
     def test_convert_accepts_valid_twitter_url(self, client):
         """Test /api/convert accepts valid Twitter URL format."""
         response = client.post("/api/convert", json={"links": ["https://x.com/user/status/123"]})
-        data = json.loads(response.data)
+        data = response.get_json()
         assert response.status_code in [400, 401, 500] or "cookie" in str(data).lower()
 
     def test_convert_returns_json(self, client):
@@ -224,9 +275,41 @@ class TestConvertRoute:
             },
         )
         # Should not complain about missing cookies
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "cookie" not in str(data.get("error", "")).lower() or response.status_code == 500
 
+    def test_convert_deduplicates_links(self, client, sample_article, tmp_path, monkeypatch):
+        """Test /api/convert fetches repeated URLs only once and reports the count."""
+        import twitter_articlenator.routes.api as api_module
+        from twitter_articlenator.sources.web import WebArticleSource
+
+        fetched = []
+
+        async def fake_fetch(self, url):
+            fetched.append(url)
+            return sample_article
+
+        pdf_path = tmp_path / "combined.pdf"
+        monkeypatch.setattr(WebArticleSource, "fetch", fake_fetch)
+        monkeypatch.setattr(api_module, "generate_combined_pdf", lambda articles: pdf_path)
+
+        response = client.post(
+            "/api/convert",
+            json={
+                "links": [
+                    "https://example.com/a",
+                    "https://example.com/b",
+                    "https://example.com/a",
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert fetched == ["https://example.com/a", "https://example.com/b"]
+        assert data["duplicates_removed"] == 1
+        assert data["summary"]["total"] == 2
+
 
 class TestCookiesValidateRoute:
     """Tests for POST /api/cookies/validate route."""
@@ -236,7 +319,7 @@ class TestCookiesValidateRoute:
         response = client.post("/api/cookies/validate", json={})
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert not data["valid"]
         assert data["status"] == "not_configured"
 
@@ -246,7 +329,7 @@ class TestCookiesValidateRoute:
         response = client.post("/api/cookies/validate", json={"cookies": valid_cookies})
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["valid"]
         assert data["status"] == "valid"
 
@@ -257,7 +340,7 @@ class TestCookiesValidateRoute:
         )
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert not data["valid"]
         assert data["status"] == "invalid"
 
@@ -311,9 +394,7 @@ class TestYouTubeDownloadRoute:
         (video_dir / "sample.mp4").write_bytes(b"fake mp4")
 
         monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(output_dir))
-        import twitter_articlenator.config as config_module
-
-        config_module._config_instance = None
+        reload_app_config(client)
 
         response = client.get("/download/youtube/video/sample.mp4")
         assert response.status_code == 200
@@ -327,9 +408,7 @@ class TestYouTubeDownloadRoute:
         (audio_dir / "sample.mp3").write_bytes(b"fake mp3")
 
         monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(output_dir))
-        import twitter_articlenator.config as config_module
-
-        config_module._config_instance = None
+        reload_app_config(client)
 
         response = client.get("/download/youtube/audio/sample.mp3")
         assert response.status_code == 200
@@ -403,26 +482,28 @@ class TestYouTubeCookiesApi:
         assert response.status_code == 200
         data = response.get_json()
         assert data["configured"] is False
-        assert "secret-session-value" not in response.get_data(as_text=True)
+        assert b"secret-session-value" not in response.data
 
     def test_upload_valid_cookies_and_status_is_metadata_only(self, client):
         """Test uploading valid cookies stores metadata only."""
-        response = client.post(
-            "/api/youtube/cookies",
-            data={"cookies": SAMPLE_YOUTUBE_COOKIES},
-            headers=csrf_headers(client),
-        )
+        with client as c:
+            response = c.post(
+                "/api/youtube/cookies",
+                data={"cookies": SAMPLE_YOUTUBE_COOKIES},
+                headers=csrf_headers(c),
+            )
+            status = c.get("/api/youtube/cookies/status")
+
         assert response.status_code == 200
         data = response.get_json()
         assert data["configured"] is True
         assert data["encrypted"] is True
         assert data["cookie_count"] == 1
         assert data["youtube_cookie_count"] == 1
-        assert "secret-session-value" not in response.get_data(as_text=True)
+        assert b"secret-session-value" not in response.data
 
-        status = client.get("/api/youtube/cookies/status")
         assert status.status_code == 200
-        assert "secret-session-value" not in status.get_data(as_text=True)
+        assert b"secret-session-value" not in status.data
 
     def test_upload_requires_csrf(self, client):
         """Test cookie upload requires CSRF."""
@@ -440,17 +521,19 @@ class TestYouTubeCookiesApi:
 
     def test_delete_removes_cookie_status(self, client):
         """Test delete removes stored YouTube cookies."""
-        headers = csrf_headers(client)
-        upload = client.post(
-            "/api/youtube/cookies",
-            data={"cookies": SAMPLE_YOUTUBE_COOKIES},
-            headers=headers,
-        )
-        assert upload.status_code == 200
+        from twitter_articlenator.routes.api import _get_youtube_cookie_store
+
+        # Seed the store directly; uploading is covered by its own test
+        with client.application.app_context():
+            store = _get_youtube_cookie_store()
+        store.save(SAMPLE_YOUTUBE_COOKIES)
+        assert store.is_configured()
+
+        response = client.delete("/api/youtube/cookies", headers=csrf_headers(client))
 
-        response = client.delete("/api/youtube/cookies", headers=headers)
         assert response.status_code == 200
         assert response.get_json()["configured"] is False
+        assert not store.is_configured()
 
     def test_verify_without_cookies_returns_404(self, client):
         """Test verify requires stored cookies."""
@@ -461,7 +544,7 @@ class TestYouTubeCookiesApi:
 class TestYouTubeOAuthApi:
     """Tests for YouTube OAuth liked-video API."""
 
-    def configure_youtube_oauth(self, monkeypatch, tmp_path):
+    def configure_youtube_oauth(self, client, monkeypatch, tmp_path):
         """Configure fake Google OAuth credentials for route tests."""
         monkeypatch.setenv("TWITTER_ARTICLENATOR_YOUTUBE_OAUTH_CLIENT_ID", "client-id")
         monkeypatch.setenv("TWITTER_ARTICLENATOR_YOUTUBE_OAUTH_CLIENT_SECRET", "client-secret")
@@ -474,7 +557,7 @@ class TestYouTubeOAuthApi:
             str(tmp_path / "youtube-oauth-token.json"),
         )
         monkeypatch.setenv("TWITTER_ARTICLENATOR_YOUTUBE_LIKED_MAX_RESULTS", "25")
-        reset_config_singleton()
+        reload_app_config(client)
 
     def test_oauth_status_and_start_without_client_config(self, client):
         """Test OAuth status is metadata-only and start requires credentials."""
@@ -483,14 +566,14 @@ class TestYouTubeOAuthApi:
         data = response.get_json()
         assert data["configured"] is False
         assert data["client_configured"] is False
-        assert "client-secret" not in response.get_data(as_text=True)
+        assert b"client-secret" not in response.data
 
         start = client.get("/api/youtube/oauth/start")
         assert start.status_code == 503
 
     def test_oauth_start_redirects_to_google_with_state(self, client, monkeypatch, tmp_path):
         """Test OAuth start creates a CSRF-style state and redirects to Google."""
-        self.configure_youtube_oauth(monkeypatch, tmp_path)
+        self.configure_youtube_oauth(client, monkeypatch, tmp_path)
 
         response = client.get("/api/youtube/oauth/start")
 
@@ -510,7 +593,7 @@ class TestYouTubeOAuthApi:
         self, client, monkeypatch, tmp_path
     ):
         """Test OAuth callback exchanges the code and stores encrypted token metadata only."""
-        self.configure_youtube_oauth(monkeypatch, tmp_path)
+        self.configure_youtube_oauth(client, monkeypatch, tmp_path)
 
         import twitter_articlenator.routes.api as api_module
 
@@ -524,13 +607,13 @@ class TestYouTubeOAuthApi:
                 "scope": "https://www.googleapis.com/auth/youtube.readonly",
             }
 
-        monkeypatch.setattr(api_module, "exchange_authorization_code", fake_exchange_authorization_code)
+        monkeypatch.setattr(
+            api_module, "exchange_authorization_code", fake_exchange_authorization_code
+        )
         with client.session_transaction() as session_data:
             session_data["youtube_oauth_state"] = "expected-state"
 
-        response = client.get(
-            "/api/youtube/oauth/callback?state=expected-state&code=google-code"
-        )
+        response = client.get("/api/youtube/oauth/callback?state=expected-state&code=google-code")
 
         assert response.status_code == 302
         assert response.headers["Location"].endswith("/youtube?youtube_oauth=connected")
@@ -540,12 +623,12 @@ class TestYouTubeOAuthApi:
         assert data["configured"] is True
         assert data["encrypted"] is True
         assert data["has_refresh_token"] is True
-        assert "secret-access-token" not in status.get_data(as_text=True)
-        assert "secret-refresh-token" not in status.get_data(as_text=True)
+        assert b"secret-access-token" not in status.data
+        assert b"secret-refresh-token" not in status.data
 
     def test_oauth_liked_requires_csrf(self, client, monkeypatch, tmp_path):
         """Test liked-video loading requires CSRF."""
-        self.configure_youtube_oauth(monkeypatch, tmp_path)
+        self.configure_youtube_oauth(client, monkeypatch, tmp_path)
 
         response = client.post("/api/youtube/oauth/liked", json={})
 
@@ -553,7 +636,7 @@ class TestYouTubeOAuthApi:
 
     def test_oauth_liked_returns_video_links_from_service(self, client, monkeypatch, tmp_path):
         """Test liked-video endpoint returns links fetched through the OAuth service."""
-        self.configure_youtube_oauth(monkeypatch, tmp_path)
+        self.configure_youtube_oauth(client, monkeypatch, tmp_path)
 
         import twitter_articlenator.routes.api as api_module
 
@@ -591,68 +674,56 @@ class TestYouTubeOAuthApi:
 
     def test_oauth_delete_removes_stored_token(self, client, monkeypatch, tmp_path):
         """Test OAuth disconnect removes stored token metadata."""
-        self.configure_youtube_oauth(monkeypatch, tmp_path)
+        self.configure_youtube_oauth(client, monkeypatch, tmp_path)
 
         from twitter_articlenator.routes.api import _get_youtube_oauth_store
 
-        _get_youtube_oauth_store().save_authorized_token(
-            {
-                "access_token": "secret-access-token",
-                "refresh_token": "secret-refresh-token",
-                "expires_in": 3600,
-            }
-        )
+        with client.application.app_context():
+            _get_youtube_oauth_store().save_authorized_token(
+                {
+                    "access_token": "secret-access-token",
+                    "refresh_token": "secret-refresh-token",
+                    "expires_in": 3600,
+                }
+            )
 
         response = client.delete("/api/youtube/oauth", headers=csrf_headers(client))
 
         assert response.status_code == 200
         data = response.get_json()
         assert data["configured"] is False
-        assert "secret-access-token" not in response.get_data(as_text=True)
+        assert b"secret-access-token" not in response.data
 
 
 class TestSecurityHeaders:
     """Tests for security headers on all responses."""
 
-    def test_x_content_type_options_header(self, client):
-        """Test X-Content-Type-Options header is set."""
-        response = client.get("/api/health")
-        assert response.headers.get("X-Content-Type-Options") == "nosniff"
-
-    def test_x_frame_options_header(self, client):
-        """Test X-Frame-Options header is set."""
-        response = client.get("/api/health")
-        assert response.headers.get("X-Frame-Options") == "DENY"
-
-    def test_x_xss_protection_header(self, client):
-        """Test X-XSS-Protection header is set."""
-        response = client.get("/api/health")
-        assert response.headers.get("X-XSS-Protection") == "1; mode=block"
-
-    def test_referrer_policy_header(self, client):
-        """Test Referrer-Policy header is set."""
-        response = client.get("/api/health")
-        assert response.headers.get("Referrer-Policy") == "strict-origin-when-cross-origin"
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("X-Content-Type-Options", "nosniff"),
+            ("X-Frame-Options", "DENY"),
+            ("X-XSS-Protection", "1; mode=block"),
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        ],
+    )
+    @pytest.mark.parametrize("response_fixture", ["health_response", "index_response"])
+    def test_security_header(self, request, response_fixture, header, expected):
+        """Test each fixed-value security header is set on JSON and HTML responses."""
+        response = request.getfixturevalue(response_fixture)
+        assert response.headers.get(header) == expected
 
-    def test_permissions_policy_header(self, client):
+    def test_permissions_policy_header(self, health_response):
         """Test Permissions-Policy header is set."""
-        response = client.get("/api/health")
-        assert "geolocation=()" in response.headers.get("Permissions-Policy", "")
+        assert "geolocation=()" in health_response.headers.get("Permissions-Policy", "")
 
-    def test_content_security_policy_header(self, client):
+    def test_content_security_policy_header(self, index_response):
         """Test Content-Security-Policy header is set with a script nonce."""
-        response = client.get("/")
-        csp = response.headers.get("Content-Security-Policy", "")
+        csp = index_response.headers.get("Content-Security-Policy", "")
         assert "default-src 'self'" in csp
         assert "script-src 'self' 'nonce-" in csp
         assert "frame-ancestors 'none'" in csp
 
-    def test_security_headers_on_html_pages(self, client):
-        """Test security headers are set on HTML pages too."""
-        response = client.get("/")
-        assert response.headers.get("X-Content-Type-Options") == "nosniff"
-        assert response.headers.get("X-Frame-Options") == "DENY"
-
     def test_session_cookie_flags_in_production_style_config(self, monkeypatch):
         """Test production-style session cookie settings are hardened."""
         monkeypatch.setenv("TWITTER_ARTICLENATOR_SESSION_COOKIE_SECURE", "true")
@@ -677,7 +748,7 @@ class TestFormDataHandling:
             content_type="application/x-www-form-urlencoded",
         )
         assert response.status_code in [400, 500]
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "cookie" in str(data).lower() or "error" in data
 
     def test_convert_parses_multiline_links(self, client):
@@ -697,58 +768,48 @@ class TestFormDataHandling:
             content_type="application/x-www-form-urlencoded",
         )
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["valid"]
 
 
-class TestAppFactory:
-    """Tests for create_app function."""
-
-    def test_create_app_returns_flask_app(self, tmp_path, monkeypatch):
-        """Test create_app returns Flask application."""
-        monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
+@pytest.fixture(scope="module")
+def production_app(tmp_path_factory):
+    """Build one production-mode app (no test_config) for factory checks."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _set_app_env(monkeypatch, tmp_path_factory.mktemp("factory") / "output")
 
         from twitter_articlenator.app import create_app
 
-        app = create_app(test_config={"TESTING": True})
-        assert app is not None
-        assert hasattr(app, "test_client")
+        yield create_app()
 
-    def test_create_app_configures_testing_mode(self, tmp_path, monkeypatch):
-        """Test create_app sets testing mode."""
-        monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
 
-        from twitter_articlenator.app import create_app
+class TestAppFactory:
+    """Tests for create_app function.
 
-        app = create_app(test_config={"TESTING": True})
-        assert app.config["TESTING"] is True
+    Test-mode checks reuse the module's read-only app, which is built by
+    create_app(test_config={"TESTING": True}) like any test-mode app.
+    """
 
-    def test_create_app_production_mode(self, tmp_path, monkeypatch):
-        """Test create_app works in production mode."""
-        monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
+    def test_create_app_returns_flask_app(self, readonly_app):
+        """Test create_app returns Flask application."""
+        assert readonly_app is not None
+        assert hasattr(readonly_app, "test_client")
 
-        from twitter_articlenator.app import create_app
+    def test_create_app_configures_testing_mode(self, readonly_app):
+        """Test create_app sets testing mode."""
+        assert readonly_app.config["TESTING"] is True
 
-        app = create_app()
-        assert app is not None
+    def test_create_app_production_mode(self, production_app):
+        """Test create_app works in production mode."""
+        assert production_app is not None
 
-    def test_create_app_registers_blueprints(self, tmp_path, monkeypatch):
+    def test_create_app_registers_blueprints(self, readonly_app):
         """Test create_app registers API and pages blueprints."""
-        monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
-
-        from twitter_articlenator.app import create_app
-
-        app = create_app(test_config={"TESTING": True})
-        blueprint_names = [bp.name for bp in app.blueprints.values()]
+        blueprint_names = [bp.name for bp in readonly_app.blueprints.values()]
         assert "api" in blueprint_names
         assert "pages" in blueprint_names
 
-    def test_create_app_stores_run_async(self, tmp_path, monkeypatch):
+    def test_create_app_stores_run_async(self, readonly_app):
         """Test create_app stores run_async in config."""
-        monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
-
-        from twitter_articlenator.app import create_app
-
-        app = create_app(test_config={"TESTING": True})
-        assert "RUN_ASYNC" in app.config
-        assert callable(app.config["RUN_ASYNC"])
+        assert "RUN_ASYNC" in readonly_app.config
+        assert callable(readonly_app.config["RUN_ASYNC"])
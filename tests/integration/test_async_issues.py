@@ -4,12 +4,53 @@ These tests verify that multiple sequential API calls work correctly
 with the stateless cookie validation approach.
 """
 
-import json
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 
 VALID_COOKIES = "auth_token=abcdefghijklmnopqrstuvwxyz; ct0=abcdefghijklmnopqrstuvwxyz"
 
+MOCK_TWEET_DATA = {
+    "author": "testuser",
+    "display_name": "Test User",
+    "content": "Test tweet content",
+    "timestamp": None,
+    "quoted_tweets": [],
+}
+
+
+@pytest.fixture(scope="module")
+def mocked_twitter_pool():
+    """Patch the browser pool and tweet extraction for conversion tests.
+
+    Module-scoped, so the mock tree is built and the patches started once
+    for every test that converts tweets without launching a browser.
+    """
+    mock_page = AsyncMock()
+    mock_page.context = AsyncMock()
+
+    mock_pool = MagicMock()
+
+    @asynccontextmanager
+    async def mock_get_shared_page(cookies=None, block_resources=False):
+        yield mock_page
+
+    mock_pool.get_shared_page = mock_get_shared_page
+
+    with (
+        patch(
+            "twitter_articlenator.sources.twitter_playwright.get_browser_pool",
+            return_value=mock_pool,
+        ),
+        patch(
+            "twitter_articlenator.sources.twitter_playwright.TwitterPlaywrightSource._extract_tweet_data",
+            new_callable=AsyncMock,
+            return_value=MOCK_TWEET_DATA,
+        ),
+    ):
+        yield mock_pool
+
 
 class TestAsyncEventLoopIssues:
     """Tests for event loop isolation between requests."""
@@ -20,100 +61,38 @@ class TestAsyncEventLoopIssues:
             response = client.post("/api/cookies/validate", json={"cookies": VALID_COOKIES})
             assert response.status_code == 200
 
-    def test_validate_then_convert(self, client):
+    def test_validate_then_convert(self, client, mocked_twitter_pool):
         """Test validation then conversion doesn't cause event loop issues."""
-        from contextlib import asynccontextmanager
-
         # Validate first
         r1 = client.post("/api/cookies/validate", json={"cookies": VALID_COOKIES})
         assert r1.status_code == 200
 
-        mock_tweet_data = {
-            "author": "testuser",
-            "display_name": "Test User",
-            "content": "Test tweet content",
-            "timestamp": None,
-            "quoted_tweets": [],
-        }
-
-        mock_page = AsyncMock()
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        mock_pool = MagicMock()
-
-        @asynccontextmanager
-        async def mock_get_context(cookies=None):
-            yield mock_context
-
-        mock_pool.get_context = mock_get_context
+        r2 = client.post(
+            "/api/convert",
+            json={"links": ["https://x.com/user/status/123"], "cookies": VALID_COOKIES},
+        )
+        data = r2.get_json()
+        error_msg = data.get("error", "")
+        assert "event loop" not in error_msg.lower()
+        assert "Lock object" not in error_msg
 
-        with patch(
-            "twitter_articlenator.sources.twitter_playwright.get_browser_pool",
-            return_value=mock_pool,
-        ):
-            with patch(
-                "twitter_articlenator.sources.twitter_playwright.TwitterPlaywrightSource._extract_tweet_data",
-                new_callable=AsyncMock,
-                return_value=mock_tweet_data,
-            ):
-                r2 = client.post(
-                    "/api/convert",
-                    json={"links": ["https://x.com/user/status/123"], "cookies": VALID_COOKIES},
-                )
-                data = json.loads(r2.data)
-                error_msg = data.get("error", "")
-                assert "event loop" not in error_msg.lower()
-                assert "Lock object" not in error_msg
-
-    def test_multiple_conversions(self, client):
+    def test_multiple_conversions(self, client, mocked_twitter_pool):
         """Test multiple conversions don't cause event loop issues."""
-        from contextlib import asynccontextmanager
-
-        mock_tweet_data = {
-            "author": "testuser",
-            "display_name": "Test User",
-            "content": "Test tweet content",
-            "timestamp": None,
-            "quoted_tweets": [],
-        }
-
-        mock_page = AsyncMock()
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        mock_pool = MagicMock()
-
-        @asynccontextmanager
-        async def mock_get_context(cookies=None):
-            yield mock_context
-
-        mock_pool.get_context = mock_get_context
+        # First conversion
+        r1 = client.post(
+            "/api/convert",
+            json={"links": ["https://x.com/user/status/123"], "cookies": VALID_COOKIES},
+        )
+        data1 = r1.get_json()
+        assert "Lock object" not in data1.get("error", "")
 
-        with patch(
-            "twitter_articlenator.sources.twitter_playwright.get_browser_pool",
-            return_value=mock_pool,
-        ):
-            with patch(
-                "twitter_articlenator.sources.twitter_playwright.TwitterPlaywrightSource._extract_tweet_data",
-                new_callable=AsyncMock,
-                return_value=mock_tweet_data,
-            ):
-                # First conversion
-                r1 = client.post(
-                    "/api/convert",
-                    json={"links": ["https://x.com/user/status/123"], "cookies": VALID_COOKIES},
-                )
-                data1 = json.loads(r1.data)
-                assert "Lock object" not in data1.get("error", "")
-
-                # Second conversion
-                r2 = client.post(
-                    "/api/convert",
-                    json={"links": ["https://x.com/user/status/456"], "cookies": VALID_COOKIES},
-                )
-                data2 = json.loads(r2.data)
-                assert "Lock object" not in data2.get("error", "")
+        # Second conversion
+        r2 = client.post(
+            "/api/convert",
+            json={"links": ["https://x.com/user/status/456"], "cookies": VALID_COOKIES},
+        )
+        data2 = r2.get_json()
+        assert "Lock object" not in data2.get("error", "")
 
 
 class TestCookieValidation:
@@ -124,7 +103,7 @@ class TestCookieValidation:
         response = client.post("/api/cookies/validate", json={"cookies": VALID_COOKIES})
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["valid"]
         assert data["status"] == "valid"
 
@@ -136,7 +115,7 @@ class TestCookieValidation:
         )
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert not data["valid"]
         assert data["status"] == "invalid"
 
@@ -148,7 +127,7 @@ class TestCookieValidation:
         )
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert not data["valid"]
         assert data["status"] == "invalid"
 
@@ -157,7 +136,7 @@ class TestCookieValidation:
         response = client.post("/api/cookies/validate", json={})
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert not data["valid"]
         assert data["status"] == "not_configured"
 
@@ -166,5 +145,5 @@ class TestCookieValidation:
         response = client.post("/api/cookies/validate", json={"cookies": ""})
         assert response.status_code == 200
 
-        data = json.loads(response.data)
+        data = response.get_json()
         assert not data["valid"]
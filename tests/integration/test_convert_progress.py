@@ -1,6 +1,5 @@
 """Integration tests for conversion progress tracking and reporting."""
 
-import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -14,10 +13,6 @@ def app(tmp_path, monkeypatch):
     monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "output"))
     monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
 
-    import twitter_articlenator.config as config_module
-
-    config_module._config_instance = None
-
     from twitter_articlenator.app import create_app
 
     app = create_app(test_config={"TESTING": True})
@@ -57,7 +52,7 @@ class TestConvertResponseReport:
                 json={"links": ["https://example.com/article"], "cookies": VALID_COOKIES},
             )
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Response should include articles list with details
         assert "articles" in data
@@ -79,7 +74,7 @@ class TestConvertResponseReport:
                 json={"links": ["https://x.com/user/status/123"], "cookies": VALID_COOKIES},
             )
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Response should include error details
         assert "error" in data or "errors" in data
@@ -121,7 +116,7 @@ class TestConvertResponseReport:
                 json={"links": ["https://example.com/success", "https://example.com/fail"], "cookies": VALID_COOKIES},
             )
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Should have partial success
         assert data.get("success") is True
@@ -154,7 +149,7 @@ class TestConvertResponseReport:
                 json={"links": ["https://example.com/1", "https://example.com/2"], "cookies": VALID_COOKIES},
             )
 
-        data = json.loads(response.data)
+        data = response.get_json()
 
         # Should have summary
         assert "summary" in data
@@ -255,7 +250,7 @@ class TestProgressPolling:
 
         # Should return job ID (or fall back to direct processing)
         if response.status_code == 202:  # Accepted for async processing
-            data = json.loads(response.data)
+            data = response.get_json()
             assert "job_id" in data
         # If not implemented, that's OK - test documents expected behavior
 
@@ -268,6 +263,6 @@ class TestProgressPolling:
         assert response.status_code in [200, 404]
 
         if response.status_code == 200:
-            data = json.loads(response.data)
+            data = response.get_json()
             assert "status" in data  # pending, processing, complete, failed
             assert "progress" in data  # { current: 1, total: 5, current_url: "..." }
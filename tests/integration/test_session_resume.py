@@ -15,10 +15,6 @@ def app(tmp_path, monkeypatch):
     monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "output"))
     monkeypatch.setenv("TWITTER_ARTICLENATOR_JSON_LOGGING", "false")
 
-    import twitter_articlenator.config as config_module
-
-    config_module._config_instance = None
-
     from twitter_articlenator.app import create_app
 
     app = create_app(test_config={"TESTING": True})
@@ -82,7 +78,7 @@ class TestListSessions:
         """No sessions returns empty list."""
         response = client.get("/api/sessions")
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["sessions"] == []
 
     def test_returns_sessions_with_meta(self, client, tmp_path):
@@ -91,7 +87,7 @@ class TestListSessions:
         _create_session_with_articles(tmp_path, "session-abc", urls, num_saved=1)
 
         response = client.get("/api/sessions")
-        data = json.loads(response.data)
+        data = response.get_json()
 
         assert len(data["sessions"]) == 1
         session = data["sessions"][0]
@@ -110,7 +106,7 @@ class TestListSessions:
         )
 
         response = client.get("/api/sessions")
-        data = json.loads(response.data)
+        data = response.get_json()
         assert len(data["sessions"]) == 2
 
 
@@ -124,7 +120,7 @@ class TestGetSession:
 
         response = client.get("/api/sessions/session-abc")
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["id"] == "session-abc"
         assert data["total"] == 2
         assert data["saved"] == 1
@@ -154,7 +150,7 @@ class TestSessionPdf:
             response = client.post("/api/sessions/session-pdf/pdf")
 
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["success"] is True
         assert "filename" in data
         mock_pdf.assert_called_once()
@@ -174,7 +170,7 @@ class TestSessionPdf:
 
         response = client.post("/api/sessions/empty-session/pdf")
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "error" in data
 
 
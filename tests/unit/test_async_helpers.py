@@ -46,6 +46,25 @@ class TestAsyncRunner:
         # Should be the same loop instance
         assert loop1 is loop2
 
+    def test_async_runner_uses_uvloop_when_available(self):
+        """Test AsyncRunner builds its loop with uvloop if it is installed."""
+        from unittest.mock import MagicMock, patch
+
+        from twitter_articlenator import app as app_module
+
+        mock_uvloop = MagicMock()
+        mock_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+
+        runner = app_module.AsyncRunner()
+
+        async def simple():
+            return "hello"
+
+        with patch.object(app_module, "uvloop", mock_uvloop):
+            assert runner.run(simple()) == "hello"
+
+        mock_uvloop.new_event_loop.assert_called_once()
+
     def test_async_runner_thread_safety(self):
         """Test AsyncRunner is thread-safe with concurrent calls."""
         from twitter_articlenator.app import AsyncRunner
@@ -139,6 +158,25 @@ class TestRunAsync:
         assert len(loops) == 2
         # Loops might be different objects or same recycled - what matters is no errors
 
+    def test_run_async_carries_app_config(self, monkeypatch, tmp_path):
+        """Test coroutines see the calling app's config on the loop thread."""
+        from flask import Flask
+
+        from twitter_articlenator.app import run_async
+        from twitter_articlenator.config import get_config, init_app
+
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "first"))
+        first_app = Flask(__name__)
+        init_app(first_app)
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "second"))
+        init_app(Flask(__name__))
+
+        async def output_dir():
+            return get_config().output_dir
+
+        with first_app.app_context():
+            assert run_async(output_dir()) == tmp_path / "first"
+
 
 class TestTwitterPlaywrightSourceInit:
     """Tests for TwitterPlaywrightSource initialization."""
@@ -21,6 +21,7 @@ class TestBrowserPoolInit:
 
         pool = BrowserPool(max_browsers=5)
         assert pool._max_browsers == 5
+        assert pool.max_browsers == 5
 
     def test_browser_pool_starts_uninitialized(self):
         """Test BrowserPool starts without playwright initialized."""
@@ -75,6 +76,57 @@ class TestBrowserPoolAcquireRelease:
             assert browser is mock_browser
             assert pool._browser_count == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_respect_max_browsers(self):
+        """Test concurrent acquires never launch more than max_browsers."""
+        import asyncio
+
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+
+        async def slow_launch(**kwargs):
+            await asyncio.sleep(0.01)
+            return mock_browser
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(side_effect=slow_launch)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+
+            first = asyncio.create_task(pool.acquire())
+            second = asyncio.create_task(pool.acquire())
+            assert await first is mock_browser
+            assert not second.done()
+
+            await pool.release(mock_browser)
+            assert await second is mock_browser
+
+        assert mock_playwright.chromium.launch.await_count == 1
+        assert pool._browser_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_launch_frees_slot(self):
+        """Test a failed launch does not leak a browser slot."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+
+            with pytest.raises(RuntimeError):
+                await pool.acquire()
+
+        assert pool._browser_count == 0
+
     @pytest.mark.asyncio
     async def test_release_returns_browser_to_pool(self):
         """Test release returns browser to pool."""
@@ -140,8 +192,92 @@ class TestBrowserPoolGetContext:
             async with pool.get_context() as context:
                 assert context is mock_context
 
-            # Context should be closed after exiting
-            mock_context.close.assert_called_once()
+            # Context should be reset and kept warm after exiting
+            mock_context.clear_cookies.assert_awaited_once()
+            mock_context.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_context_reuses_warm_context(self):
+        """Test a second get_context reuses the context instead of creating one."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_context = AsyncMock()
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+
+            async with pool.get_context():
+                pass
+            async with pool.get_context() as context:
+                assert context is mock_context
+
+        mock_browser.new_context.assert_awaited_once()
+        mock_context.add_init_script.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_context_does_not_reuse_context_for_other_cookies(self):
+        """Test a warm context is closed, not reused, for a different cookie set."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        first_context = AsyncMock()
+        second_context = AsyncMock()
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(side_effect=[first_context, second_context])
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        first = [{"name": "auth_token", "value": "a", "domain": ".x.com", "path": "/"}]
+        second = [{"name": "auth_token", "value": "b", "domain": ".x.com", "path": "/"}]
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+
+            async with pool.get_context(cookies=first):
+                pass
+            async with pool.get_context(cookies=second) as context:
+                # Origin storage from the first account must not carry over
+                assert context is second_context
+
+        first_context.close.assert_awaited_once()
+        second_context.add_cookies.assert_awaited_once_with(second)
+        assert pool._idle_contexts == {mock_browser: (pool._cookie_key(second), second_context)}
+
+    @pytest.mark.asyncio
+    async def test_get_context_closes_context_on_error(self):
+        """Test a context that exits with an error is closed, not reused."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_context = AsyncMock()
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+
+            with pytest.raises(RuntimeError):
+                async with pool.get_context():
+                    raise RuntimeError("page crashed")
+
+        mock_context.close.assert_awaited_once()
+        assert not pool._idle_contexts
 
     @pytest.mark.asyncio
     async def test_get_context_adds_cookies(self):
@@ -172,6 +308,326 @@ class TestBrowserPoolGetContext:
 
             mock_context.add_cookies.assert_called_once_with(cookies)
 
+    @pytest.mark.asyncio
+    async def test_get_context_blocks_resources_when_requested(self):
+        """Test get_context routes requests only when block_resources is set."""
+        from twitter_articlenator.sources.browser_pool import (
+            BrowserPool,
+            _abort_blocked_resources,
+        )
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_context = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+
+        mock_playwright = AsyncMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+
+            async with pool.get_context():
+                pass
+            mock_context.route.assert_not_called()
+
+            async with pool.get_context(block_resources=True):
+                pass
+            mock_context.route.assert_called_once_with("**/*", _abort_blocked_resources)
+
+    @pytest.mark.asyncio
+    async def test_abort_blocked_resources(self):
+        """Test images and telemetry are aborted while app scripts continue."""
+        from twitter_articlenator.sources.browser_pool import _abort_blocked_resources
+
+        image_route = AsyncMock()
+        image_route.request.resource_type = "image"
+        await _abort_blocked_resources(image_route)
+        image_route.abort.assert_awaited_once()
+        image_route.continue_.assert_not_called()
+
+        script_route = AsyncMock()
+        script_route.request.resource_type = "script"
+        script_route.request.url = "https://abs.twimg.com/responsive-web/client-web/main.js"
+        await _abort_blocked_resources(script_route)
+        script_route.continue_.assert_awaited_once()
+        script_route.abort.assert_not_called()
+
+        tracker_route = AsyncMock()
+        tracker_route.request.resource_type = "script"
+        tracker_route.request.url = "https://www.googletagmanager.com/gtag/js"
+        await _abort_blocked_resources(tracker_route)
+        tracker_route.abort.assert_awaited_once()
+
+
+class TestBrowserPoolGetSharedContext:
+    """Tests for get_shared_context context manager."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_context(self):
+        """Test concurrent callers with the same cookies get one context."""
+        import asyncio
+
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=2)
+
+        mock_context = AsyncMock()
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        cookies = [{"name": "auth_token", "value": "abc", "domain": ".x.com", "path": "/"}]
+        seen = []
+
+        async def use():
+            async with pool.get_shared_context(cookies=cookies) as context:
+                seen.append(context)
+                await asyncio.sleep(0)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+            await asyncio.gather(use(), use(), use())
+
+        assert seen == [mock_context] * 3
+        mock_playwright.chromium.launch.assert_awaited_once()
+        mock_context.add_cookies.assert_awaited_once_with(cookies)
+        # Last caller out hands the context back to the pool warm
+        assert not pool._shared_contexts
+        assert pool._idle_contexts == {mock_browser: (pool._cookie_key(cookies), mock_context)}
+
+    @pytest.mark.asyncio
+    async def test_different_cookies_get_separate_contexts(self):
+        """Test callers with different cookies do not share a context."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=2)
+
+        contexts = [AsyncMock(), AsyncMock()]
+        browsers = [MagicMock(), MagicMock()]
+        for browser, context in zip(browsers, contexts):
+            browser.is_connected.return_value = True
+            browser.new_context = AsyncMock(return_value=context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(side_effect=browsers)
+
+        first = [{"name": "auth_token", "value": "a", "domain": ".x.com", "path": "/"}]
+        second = [{"name": "auth_token", "value": "b", "domain": ".x.com", "path": "/"}]
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+            async with pool.get_shared_context(cookies=first) as context_a:
+                async with pool.get_shared_context(cookies=second) as context_b:
+                    assert context_a is not context_b
+                    assert len(pool._shared_contexts) == 2
+
+    @pytest.mark.asyncio
+    async def test_waiting_opener_does_not_block_joining_callers(self):
+        """Test a caller waiting for a browser does not stall other cookie sets."""
+        import asyncio
+
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_context = AsyncMock()
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        first = [{"name": "auth_token", "value": "a", "domain": ".x.com", "path": "/"}]
+        second = [{"name": "auth_token", "value": "b", "domain": ".x.com", "path": "/"}]
+
+        async def use(cookies):
+            async with pool.get_shared_context(cookies=cookies) as context:
+                return context
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+            async with pool.get_shared_context(cookies=first) as context_a:
+                # The only browser is taken, so this caller waits in acquire
+                waiting = asyncio.create_task(use(second))
+                await asyncio.sleep(0)
+                assert not waiting.done()
+
+                assert await asyncio.wait_for(use(first), timeout=1) is context_a
+
+            assert await asyncio.wait_for(waiting, timeout=1) is mock_context
+
+    @pytest.mark.asyncio
+    async def test_blocking_contexts_are_not_shared_with_plain_ones(self):
+        """Test block_resources gets its own routed context per cookie set."""
+        from twitter_articlenator.sources.browser_pool import (
+            BrowserPool,
+            _abort_blocked_resources,
+        )
+
+        pool = BrowserPool(max_browsers=2)
+
+        contexts = [AsyncMock(), AsyncMock()]
+        browsers = [MagicMock(), MagicMock()]
+        for browser, context in zip(browsers, contexts):
+            browser.is_connected.return_value = True
+            browser.new_context = AsyncMock(return_value=context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(side_effect=browsers)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+            async with pool.get_shared_context() as plain:
+                async with pool.get_shared_context(block_resources=True) as blocking:
+                    assert plain is not blocking
+
+        plain.route.assert_not_called()
+        blocking.route.assert_called_once_with("**/*", _abort_blocked_resources)
+
+
+class TestParseCookieString:
+    """Tests for parse_cookie_string, shared by the x.com sources."""
+
+    def test_parses_pairs_onto_cookie_domain(self):
+        """Test each pair becomes a cookie on the x.com domain."""
+        from twitter_articlenator.sources.browser_pool import COOKIE_DOMAIN, parse_cookie_string
+
+        cookies = parse_cookie_string("auth_token=abc; ct0=xyz")
+
+        assert cookies == [
+            {"name": "auth_token", "value": "abc", "domain": COOKIE_DOMAIN, "path": "/"},
+            {"name": "ct0", "value": "xyz", "domain": COOKIE_DOMAIN, "path": "/"},
+        ]
+
+    def test_skips_fragments_without_name_or_value(self):
+        """Test trailing semicolons, bare names and empty values are dropped."""
+        from twitter_articlenator.sources.browser_pool import parse_cookie_string
+
+        cookies = parse_cookie_string("auth_token=abc; lang=; =orphan; ct0=xyz;")
+
+        assert [c["name"] for c in cookies] == ["auth_token", "ct0"]
+
+    def test_empty_input(self):
+        """Test None and empty strings give no cookies."""
+        from twitter_articlenator.sources.browser_pool import parse_cookie_string
+
+        assert parse_cookie_string(None) == []
+        assert parse_cookie_string("") == []
+
+
+class TestPagePool:
+    """Tests for PagePool."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_released_page(self):
+        """Test a cleanly released page is blanked and handed out again."""
+        from twitter_articlenator.sources.browser_pool import PagePool
+
+        mock_page = AsyncMock()
+        mock_page.is_closed = MagicMock(return_value=False)
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+
+        pages = PagePool(mock_context)
+
+        async with pages.acquire() as first:
+            pass
+        async with pages.acquire() as second:
+            assert second is first
+
+        mock_context.new_page.assert_awaited_once()
+        mock_page.goto.assert_awaited_with("about:blank")
+        mock_page.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_closes_page_on_error(self):
+        """Test a page whose caller raised is closed rather than kept."""
+        from twitter_articlenator.sources.browser_pool import PagePool
+
+        mock_page = AsyncMock()
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+
+        pages = PagePool(mock_context)
+
+        with pytest.raises(RuntimeError):
+            async with pages.acquire():
+                raise RuntimeError("navigation failed")
+
+        mock_page.close.assert_awaited_once()
+        assert pages.free_pages == ()
+
+    @pytest.mark.asyncio
+    async def test_shared_page_survives_context_reset(self):
+        """Test pooled pages stay open when their context goes back to the pool."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        mock_page = AsyncMock()
+        mock_page.is_closed = MagicMock(return_value=False)
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        mock_context.pages = [mock_page]
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(return_value=mock_context)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+            async with pool.get_shared_page() as first:
+                pass
+            async with pool.get_shared_page() as second:
+                assert second is first
+
+        mock_context.new_page.assert_awaited_once()
+        mock_page.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shared_page_not_reused_for_other_cookies(self):
+        """Test pooled pages are dropped when the next caller has other cookies."""
+        from twitter_articlenator.sources.browser_pool import BrowserPool
+
+        pool = BrowserPool(max_browsers=1)
+
+        pages = [AsyncMock(), AsyncMock()]
+        contexts = [AsyncMock(), AsyncMock()]
+        for page, context in zip(pages, contexts):
+            page.is_closed = MagicMock(return_value=False)
+            context.new_page = AsyncMock(return_value=page)
+            context.pages = [page]
+        mock_browser = MagicMock()
+        mock_browser.is_connected.return_value = True
+        mock_browser.new_context = AsyncMock(side_effect=contexts)
+
+        mock_playwright = MagicMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+
+        first = [{"name": "auth_token", "value": "a", "domain": ".x.com", "path": "/"}]
+        second = [{"name": "auth_token", "value": "b", "domain": ".x.com", "path": "/"}]
+
+        with patch.object(pool, "_playwright", mock_playwright):
+            pool._initialized = True
+            async with pool.get_shared_page(cookies=first) as first_page:
+                pass
+            async with pool.get_shared_page(cookies=second) as second_page:
+                # The first account's tab (and its sessionStorage) is gone
+                assert second_page is not first_page
+                assert contexts[0] not in pool._page_pools
+
+        contexts[0].close.assert_awaited_once()
+        contexts[1].new_page.assert_awaited_once()
+
 
 class TestBrowserPoolClose:
     """Tests for pool close method."""
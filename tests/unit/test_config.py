@@ -100,6 +100,32 @@ class TestConfigEnvOverrides:
         config = Config()
         assert config.json_logging is False
 
+    def test_config_debug_screenshots_default_off(self, monkeypatch):
+        """Test debug_screenshots is off unless enabled by env var."""
+        from twitter_articlenator.config import Config
+
+        monkeypatch.delenv("TWITTER_ARTICLENATOR_DEBUG_SCREENSHOTS", raising=False)
+        assert Config().debug_screenshots is False
+
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_DEBUG_SCREENSHOTS", "1")
+        assert Config().debug_screenshots is True
+
+    def test_config_fetch_concurrency(self, monkeypatch):
+        """Test per-source fetch concurrency defaults and env overrides."""
+        from twitter_articlenator.config import Config
+
+        monkeypatch.delenv("TWITTER_ARTICLENATOR_TWITTER_FETCH_CONCURRENCY", raising=False)
+        monkeypatch.delenv("TWITTER_ARTICLENATOR_WEB_FETCH_CONCURRENCY", raising=False)
+        config = Config()
+        assert config.twitter_fetch_concurrency == 4
+        assert config.web_fetch_concurrency == 32
+
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_TWITTER_FETCH_CONCURRENCY", "2")
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_WEB_FETCH_CONCURRENCY", "8")
+        config = Config()
+        assert config.twitter_fetch_concurrency == 2
+        assert config.web_fetch_concurrency == 8
+
     def test_config_env_override_youtube_downloader(self, monkeypatch):
         """Test YouTube downloader settings can be overridden by env vars."""
         from twitter_articlenator.config import Config
@@ -164,6 +190,49 @@ class TestGetConfig:
         config2 = get_config()
         assert config1 is config2
 
+    def test_get_config_uses_app_config_inside_app_context(self, monkeypatch, tmp_path):
+        """Test each app keeps the config it was initialized with."""
+        from flask import Flask
+
+        import twitter_articlenator.config as config_module
+        from twitter_articlenator.config import get_config, init_app
+
+        monkeypatch.setattr(config_module, "_config_instance", None)
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "first"))
+        first_app = Flask(__name__)
+        first_config = init_app(first_app)
+
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "second"))
+        second_app = Flask(__name__)
+        second_config = init_app(second_app)
+
+        assert first_app.extensions["config"] is first_config
+        with first_app.app_context():
+            assert get_config().output_dir == tmp_path / "first"
+        with second_app.app_context():
+            assert get_config() is second_config
+        assert config_module._config_instance is None
+
+    def test_init_app_does_not_replace_fallback_config(self, monkeypatch, tmp_path):
+        """Test configuring an app leaves the no-app fallback config alone."""
+        from flask import Flask
+
+        import twitter_articlenator.config as config_module
+        from twitter_articlenator.config import get_config, init_app
+
+        monkeypatch.setattr(config_module, "_config_instance", None)
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "fallback"))
+        fallback = get_config()
+
+        monkeypatch.setenv("TWITTER_ARTICLENATOR_OUTPUT_DIR", str(tmp_path / "app"))
+        app = Flask(__name__)
+        app_config = init_app(app)
+
+        assert get_config() is fallback
+        assert get_config().output_dir == tmp_path / "fallback"
+        with app.app_context():
+            assert get_config() is app_config
+
 
 class TestCookieParsing:
     """Tests for cookie input parsing (DevTools format support)."""
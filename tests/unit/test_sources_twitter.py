@@ -1,13 +1,23 @@
 """Tests for sources/twitter_playwright.py - Twitter Playwright source implementation."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from twitter_articlenator.sources.base import Article
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_dir(tmp_path, monkeypatch):
+    """Keep verified-session records out of the real config directory."""
+    import twitter_articlenator.config as config_module
+
+    monkeypatch.setenv("TWITTER_ARTICLENATOR_CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(config_module, "_config_instance", None)
+    return tmp_path
+
+
 class TestTwitterPlaywrightSourceCanHandle:
     """Tests for TwitterPlaywrightSource.can_handle method."""
 
@@ -90,39 +100,48 @@ class TestTwitterPlaywrightSourceInit:
 
 
 class TestParseCookies:
-    """Tests for TwitterPlaywrightSource._parse_cookies method."""
+    """Tests for TwitterPlaywrightSource._cookies property."""
 
     def test_parse_cookies_empty(self):
         """Test parsing empty cookies."""
         from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
 
         source = TwitterPlaywrightSource()
-        assert source._parse_cookies() == []
+        assert source._cookies == []
 
     def test_parse_cookies_single(self):
         """Test parsing single cookie."""
         from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
 
         source = TwitterPlaywrightSource(cookies="auth_token=abc123")
-        cookies = source._parse_cookies()
-        # Should have 2 entries (one for x.com, one for twitter.com)
-        assert len(cookies) == 2
+        cookies = source._cookies
+        # One entry, set on x.com only
+        assert len(cookies) == 1
         assert cookies[0]["name"] == "auth_token"
         assert cookies[0]["value"] == "abc123"
         assert cookies[0]["domain"] == ".x.com"
-        assert cookies[1]["domain"] == ".twitter.com"
 
     def test_parse_cookies_multiple(self):
         """Test parsing multiple cookies."""
         from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
 
         source = TwitterPlaywrightSource(cookies="auth_token=abc; ct0=xyz")
-        cookies = source._parse_cookies()
-        # Should have 4 entries (2 for each domain)
-        assert len(cookies) == 4
-        names = [c["name"] for c in cookies]
-        assert names.count("auth_token") == 2
-        assert names.count("ct0") == 2
+        cookies = source._cookies
+        assert [c["name"] for c in cookies] == ["auth_token", "ct0"]
+
+    def test_parse_cookies_skips_empty_fragments(self):
+        """Test trailing semicolons and valueless cookies are dropped."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=abc; lang=; ct0=xyz;")
+        assert [c["name"] for c in source._cookies] == ["auth_token", "ct0"]
+
+    def test_cookies_parsed_once(self):
+        """Test the parsed cookies are cached on the instance."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=abc; ct0=xyz")
+        assert source._cookies is source._cookies
 
 
 class TestTruncateTitle:
@@ -209,6 +228,58 @@ class TestCreateArticle:
         assert "Reply content here" in article.content
         assert "Reply User" in article.content
 
+    def test_create_article_marks_op_replies(self):
+        """Test replies by the tweet author get the OP class and badge."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+        tweet_data = {
+            "author": "testuser",
+            "display_name": "Test User",
+            "content": "Main tweet",
+            "timestamp": None,
+            "images": [],
+            "replies": [
+                {"author": "testuser", "content": "More", "images": [], "is_op": True},
+                {"author": "other", "content": "Hi", "images": [], "is_op": False},
+            ],
+        }
+
+        article = source._create_article(tweet_data, "https://x.com/testuser/status/123")
+
+        assert article.content.count('class="tweet reply op-reply"') == 1
+        assert article.content.count('class="tweet reply"') == 1
+        assert article.content.count("op-badge") == 1
+
+    def test_create_article_escapes_scraped_text(self):
+        """Test tweet and reply text is HTML-escaped in the article body."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+        tweet_data = {
+            "author": "testuser",
+            "display_name": "<b>Test</b>",
+            "content": "1 < 2 & <script>x</script>",
+            "timestamp": None,
+            "images": [],
+            "replies": [
+                {
+                    "author": "replier",
+                    "display_name": "Reply User",
+                    "content": "<img src=x>",
+                    "images": [],
+                    "is_op": False,
+                }
+            ],
+        }
+
+        article = source._create_article(tweet_data, "https://x.com/testuser/status/123")
+
+        assert "1 &lt; 2 &amp; &lt;script&gt;x&lt;/script&gt;" in article.content
+        assert "&lt;b&gt;Test&lt;/b&gt;" in article.content
+        assert "&lt;img src=x&gt;" in article.content
+        assert "<script>" not in article.content
+
     def test_create_article_without_content(self):
         """Test creating article without content generates default title."""
         from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
@@ -227,6 +298,184 @@ class TestCreateArticle:
         assert article.title == "Tweet by @testuser"
 
 
+class TestLargeImageUrls:
+    """Tests for TwitterPlaywrightSource._large_image_urls method."""
+
+    def test_keeps_tweet_photos_at_large_size(self):
+        """Test non-Twitter and empty srcs are dropped and photos upgraded to large."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+        srcs = [
+            "https://pbs.twimg.com/media/abc?format=jpg&name=small",
+            "https://example.com/avatar.png",
+            "",
+        ]
+
+        assert source._large_image_urls(srcs) == [
+            "https://pbs.twimg.com/media/abc?format=jpg&name=large"
+        ]
+
+
+class TestExtractTweetData:
+    """Tests for TwitterPlaywrightSource._extract_tweet_data method."""
+
+    @pytest.mark.asyncio
+    async def test_extract_regular_tweet(self):
+        """Test a regular tweet's fields are read with one page script."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+
+        page = AsyncMock()
+        page.evaluate = AsyncMock(
+            return_value={
+                "isArticle": False,
+                "displayName": "Test User",
+                "datetime": "2025-12-29T10:00:00.000Z",
+                "title": None,
+                "pageTitle": "Test User on X",
+                "content": "Hello world",
+                "images": ["https://pbs.twimg.com/media/a?name=small"],
+            }
+        )
+
+        data = await source._extract_tweet_data(page, "testuser")
+
+        page.evaluate.assert_awaited_once_with(twitter_playwright.EXTRACT_TWEET_SCRIPT)
+        page.query_selector.assert_not_called()
+        assert data["content"] == "Hello world"
+        assert data["display_name"] == "Test User"
+        assert data["timestamp"] == datetime(2025, 12, 29, 10, 0, 0, tzinfo=timezone.utc)
+        assert data["images"] == ["https://pbs.twimg.com/media/a?name=large"]
+        assert data["is_article"] is False
+
+    @pytest.mark.asyncio
+    async def test_missing_name_and_time_fall_back(self):
+        """Test a missing name and timestamp fall back to defaults."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+
+        page = AsyncMock()
+        page.evaluate = AsyncMock(
+            return_value={
+                "isArticle": False,
+                "displayName": None,
+                "datetime": None,
+                "title": None,
+                "pageTitle": "",
+                "content": "",
+                "images": [],
+            }
+        )
+
+        data = await source._extract_tweet_data(page, "testuser")
+
+        assert data["display_name"] == "testuser"
+        assert data["timestamp"] is None
+
+
+class TestExtractReplies:
+    """Tests for TwitterPlaywrightSource._extract_replies method."""
+
+    @pytest.mark.asyncio
+    async def test_extract_replies_in_one_evaluate(self):
+        """Test replies are read with one page script and normalized in Python."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+        raw_replies = [
+            {
+                "href": "/TestUser",
+                "displayName": "Test User",
+                "content": "Thread continues",
+                "images": ["https://pbs.twimg.com/media/a?name=small"],
+            },
+            {"href": "/other/", "displayName": "", "content": "Nice", "images": []},
+            {"href": "/empty", "displayName": "Empty", "content": "", "images": []},
+        ]
+
+        async def evaluate(script, *args):
+            if script == twitter_playwright.EXTRACT_REPLIES_SCRIPT:
+                return raw_replies
+            return 2  # article count reported by each scroll
+
+        page = AsyncMock()
+        page.query_selector = AsyncMock(return_value=None)
+        page.evaluate = AsyncMock(side_effect=evaluate)
+
+        replies = await source._extract_replies(page, "testuser")
+
+        assert replies == [
+            {
+                "author": "TestUser",
+                "display_name": "Test User",
+                "content": "Thread continues",
+                "images": ["https://pbs.twimg.com/media/a?name=large"],
+                "is_op": True,
+            },
+            {
+                "author": "other",
+                "display_name": "other",
+                "content": "Nice",
+                "images": [],
+                "is_op": False,
+            },
+        ]
+        page.query_selector_all.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_extract_replies_stops_scrolling_when_thread_stalls(self):
+        """Test scrolling stops after consecutive scrolls load no new tweets."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource()
+
+        async def evaluate(script, *args):
+            if script == twitter_playwright.EXTRACT_REPLIES_SCRIPT:
+                return []
+            return 2
+
+        page = AsyncMock()
+        page.query_selector = AsyncMock(return_value=None)
+        page.evaluate = AsyncMock(side_effect=evaluate)
+        # First scroll loads more tweets, every later one times out
+        page.wait_for_function = AsyncMock(side_effect=[None, TimeoutError(), TimeoutError()])
+
+        assert await source._extract_replies(page, "testuser") == []
+
+        assert page.wait_for_function.await_count == 3
+        # Three scrolls plus the extraction script
+        assert page.evaluate.await_count == 4
+
+
+@pytest.fixture
+def fetch_page():
+    """Page handed out by a patched browser pool to TwitterPlaywrightSource.fetch."""
+    from contextlib import asynccontextmanager
+
+    from twitter_articlenator.sources import twitter_playwright
+
+    page = AsyncMock()
+    page.on = MagicMock()
+    page.remove_listener = MagicMock()
+    page.url = "https://x.com/testuser/status/123456789"
+    page.context = AsyncMock()
+
+    @asynccontextmanager
+    async def get_shared_page(cookies=None, block_resources=False):
+        yield page
+
+    pool = MagicMock()
+    pool.get_shared_page = get_shared_page
+    with patch.object(twitter_playwright, "get_browser_pool", return_value=pool):
+        yield page
+
+
 class TestFetch:
     """Tests for TwitterPlaywrightSource.fetch method."""
 
@@ -251,9 +500,8 @@ class TestFetch:
             await source.fetch("https://example.com/not-twitter")
 
     @pytest.mark.asyncio
-    async def test_fetch_with_mocked_browser_pool(self):
+    async def test_fetch_with_mocked_browser_pool(self, fetch_page):
         """Test fetch with mocked browser pool."""
-        from contextlib import asynccontextmanager
         from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
 
         source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
@@ -266,43 +514,175 @@ class TestFetch:
             "timestamp": datetime(2025, 12, 29, 10, 0, 0, tzinfo=timezone.utc),
             "quoted_tweets": [],
         }
+        fetch_page.title = AsyncMock(return_value="Test Page")
 
-        # Create mock page and context
-        mock_page = AsyncMock()
-        mock_page.goto = AsyncMock()
-        mock_page.wait_for_selector = AsyncMock()
-        mock_page.evaluate = AsyncMock()
-        mock_page.screenshot = AsyncMock()
-        mock_page.title = AsyncMock(return_value="Test Page")
-        mock_page.url = "https://x.com/testuser/status/123456789"
+        with patch.object(source, "_extract_tweet_data", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = mock_tweet_data
 
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
+            article = await source.fetch("https://x.com/testuser/status/123456789")
 
-        # Create a mock browser pool
-        mock_pool = AsyncMock()
+            assert isinstance(article, Article)
+            assert article.author == "testuser"
+            assert "Test tweet content" in article.content
 
-        @asynccontextmanager
-        async def mock_get_context(cookies=None):
-            yield mock_context
+    @pytest.mark.asyncio
+    async def test_fetch_backs_off_when_rate_limited(self, fetch_page):
+        """Test a 429 seen during a failed load delays the retry."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
 
-        mock_pool.get_context = mock_get_context
+        source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
 
-        with patch(
-            "twitter_articlenator.sources.twitter_playwright.get_browser_pool",
-            return_value=mock_pool,
+        handlers = []
+        fetch_page.on = MagicMock(side_effect=lambda event, handler: handlers.append(handler))
+        fetch_page.title = AsyncMock(return_value="Test Page")
+
+        calls = 0
+
+        async def wait_for_selector(selector, timeout=None):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                # First tweet load fails with a rate-limited API response
+                handlers[0](MagicMock(status=429))
+                raise TimeoutError("tweet not loaded")
+
+        fetch_page.wait_for_selector = wait_for_selector
+
+        mock_sleep = AsyncMock()
+        with (
+            patch.object(twitter_playwright.asyncio, "sleep", mock_sleep),
+            patch.object(source, "_extract_tweet_data", new_callable=AsyncMock) as mock_extract,
+        ):
+            mock_extract.return_value = {"author": "testuser", "content": "Hello"}
+            await source.fetch(fetch_page.url)
+
+        mock_sleep.assert_any_await(twitter_playwright.RATE_LIMIT_BASE_DELAY)
+
+    @pytest.mark.asyncio
+    async def test_fetch_skips_home_on_warm_context(self, fetch_page):
+        """Test a context that already loaded the home feed goes straight to the tweet."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
+
+        with patch.object(source, "_extract_tweet_data", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = {"author": "testuser", "content": "Hello"}
+            await source.fetch(fetch_page.url)
+            await source.fetch(fetch_page.url)
+
+        home_visits = [
+            c for c in fetch_page.goto.await_args_list if c.args[0] == "https://x.com/home"
+        ]
+        assert len(home_visits) == 1
+        # The second fetch still knows the session is authenticated
+        assert mock_extract.await_args_list[1].args[2] is True
+
+    @pytest.mark.asyncio
+    async def test_fetch_bootstraps_context_warmed_by_other_cookies(self, fetch_page):
+        """Test a reused context warmed by one session is not warm for another."""
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        first = TwitterPlaywrightSource(cookies="auth_token=first; ct0=first")
+        second = TwitterPlaywrightSource(cookies="auth_token=second; ct0=second")
+
+        # The pool hands both sessions the same page and context
+        tweet_data = {"author": "testuser", "content": "Hello"}
+        with (
+            patch.object(first, "_extract_tweet_data", new_callable=AsyncMock) as first_extract,
+            patch.object(second, "_extract_tweet_data", new_callable=AsyncMock) as second_extract,
         ):
-            # Mock _extract_tweet_data
-            with patch.object(
-                source, "_extract_tweet_data", new_callable=AsyncMock
-            ) as mock_extract:
-                mock_extract.return_value = mock_tweet_data
+            first_extract.return_value = tweet_data
+            second_extract.return_value = tweet_data
+            await first.fetch(fetch_page.url)
+            await second.fetch(fetch_page.url)
 
-                article = await source.fetch("https://x.com/testuser/status/123456789")
+        home_visits = [
+            c for c in fetch_page.goto.await_args_list if c.args[0] == "https://x.com/home"
+        ]
+        assert len(home_visits) == 2
 
-                assert isinstance(article, Article)
-                assert article.author == "testuser"
-                assert "Test tweet content" in article.content
+    @pytest.mark.asyncio
+    async def test_fetch_skips_home_for_recently_verified_session(self, fetch_page):
+        """Test a fresh context goes straight to the tweet for a verified session."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
+        url = fetch_page.url
+        twitter_playwright._record_session(source._session_key, True)
+
+        with patch.object(source, "_extract_tweet_data", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = {"author": "testuser", "content": "Hello"}
+            await source.fetch(url)
+
+        visited = [c.args[0] for c in fetch_page.goto.await_args_list]
+        assert visited == [url]
+        # Navigation returns on commit; the selector wait gates readiness
+        assert fetch_page.goto.await_args.kwargs["wait_until"] == "commit"
+        # The page title comes from the extraction script, not its own round-trip
+        fetch_page.title.assert_not_awaited()
+        assert mock_extract.await_args.args[2] is True
+
+    @pytest.mark.asyncio
+    async def test_fetch_loads_twitter_links_from_x(self, fetch_page):
+        """Test twitter.com links are navigated on x.com, where the cookies are set."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
+        twitter_playwright._record_session(source._session_key, True)
+
+        with patch.object(source, "_extract_tweet_data", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = {"author": "testuser", "content": "Hello"}
+            article = await source.fetch("http://www.twitter.com/testuser/status/123456789")
+
+        visited = [c.args[0] for c in fetch_page.goto.await_args_list]
+        assert visited == ["https://x.com/testuser/status/123456789"]
+        # The article still points at the link the user submitted
+        assert article.source_url == "https://www.twitter.com/testuser/status/123456789"
+
+    @pytest.mark.asyncio
+    async def test_fetch_loads_home_when_verified_session_fails(self, fetch_page):
+        """Test a failed direct load on a verified session bootstraps via home."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
+        url = fetch_page.url
+        twitter_playwright._record_session(source._session_key, True)
+
+        # Tweet selector times out once, then the home feed and tweet load
+        fetch_page.wait_for_selector = AsyncMock(side_effect=[TimeoutError(), None, None])
+
+        with patch.object(source, "_extract_tweet_data", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = {"author": "testuser", "content": "Hello"}
+            await source.fetch(url)
+
+        visited = [c.args[0] for c in fetch_page.goto.await_args_list]
+        assert visited == [url, "https://x.com/home", url]
+
+    @pytest.mark.asyncio
+    async def test_fetch_saves_debug_info_after_final_failure(self, fetch_page):
+        """Test the last failed load saves page HTML and re-raises the error."""
+        from twitter_articlenator.sources import twitter_playwright
+        from twitter_articlenator.sources.twitter_playwright import TwitterPlaywrightSource
+
+        source = TwitterPlaywrightSource(cookies="auth_token=test; ct0=test")
+
+        fetch_page.content = AsyncMock(return_value="<html>blocked</html>")
+        fetch_page.title = AsyncMock(return_value="X")
+        fetch_page.wait_for_selector = AsyncMock(side_effect=TimeoutError("not loaded"))
+
+        with patch.object(twitter_playwright, "Path") as mock_path, pytest.raises(TimeoutError):
+            await source.fetch(fetch_page.url)
+
+        mock_path.return_value.write_text.assert_called_once_with("<html>blocked</html>")
+        fetch_page.screenshot.assert_awaited_with(path="/tmp/twitter_debug.png", full_page=True)
+        # The pooled page is kept, but this fetch's listener is detached
+        fetch_page.remove_listener.assert_called_once_with(
+            "response", fetch_page.on.call_args.args[1]
+        )
 
 
 class TestSourceRegistry:
@@ -330,3 +710,30 @@ class TestSourceRegistry:
         )
         assert isinstance(source, TwitterPlaywrightSource)
         assert source._cookies_str == "auth_token=test; ct0=test"
+
+    def test_init_params_cached_per_class(self):
+        """Test constructor parameter lookup is computed once per source class."""
+        from twitter_articlenator.sources import TwitterPlaywrightSource, _get_init_params
+
+        params = _get_init_params(TwitterPlaywrightSource)
+        assert params == {"cookies"}
+        assert _get_init_params(TwitterPlaywrightSource) is params
+
+    def test_can_handle_without_instance(self):
+        """Test can_handle is usable on the class itself."""
+        from twitter_articlenator.sources import TwitterPlaywrightSource, WebArticleSource
+
+        assert TwitterPlaywrightSource.can_handle("https://x.com/user/status/123") is True
+        assert WebArticleSource.can_handle("https://x.com/user/status/123") is False
+
+    def test_get_source_only_constructs_matching_source(self):
+        """Test get_source_for_url doesn't instantiate sources that can't handle the URL."""
+        from twitter_articlenator.sources import WebArticleSource, get_source_for_url
+
+        with patch(
+            "twitter_articlenator.sources.twitter_playwright.TwitterPlaywrightSource.__init__",
+            side_effect=AssertionError("should not be constructed"),
+        ):
+            source = get_source_for_url("https://example.com/post")
+
+        assert isinstance(source, WebArticleSource)
@@ -54,6 +54,23 @@ class TestWebArticleSourceCanHandle:
         source = WebArticleSource()
         assert source.can_handle("not-a-url") is False
         assert source.can_handle("://missing-scheme") is False
+        assert source.can_handle("http://[::1") is False
+
+    def test_can_handle_is_cached(self):
+        """Test repeated checks for a URL parse it only once."""
+        from twitter_articlenator.sources.web import (
+            WebArticleSource,
+            _can_handle_url,
+            _parse_url,
+        )
+
+        _can_handle_url.cache_clear()
+        _parse_url.cache_clear()
+        url = "https://example.com/cached-article"
+
+        assert WebArticleSource.can_handle(url) is True
+        assert WebArticleSource.can_handle(url) is True
+        assert _parse_url.cache_info().misses == 1
 
     def test_rejects_url_without_host(self):
         """Test WebArticleSource rejects URLs without host."""
@@ -87,49 +104,49 @@ class TestExtractTitle:
     def test_extract_title_from_og_title(self):
         """Test extracting title from og:title meta tag."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><head><meta property="og:title" content="OG Title"></head></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        title = source._extract_title(soup, "https://example.com")
+        title = source._extract_title(tree, "https://example.com")
         assert title == "OG Title"
 
     def test_extract_title_from_h1(self):
         """Test extracting title from h1 element."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><h1>Article Title</h1></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        title = source._extract_title(soup, "https://example.com")
+        title = source._extract_title(tree, "https://example.com")
         assert title == "Article Title"
 
     def test_extract_title_from_title_tag(self):
         """Test extracting title from <title> tag."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><head><title>Page Title</title></head></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        title = source._extract_title(soup, "https://example.com")
+        title = source._extract_title(tree, "https://example.com")
         assert title == "Page Title"
 
     def test_extract_title_fallback_to_domain(self):
         """Test fallback to domain when no title found."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><p>No title here</p></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        title = source._extract_title(soup, "https://example.com/article")
+        title = source._extract_title(tree, "https://example.com/article")
         assert title == "example.com"
 
 
@@ -139,49 +156,49 @@ class TestExtractAuthor:
     def test_extract_author_from_meta_tag(self):
         """Test extracting author from meta tag."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><head><meta name="author" content="John Doe"></head></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        author = source._extract_author(soup, "https://example.com")
+        author = source._extract_author(tree, "https://example.com")
         assert author == "John Doe"
 
     def test_extract_author_from_byline_class(self):
         """Test extracting author from .byline element."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><body><span class="byline">By Jane Smith</span></body></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        author = source._extract_author(soup, "https://example.com")
+        author = source._extract_author(tree, "https://example.com")
         assert author == "Jane Smith"
 
     def test_extract_author_removes_by_prefix(self):
         """Test that 'by' prefix is removed from author."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><body><span class="author">by John Doe</span></body></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        author = source._extract_author(soup, "https://example.com")
+        author = source._extract_author(tree, "https://example.com")
         assert author == "John Doe"
 
     def test_extract_author_fallback_to_domain(self):
         """Test fallback to domain when no author found."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><p>No author here</p></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        author = source._extract_author(soup, "https://blog.example.com/post")
+        author = source._extract_author(tree, "https://blog.example.com/post")
         assert author == "blog.example.com"
 
 
@@ -191,13 +208,13 @@ class TestExtractDate:
     def test_extract_date_from_meta_tag(self):
         """Test extracting date from meta tag."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><head><meta property="article:published_time" content="2025-12-29T10:30:00Z"></head></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        date = source._extract_date(soup)
+        date = source._extract_date(tree)
         assert date is not None
         assert date.year == 2025
         assert date.month == 12
@@ -206,13 +223,13 @@ class TestExtractDate:
     def test_extract_date_from_time_element(self):
         """Test extracting date from <time> element."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><body><time datetime="2025-01-15">January 15, 2025</time></body></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        date = source._extract_date(soup)
+        date = source._extract_date(tree)
         assert date is not None
         assert date.year == 2025
         assert date.month == 1
@@ -246,6 +263,27 @@ class TestExtractDate:
         assert date is not None
         assert date.year == 2025
 
+    def test_parse_date_iso_with_offset_and_fraction(self):
+        """Test parsing ISO dates with fractional seconds and a UTC offset."""
+        from datetime import timedelta
+
+        from twitter_articlenator.sources.web import WebArticleSource
+
+        source = WebArticleSource()
+        date = source._parse_date("2025-12-29T10:30:00.123+02:00")
+        assert date is not None
+        assert date.hour == 10
+        assert date.utcoffset() == timedelta(hours=2)
+
+    def test_parse_date_day_first_format(self):
+        """Test parsing a day-first date that starts with a digit but is not ISO."""
+        from twitter_articlenator.sources.web import WebArticleSource
+
+        source = WebArticleSource()
+        date = source._parse_date("29 December 2025")
+        assert date is not None
+        assert (date.year, date.month, date.day) == (2025, 12, 29)
+
     def test_parse_date_empty_string(self):
         """Test parsing empty string returns None."""
         from twitter_articlenator.sources.web import WebArticleSource
@@ -267,81 +305,109 @@ class TestExtractContent:
     def test_extract_content_from_article(self):
         """Test extracting content from <article> element."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><article><p>Article content here.</p></article></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        content = source._extract_content(soup)
+        content = source._extract_content(tree)
         assert "Article content here" in content
 
     def test_extract_content_from_main(self):
         """Test extracting content from <main> element."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><main><p>Main content here.</p></main></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        content = source._extract_content(soup)
+        content = source._extract_content(tree)
         assert "Main content here" in content
 
     def test_extract_content_removes_scripts(self):
         """Test that scripts are removed from content."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = '<html><body><article><p>Content</p><script>alert("bad")</script></article></body></html>'
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        content = source._extract_content(soup)
+        content = source._extract_content(tree)
         assert "alert" not in content
         assert "script" not in content.lower()
 
     def test_extract_content_removes_nav(self):
         """Test that navigation is removed from content."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><nav>Menu</nav><article><p>Article content.</p></article></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        content = source._extract_content(soup)
+        content = source._extract_content(tree)
         assert "Menu" not in content
 
     def test_extract_content_fallback_to_body(self):
         """Test fallback to body when no article found."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
         html = "<html><body><p>Body content that is long enough to be considered valid content for an article.</p></body></html>"
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        content = source._extract_content(soup)
+        content = source._extract_content(tree)
         assert "Body content" in content
 
+    def test_extract_content_skips_candidates_with_little_text(self):
+        """Test a selector match with markup but almost no text is passed over."""
+        from twitter_articlenator.sources.web import WebArticleSource
+        from selectolax.lexbor import LexborHTMLParser
+
+        source = WebArticleSource()
+        image = '<img src="https://example.com/' + "a" * 200 + '.png">'
+        body_text = "Main content that is long enough to count. " * 5
+        html = (
+            f"<html><body><article>{image}</article><main><p>{body_text}</p></main></body></html>"
+        )
+        tree = LexborHTMLParser(html)
+
+        content = source._extract_content(tree)
+        assert content.startswith("<main>")
+
+    def test_extract_content_removes_empty_paragraphs(self):
+        """Test that empty paragraphs are removed."""
+        from twitter_articlenator.sources.web import WebArticleSource
+        from selectolax.lexbor import LexborHTMLParser
+
+        source = WebArticleSource()
+        html = "<html><body><article><p>Content</p><p></p><p>   </p></article></body></html>"
+        tree = LexborHTMLParser(html)
+
+        content = source._extract_content(tree)
+        assert content.count("<p>") == 1
+        assert "Content" in content
+
 
 class TestCleanContent:
     """Tests for _clean_content method."""
 
-    def test_clean_content_removes_empty_paragraphs(self):
-        """Test that empty paragraphs are removed."""
+    def test_clean_content_collapses_whitespace(self):
+        """Test that whitespace between and inside tags is collapsed."""
         from twitter_articlenator.sources.web import WebArticleSource
-        from bs4 import BeautifulSoup
+        from selectolax.lexbor import LexborHTMLParser
 
         source = WebArticleSource()
-        html = "<article><p>Content</p><p></p><p>   </p></article>"
-        soup = BeautifulSoup(html, "lxml")
-        element = soup.find("article")
+        html = "<article>\n  <p>Some\n   content</p>\n  <p>More</p>\n</article>"
+        tree = LexborHTMLParser(html)
+        element = tree.css_first("article")
 
         cleaned = source._clean_content(element)
-        # Should not have multiple <p> tags for empty content
-        assert cleaned.count("<p>") <= 1 or "Content" in cleaned
+        assert cleaned == "<article><p>Some content</p><p>More</p></article>"
 
 
 class TestFetch:
@@ -371,12 +437,9 @@ class TestFetch:
         """
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        with patch("twitter_articlenator.sources.web.get_http_client", return_value=mock_instance):
             article = await source.fetch("https://example.com/article")
 
             assert isinstance(article, Article)
@@ -393,12 +456,9 @@ class TestFetch:
 
         source = WebArticleSource()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
+        with patch("twitter_articlenator.sources.web.get_http_client", return_value=mock_instance):
             with pytest.raises(ValueError, match="Failed to fetch URL"):
                 await source.fetch("https://example.com/article")
 
@@ -415,17 +475,37 @@ class TestFetch:
         mock_response.text = "<html><body></body></html>"
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__ = AsyncMock(return_value=mock_instance)
-            mock_client.return_value.__aexit__ = AsyncMock(return_value=None)
-
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        with patch("twitter_articlenator.sources.web.get_http_client", return_value=mock_instance):
             # Should still return an article (uses body fallback)
             article = await source.fetch("https://example.com/empty")
             assert isinstance(article, Article)
             assert article.source_type == "web"
 
+    @pytest.mark.asyncio
+    async def test_fetch_reuses_shared_client(self):
+        """Test fetches share one HTTP client and pass the source timeout per request."""
+        from twitter_articlenator.sources import web
+        from twitter_articlenator.sources.web import WebArticleSource
+
+        mock_response = MagicMock()
+        mock_response.text = "<html><body><article>" + "x" * 200 + "</article></body></html>"
+
+        mock_instance = AsyncMock()
+        mock_instance.get = AsyncMock(return_value=mock_response)
+        mock_instance.is_closed = False
+
+        with (
+            patch.object(web, "_http_client", None),
+            patch("httpx.AsyncClient", return_value=mock_instance) as mock_client,
+        ):
+            await WebArticleSource(timeout=5.0).fetch("https://example.com/a")
+            await WebArticleSource(timeout=5.0).fetch("https://example.com/b")
+
+        mock_client.assert_called_once()
+        mock_instance.get.assert_awaited_with("https://example.com/b", timeout=5.0)
+
 
 class TestContentSelectors:
     """Tests for content selector constants."""
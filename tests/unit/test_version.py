@@ -0,0 +1,87 @@
+"""Tests for version.py - version and git commit lookup."""
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+class TestReadGitCommit:
+    """Tests for _read_git_commit function."""
+
+    def test_follows_loose_ref(self, tmp_path):
+        """Test a branch HEAD is resolved through its ref file."""
+        from twitter_articlenator.version import _read_git_commit
+
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text(COMMIT + "\n")
+
+        assert _read_git_commit(tmp_path / "src" / "version.py") == COMMIT
+
+    def test_follows_packed_ref(self, tmp_path):
+        """Test a ref missing from refs/ is found in packed-refs."""
+        from twitter_articlenator.version import _read_git_commit
+
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "packed-refs").write_text(
+            f"# pack-refs with: peeled fully-peeled sorted\n{COMMIT} refs/heads/main\n"
+        )
+
+        assert _read_git_commit(tmp_path / "version.py") == COMMIT
+
+    def test_follows_gitdir_file(self, tmp_path):
+        """Test a .git file (submodule style) is followed to the real git dir."""
+        from twitter_articlenator.version import _read_git_commit
+
+        git_dir = tmp_path / "modules" / "app"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text(COMMIT + "\n")
+        checkout = tmp_path / "app"
+        checkout.mkdir()
+        (checkout / ".git").write_text("gitdir: ../modules/app\n")
+
+        assert _read_git_commit(checkout / "version.py") == COMMIT
+
+    def test_linked_worktree_reads_refs_from_commondir(self, tmp_path):
+        """Test a worktree's branch ref is found in the main repo's packed-refs."""
+        from twitter_articlenator.version import _read_git_commit
+
+        main_git = tmp_path / "main" / ".git"
+        worktree_git = main_git / "worktrees" / "feature"
+        worktree_git.mkdir(parents=True)
+        (main_git / "HEAD").write_text("ref: refs/heads/main\n")
+        (main_git / "packed-refs").write_text(f"{COMMIT} refs/heads/feature\n")
+        (worktree_git / "HEAD").write_text("ref: refs/heads/feature\n")
+        (worktree_git / "commondir").write_text("../..\n")
+        checkout = tmp_path / "feature"
+        checkout.mkdir()
+        (checkout / ".git").write_text(f"gitdir: {worktree_git}\n")
+
+        assert _read_git_commit(checkout / "version.py") == COMMIT
+
+    def test_detached_head(self, tmp_path):
+        """Test a detached HEAD is returned as is."""
+        from twitter_articlenator.version import _read_git_commit
+
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text(COMMIT + "\n")
+
+        assert _read_git_commit(tmp_path / "version.py") == COMMIT
+
+
+class TestGetGitCommit:
+    """Tests for get_git_commit function."""
+
+    def test_prefers_environment_variable(self, monkeypatch):
+        """Test GIT_COMMIT (set in Docker builds) wins over the checkout."""
+        from twitter_articlenator.version import get_git_commit
+
+        monkeypatch.setenv("GIT_COMMIT", COMMIT)
+        get_git_commit.cache_clear()
+        try:
+            assert get_git_commit() == COMMIT[:8]
+        finally:
+            get_git_commit.cache_clear()